@@ -5,13 +5,14 @@ from brownie._gui import Gui
 from brownie.convert import Wei
 from brownie.network.contract import Contract  # NOQA: F401
 
-from .network import accounts, alert, history, rpc, web3
+from .network import accounts, alert, history, multicall, rpc, web3
 from .project import compile_source, run
 
 __all__ = [
     "accounts",  # accounts is an Accounts singleton
     "alert",
     "history",  # history is a TxHistory singleton
+    "multicall",
     "network",
     "rpc",  # rpc is a Rpc singleton
     "web3",  # web3 is a Web3 instance
@@ -1,7 +1,10 @@
 #!/usr/bin/python3
 
+import re
 from copy import deepcopy
-from typing import Any, Dict, ItemsView, KeysView, List, Tuple, TypeVar, Union
+from functools import lru_cache, partial
+from operator import itemgetter
+from typing import Any, Callable, Dict, ItemsView, Iterator, KeysView, List, Tuple, TypeVar, Union
 
 import eth_utils
 from hexbytes import HexBytes
@@ -23,6 +26,14 @@ UNITS = {
 
 WeiInputTypes = TypeVar("WeiInputTypes", str, float, int, None)
 
+CHECKSUM_CACHE_SIZE = 65536
+
+_address_regex = re.compile("0x[0-9a-fA-F]{40}")
+
+_formatters: Dict[Tuple, Callable] = {}
+_single_formatters: Dict[str, Callable] = {}
+_return_classes: Dict[Tuple, Any] = {}
+
 
 class Wei(int):
 
@@ -38,43 +49,53 @@ class Wei(int):
 
     # Known typing error: https://github.com/python/mypy/issues/4290
     def __new__(cls, value: Any) -> Any:  # type: ignore
-        return super().__new__(cls, _to_wei(value))  # type: ignore
+        if type(value) is not int:
+            value = _to_wei(value)
+        return super().__new__(cls, value)  # type: ignore
 
     def __hash__(self) -> int:
         return super().__hash__()
 
+    # comparisons and arithmetic skip _to_wei when the other value is already an int
+
     def __lt__(self, other: Any) -> bool:
-        return super().__lt__(_to_wei(other))
+        return int.__lt__(self, other if isinstance(other, int) else _to_wei(other))
 
     def __le__(self, other: Any) -> bool:
-        return super().__le__(_to_wei(other))
+        return int.__le__(self, other if isinstance(other, int) else _to_wei(other))
 
     def __eq__(self, other: Any) -> bool:
+        if isinstance(other, int):
+            return int.__eq__(self, other)
         try:
-            return super().__eq__(_to_wei(other))
+            return int.__eq__(self, _to_wei(other))
         except TypeError:
             return False
 
     def __ne__(self, other: Any) -> bool:
+        if isinstance(other, int):
+            return int.__ne__(self, other)
         try:
-            return super().__ne__(_to_wei(other))
+            return int.__ne__(self, _to_wei(other))
         except TypeError:
             return True
 
     def __ge__(self, other: Any) -> bool:
-        return super().__ge__(_to_wei(other))
+        return int.__ge__(self, other if isinstance(other, int) else _to_wei(other))
 
     def __gt__(self, other: Any) -> bool:
-        return super().__gt__(_to_wei(other))
+        return int.__gt__(self, other if isinstance(other, int) else _to_wei(other))
 
     def __add__(self, other: Any) -> "Wei":
-        return Wei(super().__add__(_to_wei(other)))
+        return Wei(int.__add__(self, other if isinstance(other, int) else _to_wei(other)))
 
     def __sub__(self, other: Any) -> "Wei":
-        return Wei(super().__sub__(_to_wei(other)))
+        return Wei(int.__sub__(self, other if isinstance(other, int) else _to_wei(other)))
 
 
 def _to_wei(value: WeiInputTypes) -> int:
+    if isinstance(value, int):
+        return int(value)
     original = value
     if value is None:
         return 0
@@ -104,6 +125,125 @@ def _return_int(original: Any, value: Any) -> int:
         raise TypeError(f"Could not convert {type(original)} '{original}' to wei.")
 
 
+class WeiArray:
+
+    """Array of wei values that allows vectorized arithmetic and comparison.
+
+    Values are held exactly, as Python integers within a NumPy object array.
+    Each item is converted in the same way as Wei, so unit strings such as
+    "1.5 ether" can be used for inputs and operands. Requires NumPy.
+
+    Operands may be a single value, which is applied to every item, or a
+    sequence of the same length. Comparisons return a NumPy array of bools."""
+
+    # numpy defers to the reflected methods of this class, e.g. ndarray + WeiArray
+    __array_ufunc__ = None
+
+    def __init__(self, values: Any) -> None:
+        np = _import_numpy("WeiArray")
+        if isinstance(values, WeiArray):
+            array = values._values.copy()
+        elif isinstance(values, np.ndarray) and values.dtype.kind in "iub":
+            array = values.astype(object).ravel()
+        else:
+            if isinstance(values, np.ndarray):
+                values = values.tolist()
+            array = np.empty(len(values), dtype=object)
+            array[:] = [_to_wei(i) for i in values]
+        self._values = array
+
+    @classmethod
+    def _from_array(cls, array: Any) -> "WeiArray":
+        # wraps an object array of ints without converting the values
+        self = cls.__new__(cls)
+        self._values = array
+        return self
+
+    def __repr__(self) -> str:
+        return f"WeiArray({self.tolist()})"
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self) -> Iterator:
+        return (Wei(i) for i in self._values)
+
+    def __getitem__(self, key: Any) -> Any:
+        value = self._values[key]
+        if isinstance(value, int):
+            return Wei(value)
+        return WeiArray._from_array(value)
+
+    def __array__(self, dtype: Any = None) -> Any:
+        return self._values.astype(dtype or object)
+
+    def __neg__(self) -> "WeiArray":
+        return WeiArray._from_array(-self._values)
+
+    def __add__(self, other: Any) -> "WeiArray":
+        return WeiArray._from_array(self._values + self._operand(other))
+
+    def __radd__(self, other: Any) -> "WeiArray":
+        return WeiArray._from_array(self._operand(other) + self._values)
+
+    def __sub__(self, other: Any) -> "WeiArray":
+        return WeiArray._from_array(self._values - self._operand(other))
+
+    def __rsub__(self, other: Any) -> "WeiArray":
+        return WeiArray._from_array(self._operand(other) - self._values)
+
+    def __eq__(self, other: Any) -> Any:  # type: ignore
+        return self._values == self._operand(other)
+
+    def __ne__(self, other: Any) -> Any:  # type: ignore
+        return self._values != self._operand(other)
+
+    def __lt__(self, other: Any) -> Any:
+        return self._values < self._operand(other)
+
+    def __le__(self, other: Any) -> Any:
+        return self._values <= self._operand(other)
+
+    def __gt__(self, other: Any) -> Any:
+        return self._values > self._operand(other)
+
+    def __ge__(self, other: Any) -> Any:
+        return self._values >= self._operand(other)
+
+    def _operand(self, other: Any) -> Any:
+        if isinstance(other, (str, bytes)) or not hasattr(other, "__len__"):
+            return _to_wei(other)
+        other = other._values if isinstance(other, WeiArray) else WeiArray(other)._values
+        if len(other) != len(self._values):
+            raise ValueError(f"Length mismatch: {len(self._values)} and {len(other)}")
+        return other
+
+    def sum(self) -> "Wei":
+        """Returns the sum of all values."""
+        return Wei(int(self._values.sum()))
+
+    def tolist(self) -> List[int]:
+        """Returns the values as a list of integers."""
+        return self._values.tolist()
+
+    def to_numpy(self, dtype: Any = object) -> Any:
+        """Returns the values as a NumPy array.
+
+        Args:
+            dtype: dtype of the returned array. With the default object dtype,
+                   values are held exactly as Python integers. Raises
+                   OverflowError if a value does not fit a fixed width dtype."""
+        return self._values.astype(dtype)
+
+
+def _import_numpy(feature: str) -> Any:
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(f"{feature} requires NumPy - install it with `pip install numpy`")
+    return numpy
+
+
 def to_uint(value: Any, type_: str = "uint256") -> "Wei":
     """Convert a value to an unsigned integer"""
     wei: "Wei" = Wei(value)
@@ -134,33 +274,60 @@ class EthAddress(str):
     """String subclass that raises TypeError when compared to a non-address."""
 
     def __new__(cls, value: Any) -> str:  # type: ignore
-        return super().__new__(cls, to_address(value))  # type: ignore
+        self = super().__new__(cls, to_address(value))  # type: ignore
+        self._lower = self.lower()
+        return self
 
     def __eq__(self, other: Any) -> bool:
-        return _address_compare(str(self), other)
+        return _address_compare(self._lower, other)  # type: ignore
 
     def __ne__(self, other: Any) -> bool:
-        return not _address_compare(str(self), other)
+        return not _address_compare(self._lower, other)  # type: ignore
 
 
 def _address_compare(a: Any, b: Any) -> bool:
+    # a must be a lowercase address
+    if isinstance(b, EthAddress):
+        return a == b._lower  # type: ignore
     b = str(b)
-    if not b.startswith("0x") or not eth_utils.is_hex(b) or len(b) != 42:
+    if not _address_regex.fullmatch(b):
         raise TypeError(f"Invalid type for comparison: '{b}' is not a valid address")
-    return a.lower() == b.lower()
+    return a == b.lower()
 
 
 def to_address(value: str) -> str:
     """Convert a value to an address"""
+    if isinstance(value, EthAddress):
+        return str(value)
     if isinstance(value, bytes):
         value = HexBytes(value).hex()
     value = eth_utils.add_0x_prefix(str(value))
     try:
-        return eth_utils.to_checksum_address(value)
+        return _to_checksum_address(value.lower())
     except ValueError:
         raise ValueError(f"'{value}' is not a valid ETH address.") from None
 
 
+@lru_cache(maxsize=CHECKSUM_CACHE_SIZE)
+def _to_checksum_address(address: str) -> str:
+    # keccak hashing is the most expensive part of address conversion, so
+    # results are cached according to the lowercase address
+    return eth_utils.to_checksum_address(address)
+
+
+def checksum_cache_stats() -> Dict:
+    """Returns a dict of statistics for the checksum address cache."""
+    info = _to_checksum_address.cache_info()
+    total = info.hits + info.misses
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "hit_rate": info.hits / total if total else 0.0,
+        "size": info.currsize,
+        "max_size": info.maxsize,
+    }
+
+
 class HexString(bytes):
 
     """Bytes subclass for hexstring comparisons. Raises TypeError if compared to
@@ -184,6 +351,8 @@ class HexString(bytes):
 
 
 def _hex_compare(a: Any, b: Any) -> bool:
+    if isinstance(b, HexString):
+        return a.lstrip("0x").lower() == b.hex().lstrip("0")
     b = str(b)
     if not b.startswith("0x") or not eth_utils.is_hex(b):
         raise TypeError(f"Invalid type for comparison: '{b}' is not a valid hex string")
@@ -250,14 +419,14 @@ def _format_input(abi: Dict, inputs: Union[List, Tuple]) -> "ReturnValue":
     if len(inputs) and not len(abi["inputs"]):
         raise TypeError(f"{abi['name']} requires no arguments")
     try:
-        return _format_abi(abi["inputs"], inputs)
+        return _get_formatter(abi["inputs"])(inputs)
     except Exception as e:
         raise type(e)(f"{abi['name']} {e}") from None
 
 
 def _format_output(abi: Dict, outputs: Tuple) -> "ReturnValue":
     # Format contract outputs based on ABI types
-    return _format_abi(abi["outputs"], outputs)
+    return _get_formatter(abi["outputs"])(outputs)
 
 
 def _format_event(event: Dict) -> Any:
@@ -265,77 +434,138 @@ def _format_event(event: Dict) -> Any:
     for e in [i for i in event["data"] if not i["decoded"]]:
         e["type"] = "bytes32"
         e["name"] += " (indexed)"
-    values = _format_abi(event["data"], [i["value"] for i in event["data"]])
+    values = _get_formatter(event["data"])([i["value"] for i in event["data"]])
     for i in range(len(event["data"])):
         event["data"][i]["value"] = values[i]
     return event
 
 
-def _format_abi(abi: Any, values: Any) -> "ReturnValue":
-    # Apply standard formatting to multiple values of differing types
+def _format_single(type_: str, value: Any) -> Any:
+    # Apply standard formatting to a single value
+    return _get_single_formatter(type_)(value)
+
+
+def _get_formatter(abi: List) -> Callable:
+    # returns a function that formats a sequence of values according to an ABI,
+    # the function is compiled once for each unique set of names and types
+    key = _get_abi_key(abi)
+    if key not in _formatters:
+        _formatters[key] = _compile_abi(abi)
+    return _formatters[key]
+
+
+def _get_abi_key(abi: List) -> Tuple:
+    return tuple(
+        (i["name"], i.get("type"), _get_abi_key(i["components"]) if "components" in i else None)
+        for i in abi
+    )
+
+
+def _compile_abi(abi: List) -> Callable:
     types = [i["type"] for i in abi]
-    values = list(values)
-    if len(values) != len(types):
-        raise TypeError(f"Expected {len(types)} arguments, got {len(values)}: {','.join(types)}")
-    for i, type_ in enumerate(types):
-        try:
-            if "]" in type_:
-                values[i] = _format_array(abi[i], values[i])
-            elif type_ == "tuple":
-                values[i] = _format_abi(abi[i]["components"], values[i])
-            else:
-                values[i] = _format_single(type_, values[i])
-        except Exception as e:
-            raise type(e)(f"argument #{i}: '{values[i]}' - {e}")
-    return ReturnValue(values, abi)
+    formatters = [_compile_param(i) for i in abi]
+    expected = len(types)
+    return_class = _get_return_class(abi) if abi else ReturnValue
+
+    def formatter(values: Any) -> "ReturnValue":
+        values = list(values)
+        if len(values) != expected:
+            raise TypeError(f"Expected {expected} arguments, got {len(values)}: {','.join(types)}")
+        for i, fn in enumerate(formatters):
+            try:
+                values[i] = fn(values[i])
+            except Exception as e:
+                raise type(e)(f"argument #{i}: '{values[i]}' - {e}")
+        return return_class(values)
+
+    return formatter
+
+
+def _compile_param(abi: Dict) -> Callable:
+    if "]" in abi["type"]:
+        return _compile_array(abi)
+    if abi["type"] == "tuple":
+        return _get_formatter(abi["components"])
+    return _get_single_formatter(abi["type"])
 
 
-def _format_array(abi: Any, values: Any) -> "ReturnValue":
-    # Apply standard formatting to multiple values of the same type (arrays)
-    base_type, length = abi["type"][:-1].rsplit("[", maxsplit=1)
-    if not isinstance(values, (list, tuple)):
-        raise TypeError(f"Expected sequence, got {type(values)}")
-    if length != "" and len(values) != int(length):
-        raise ValueError(f"Expected {abi['type']} but sequence has length of {len(values)}")
+def _compile_array(abi: Dict) -> Callable:
+    type_ = abi["type"]
+    base_type, length_str = type_[:-1].rsplit("[", maxsplit=1)
+    length = int(length_str) if length_str else None
+    return_class = ReturnValue
     if "]" in base_type:
-        abi = deepcopy(abi)
-        abi["type"] = base_type
-        return ReturnValue([_format_array(abi, i) for i in values])
-    if base_type == "tuple":
-        abi = abi["components"]
-        return ReturnValue([_format_abi(abi, i) for i in values], abi)
-    return ReturnValue([_format_single(base_type, i) for i in values])
+        fn = _compile_array(dict(abi, type=base_type))
+    elif base_type == "tuple":
+        # arrays of tuples use the tuple components as their ABI
+        return_class = _get_return_class(abi["components"])
+        fn = _get_formatter(abi["components"])
+    else:
+        fn = _get_single_formatter(base_type)
+
+    def formatter(values: Any) -> "ReturnValue":
+        if not isinstance(values, (list, tuple)):
+            raise TypeError(f"Expected sequence, got {type(values)}")
+        if length is not None and len(values) != length:
+            raise ValueError(f"Expected {type_} but sequence has length of {len(values)}")
+        return return_class([fn(i) for i in values])
+
+    return formatter
+
+
+def _get_single_formatter(type_: str) -> Callable:
+    if type_ not in _single_formatters:
+        try:
+            _single_formatters[type_] = _compile_single(type_)
+        except Exception as e:
+            # invalid types only raise when a value is formatted
+            return partial(_raise, e)
+    return _single_formatters[type_]
 
 
-def _format_single(type_: str, value: Any) -> Any:
-    # Apply standard formatting to a single value
+def _compile_single(type_: str) -> Callable:
     if "uint" in type_:
-        return to_uint(value, type_)
+        return _compile_int(type_, 0, 2 ** _check_int_size(type_))
     elif "int" in type_:
-        return to_int(value, type_)
+        size = _check_int_size(type_)
+        return _compile_int(type_, -(2 ** size) // 2, 2 ** size // 2)
     elif type_ == "bool":
-        return to_bool(value)
+        return to_bool
     elif type_ == "address":
-        return EthAddress(value)
+        return EthAddress
     elif "byte" in type_:
-        return HexString(value, type_)
+        to_bytes(0, type_)
+        return partial(HexString, type_=type_)
     elif "string" in type_:
-        return to_string(value)
+        return to_string
     raise TypeError(f"Unknown type: {type_}")
 
 
+def _compile_int(type_: str, min_: int, max_: int) -> Callable:
+    def formatter(value: Any) -> "Wei":
+        wei = _to_wei(value)
+        if wei < min_ or wei >= max_:
+            raise OverflowError(f"{value} is outside allowable range for {type_}")
+        return Wei(wei)
+
+    return formatter
+
+
+def _raise(exc: Exception, value: Any) -> None:
+    raise type(exc)(*exc.args)
+
+
 class ReturnValue(tuple):
     """Tuple subclass with dict-like functionality, used for iterable return values."""
 
+    __slots__ = ()
+    _abi: List = []
+    _names: Dict = {}
+
     def __new__(cls, values: Any, abi: Any = None) -> "ReturnValue":
-        self = super().__new__(cls, values)  # type: ignore
-        self._abi = abi or []  # type: ignore
-        self._dict = {}  # type: ignore
-        for c, i in enumerate(self._abi):  # type: ignore
-            if not i["name"]:
-                continue
-            self._dict[i["name"]] = values[c]  # type: ignore
-        return self
+        if abi:
+            cls = _get_return_class(abi)
+        return super().__new__(cls, values)  # type: ignore
 
     def __hash__(self) -> Any:
         return super().__hash__()
@@ -344,17 +574,18 @@ class ReturnValue(tuple):
         return _kwargtuple_compare(self, other)
 
     def __getitem__(self, key: Any) -> Any:
-        if type(key) is slice:
-            abi = deepcopy(self._abi)[key]  # type: ignore
-            result = super().__getitem__(key)
-            return ReturnValue(result, abi)
         if isinstance(key, int):
-            return super().__getitem__(key)
-        return self._dict[key]  # type: ignore
+            return tuple.__getitem__(self, key)
+        if type(key) is slice:
+            return ReturnValue(tuple.__getitem__(self, key), self._abi[key])
+        return tuple.__getitem__(self, self._names[key])
 
     def __contains__(self, value: Any) -> bool:
         return self.count(value) > 0
 
+    def __reduce__(self) -> Tuple:
+        return ReturnValue, (tuple(self), self._abi)
+
     def count(self, value: Any) -> int:
         """ReturnValue.count(value) -> integer -- return number of occurrences of value"""
         count = 0
@@ -368,7 +599,7 @@ class ReturnValue(tuple):
 
     def dict(self) -> Dict:
         """ReturnValue.dict() -> a dictionary of ReturnValue's named items"""
-        return self._dict  # type: ignore
+        return dict((k, tuple.__getitem__(self, v)) for k, v in self._names.items())
 
     def index(self, value: Any, start: int = 0, stop: Any = None) -> int:
         """ReturnValue.index(value, [start, [stop]]) -> integer -- return first index of value.
@@ -385,24 +616,43 @@ class ReturnValue(tuple):
 
     def items(self) -> ItemsView:
         """ReturnValue.items() -> a set-like object providing a view on ReturnValue's named items"""
-        return self._dict.items()  # type: ignore
+        return self.dict().items()
 
     def keys(self) -> KeysView:
         """ReturnValue.keys() -> a set-like object providing a view on ReturnValue's keys"""
-        return self._dict.keys()  # type: ignore
+        return self._names.keys()
+
+
+def _get_return_class(abi: List) -> Any:
+    # returns a ReturnValue subclass for the given ABI. Named items are resolved
+    # to tuple indexes when the class is created, and are also available as
+    # attributes where the name does not collide with an existing attribute
+    key = _get_abi_key(abi)
+    if key not in _return_classes:
+        abi = deepcopy(abi)
+        names = dict((i["name"], c) for c, i in enumerate(abi) if i["name"])
+        namespace: Dict = {"__slots__": (), "_abi": abi, "_names": names}
+        for name, idx in names.items():
+            if name.isidentifier() and not hasattr(ReturnValue, name):
+                namespace[name] = property(itemgetter(idx))
+        _return_classes[key] = type("ReturnValue", (ReturnValue,), namespace)
+    return _return_classes[key]
 
 
 def _kwargtuple_compare(a: Any, b: Any) -> Any:
-    if not isinstance(a, (tuple, list, ReturnValue)):
-        types_ = set([type(a), type(b)])
-        if types_.intersection([bool, type(None)]):
+    if not isinstance(a, (tuple, list)):
+        types_ = (type(a), type(b))
+        if bool in types_ or type(None) in types_:
             return a is b
-        if types_.intersection([dict, EthAddress, HexString]):
+        if dict in types_ or EthAddress in types_ or HexString in types_:
             return a == b
         return _convert_str(a) == _convert_str(b)
-    if not isinstance(b, (tuple, list, ReturnValue)) or len(b) != len(a):
+    if not isinstance(b, (tuple, list)) or len(b) != len(a):
         return False
-    return next((False for i in range(len(a)) if not _kwargtuple_compare(a[i], b[i])), True)
+    for x, y in zip(a, b):
+        if not _kwargtuple_compare(x, y):
+            return False
+    return True
 
 
 def _convert_str(value: Any) -> "Wei":
@@ -0,0 +1,37 @@
+pragma solidity ^0.5.0;
+pragma experimental ABIEncoderV2;
+
+/**
+    @title Multicall
+    @notice Aggregates the results of multiple read-only calls into a single call.
+            Deployed by Brownie on development networks.
+*/
+contract Multicall {
+
+    struct Call {
+        address target;
+        bytes callData;
+    }
+
+    struct Result {
+        bool success;
+        bytes returnData;
+    }
+
+    function tryAggregate(
+        bool requireSuccess,
+        Call[] memory calls
+    )
+        public
+        returns (Result[] memory returnData)
+    {
+        returnData = new Result[](calls.length);
+        for (uint256 i = 0; i < calls.length; i++) {
+            (bool success, bytes memory ret) = calls[i].target.call(calls[i].callData);
+            if (requireSuccess) {
+                require(success, "Multicall: call failed");
+            }
+            returnData[i] = Result(success, ret);
+        }
+    }
+}
@@ -1,14 +1,39 @@
 #!/usr/bin/python3
 
 from .account import Accounts
-from .main import connect, disconnect, gas_limit, gas_price, is_connected, show_active  # NOQA 401
+from .batch import batch  # NOQA 401
+from .cache import CallCache
+from .deployment import DeploymentPlan  # NOQA 401
+from .main import (  # NOQA 401
+    connect,
+    disconnect,
+    gas_limit,
+    gas_price,
+    gas_strategy,
+    is_connected,
+    show_active,
+)
+from .multicall import deploy_aggregator, multicall  # NOQA 401
 from .rpc import Rpc
 from .state import TxHistory
 from .web3 import web3
 
-__all__ = ["accounts", "history", "rpc", "web3"]
-__console_dir__ = ["connect", "disconnect", "show_active", "is_connected", "gas_limit", "gas_price"]
+__all__ = ["accounts", "call_cache", "history", "rpc", "web3"]
+__console_dir__ = [
+    "connect",
+    "disconnect",
+    "show_active",
+    "is_connected",
+    "gas_limit",
+    "gas_price",
+    "gas_strategy",
+    "batch",
+    "multicall",
+    "deploy_aggregator",
+    "DeploymentPlan",
+]
 
 accounts = Accounts()
 rpc = Rpc()
 history = TxHistory()
+call_cache = CallCache()
@@ -1,12 +1,19 @@
 #!/usr/bin/python3
 
+import asyncio
+import hashlib
+import hmac
 import json
 import os
 import threading
+import time
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from getpass import getpass
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
+import eth_account
 import eth_keys
 from eth_hash.auto import keccak
 from hexbytes import HexBytes
@@ -19,11 +26,22 @@ from brownie.network.state import _find_contract
 from brownie.network.transaction import TransactionReceipt
 from brownie.utils import color
 
+from . import aio, gas
+from .batch import Batch
 from .rpc import Rpc, _revert_register
 from .web3 import _resolve_address, web3
 
 rpc = Rpc()
 
+# BIP-44 derivation path used for ethereum accounts: m/44'/60'/0'/0
+_BIP44_PATH = [44 + 2 ** 31, 60 + 2 ** 31, 2 ** 31, 0]
+_SECP256K1_N = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+
+# number of accounts that must be derived before a process pool is used
+_POOL_THRESHOLD = 100
+
+_mnemonic_cache: Dict = {}
+
 
 class Accounts(metaclass=_Singleton):
 
@@ -69,6 +87,22 @@ class Accounts(metaclass=_Singleton):
     def __len__(self) -> int:
         return len(self._accounts)
 
+    def balances(self) -> List[Wei]:
+        """Returns the ether balance of every account in the container, in wei.
+        The balances are queried using batched JSON-RPC requests."""
+        with Batch() as batch:
+            for account in self._accounts:
+                batch.balance(account.address)
+        return batch.results
+
+    def nonces(self) -> List[int]:
+        """Returns the nonce of every account in the container. The nonces are
+        queried using batched JSON-RPC requests."""
+        with Batch() as batch:
+            for account in self._accounts:
+                batch.nonce(account.address)
+        return batch.results
+
     def add(self, priv_key: Union[int, bytes, str] = None) -> "LocalAccount":
         """Creates a new ``LocalAccount`` instance and appends it to the container.
 
@@ -91,6 +125,52 @@ class Accounts(metaclass=_Singleton):
         self._accounts.append(account)
         return account
 
+    def from_mnemonic(
+        self, mnemonic: str, count: int = 1, offset: int = 0
+    ) -> Union["LocalAccount", List["LocalAccount"]]:
+        """Generates one or more deterministic ``LocalAccount`` instances from a
+        seed phrase, and appends them to the container.
+
+        Keys are derived using the BIP-44 path m/44'/60'/0'/0/n. Large batches are
+        derived in a process pool, and derived keys are cached in memory so that
+        repeated calls with the same seed phrase are inexpensive.
+
+        Args:
+            mnemonic: Seed phrase to derive the accounts from.
+            count: Number of accounts to derive.
+            offset: Index of the first account to derive.
+
+        Returns:
+            Account instance if count is 1, otherwise a list of Account instances."""
+        indexes = range(offset, offset + count)
+        missing = [i for i in indexes if (mnemonic, i) not in _mnemonic_cache]
+        if missing:
+            if len(missing) < _POOL_THRESHOLD or (os.cpu_count() or 1) == 1:
+                derived = _derive_accounts(mnemonic, missing)
+            else:
+                processes = os.cpu_count() or 1
+                chunks = [missing[i::processes] for i in range(processes)]
+                with ProcessPoolExecutor(processes) as executor:
+                    results = executor.map(_derive_accounts, [mnemonic] * processes, chunks)
+                    derived = dict((k, v) for i in results for k, v in i.items())
+            for i, w3account in derived.items():
+                _mnemonic_cache[(mnemonic, i)] = w3account
+
+        existing = dict((i.address, i) for i in self._accounts)
+        accounts = []
+        for i in indexes:
+            w3account = _mnemonic_cache[(mnemonic, i)]
+            if w3account.address in existing:
+                accounts.append(existing[w3account.address])
+                continue
+            account = LocalAccount(w3account.address, w3account, w3account.key.hex())
+            existing[account.address] = account
+            self._accounts.append(account)
+            accounts.append(account)
+        if count == 1:
+            return accounts[0]
+        return accounts
+
     def load(self, filename: str = None) -> Union[List, "LocalAccount"]:
         """Loads a local account from a keystore file.
 
@@ -100,23 +180,66 @@ class Accounts(metaclass=_Singleton):
 
         Returns:
             Account instance."""
-        project_path = CONFIG["brownie_folder"].joinpath("data/accounts")
         if not filename:
+            project_path = CONFIG["brownie_folder"].joinpath("data/accounts")
             return [i.stem for i in project_path.glob("*.json")]
-        filename = str(filename)
-        if not filename.endswith(".json"):
-            filename += ".json"
-        json_file = Path(filename).expanduser()
-        if not json_file.exists():
-            json_file = project_path.joinpath(filename)
-            if not json_file.exists():
-                raise FileNotFoundError(f"Cannot find {json_file}")
+        json_file = _get_keystore_path(filename)
         with json_file.open() as fp:
             priv_key = web3.eth.account.decrypt(
                 json.load(fp), getpass("Enter the password for this account: ")
             )
         return self.add(priv_key)
 
+    def load_many(
+        self,
+        filenames: Sequence[str],
+        password: Union[str, Callable, None] = None,
+        processes: Optional[int] = None,
+        silent: bool = False,
+    ) -> List["LocalAccount"]:
+        """Loads multiple local accounts from keystore files.
+
+        Keystores are decrypted in parallel using a process pool. Decrypted
+        keys are returned to this process in memory and are never written to disk.
+
+        Args:
+            filenames: Sequence of keystore filenames.
+            password: Password used to decrypt every keystore, or a callable that
+                      is given the keystore path and returns the password for it.
+                      If none is given, the password is requested once.
+            processes: Maximum number of worker processes. Defaults to the
+                       number of CPUs.
+            silent: If True, do not print progress and timing information.
+
+        Returns:
+            List of Account instances, in the same order as filenames."""
+        paths = [_get_keystore_path(i) for i in filenames]
+        if password is None:
+            password = getpass("Enter the password for these accounts: ")
+        keys: List = [None] * len(paths)
+        start = time.time()
+        with ProcessPoolExecutor(processes) as executor:
+            futures = {}
+            for i, path in enumerate(paths):
+                with path.open() as fp:
+                    keystore = json.load(fp)
+                pwd = password(path) if callable(password) else password
+                futures[executor.submit(_decrypt_keystore, keystore, pwd)] = i
+            for count, future in enumerate(as_completed(futures), start=1):
+                i = futures[future]
+                keys[i], elapsed = future.result()
+                if not silent:
+                    print(
+                        f"  Decrypted {color['string']}{paths[i].stem}{color} "
+                        f"({count}/{len(paths)}) in {color['value']}{elapsed:.2f}s{color}"
+                    )
+        if not silent:
+            print(
+                f"Loaded {color['value']}{len(paths)}{color} accounts in "
+                f"{color['value']}{time.time() - start:.2f}s{color}"
+            )
+        return [self.add(i) for i in keys]
+
     def at(self, address: str) -> "LocalAccount":
         """Retrieves an Account instance from the address string. Raises
         ValueError if the account cannot be found.
@@ -190,13 +313,29 @@ class _PrivateKeyAccount(PublicKeyAccount):
 
     """Base class for Account and LocalAccount"""
 
+    def __init__(self, addr: str) -> None:
+        # held while the nonce is read and the transaction is broadcast
+        self._lock = threading.Lock()
+        self._async_lock: Optional[Tuple[asyncio.AbstractEventLoop, asyncio.Lock]] = None
+        super().__init__(addr)
+
+    def _get_async_lock(self) -> asyncio.Lock:
+        # asyncio locks are bound to the event loop they are created in
+        loop = asyncio.get_event_loop()
+        if self._async_lock is None or self._async_lock[0] is not loop:
+            self._async_lock = (loop, asyncio.Lock())
+        return self._async_lock[1]
+
+    def _pending_nonce(self) -> int:
+        return web3.eth.getTransactionCount(self.address, "pending")
+
     def _gas_limit(self, to: Union[str, "Accounts"], amount: Optional[int], data: str = "") -> int:
         if CONFIG["active_network"]["gas_limit"] not in (True, False, None):
             return Wei(CONFIG["active_network"]["gas_limit"])
         return self.estimate_gas(to, amount, data)
 
     def _gas_price(self) -> Wei:
-        return Wei(CONFIG["active_network"]["gas_price"] or web3.eth.gasPrice)
+        return Wei(CONFIG["active_network"]["gas_price"] or gas.get_strategy().get_gas_price())
 
     def _check_for_revert(self, tx: Dict) -> None:
         if not CONFIG["active_network"]["reverting_tx_gas_limit"]:
@@ -228,35 +367,45 @@ class _PrivateKeyAccount(PublicKeyAccount):
         Returns:
             * Contract instance if the transaction confirms
             * TransactionReceipt if the transaction is pending or reverts"""
-        evm = contract._build["compiler"]["evm_version"]
-        if rpc.is_active() and not rpc.evm_compatible(evm):
-            raise IncompatibleEVMVersion(
-                f"Local RPC using '{rpc.evm_version()}' but contract was compiled for '{evm}'"
-            )
+        _check_evm_version(contract)
         data = contract.deploy.encode_input(*args)
+        with self._lock:
+            txid, revert_data = self._send_deployment(
+                data, amount, gas_limit, gas_price, self._pending_nonce()
+            )
+        tx = TransactionReceipt(
+            txid, self, name=contract._name + ".constructor", revert_data=revert_data
+        )
+        add_thread = threading.Thread(target=contract._add_from_tx, args=(tx,), daemon=True)
+        add_thread.start()
+        if tx.status != 1:
+            return tx
+        add_thread.join()
+        return _find_contract(tx.contract_address)
+
+    def _send_deployment(
+        self,
+        data: str,
+        amount: Optional[int],
+        gas_limit: Optional[int],
+        gas_price: Optional[int],
+        nonce: int,
+    ) -> Tuple:
+        # broadcasts a contract deployment, returns (txid, revert data)
         try:
             txid = self._transact(  # type: ignore
                 {
                     "from": self.address,
                     "value": Wei(amount),
-                    "nonce": self.nonce,
+                    "nonce": nonce,
                     "gasPrice": Wei(gas_price) or self._gas_price(),
                     "gas": Wei(gas_limit) or self._gas_limit("", amount, data),
                     "data": HexBytes(data),
                 }
             )
-            revert_data = None
+            return txid, None
         except ValueError as e:
-            txid, revert_data = _raise_or_return_tx(e)
-        tx = TransactionReceipt(
-            txid, self, name=contract._name + ".constructor", revert_data=revert_data
-        )
-        add_thread = threading.Thread(target=contract._add_from_tx, args=(tx,), daemon=True)
-        add_thread.start()
-        if tx.status != 1:
-            return tx
-        add_thread.join()
-        return _find_contract(tx.contract_address)
+            return _raise_or_return_tx(e)
 
     def estimate_gas(
         self, to: Union[str, "Accounts"], amount: Optional[int], data: str = ""
@@ -301,23 +450,94 @@ class _PrivateKeyAccount(PublicKeyAccount):
 
         Returns:
             TransactionReceipt object"""
-        try:
-            txid = self._transact(  # type: ignore
-                {
-                    "from": self.address,
-                    "to": str(to),
-                    "value": Wei(amount),
-                    "nonce": self.nonce,
-                    "gasPrice": Wei(gas_price) if gas_price is not None else self._gas_price(),
-                    "gas": Wei(gas_limit) or self._gas_limit(to, amount, data),
-                    "data": HexBytes(data),
-                }
-            )
-            revert_data = None
-        except ValueError as e:
-            txid, revert_data = _raise_or_return_tx(e)
+        with self._lock:
+            try:
+                txid = self._transact(  # type: ignore
+                    {
+                        "from": self.address,
+                        "to": str(to),
+                        "value": Wei(amount),
+                        "nonce": self._pending_nonce(),
+                        "gasPrice": Wei(gas_price) if gas_price is not None else self._gas_price(),
+                        "gas": Wei(gas_limit) or self._gas_limit(to, amount, data),
+                        "data": HexBytes(data),
+                    }
+                )
+                revert_data = None
+            except ValueError as e:
+                txid, revert_data = _raise_or_return_tx(e)
         return TransactionReceipt(txid, self, revert_data=revert_data)
 
+    async def transfer_async(
+        self,
+        to: "Accounts",
+        amount: int,
+        gas_limit: float = None,
+        gas_price: float = None,
+        data: str = "",
+        silent: bool = False,
+    ) -> "TransactionReceipt":
+        """Transfers ether from this account without blocking the event loop.
+
+        Args:
+            to: Account instance or address string to transfer to.
+            amount: Amount of ether to send, in wei.
+
+        Kwargs:
+            gas_limit: Gas limit of the transaction.
+            gas_price: Gas price of the transaction.
+            data: Hexstring of data to include in transaction.
+            silent: Toggles console verbosity.
+
+        Returns:
+            Pending TransactionReceipt object. Await TransactionReceipt.wait()
+            for the transaction to confirm."""
+        loop = asyncio.get_event_loop()
+        if gas_price is None:
+            # gas strategies may query the node, so they are run in the executor
+            gas_price = await loop.run_in_executor(None, self._gas_price)
+        tx = {
+            "from": self.address,
+            "to": str(to),
+            "value": Wei(amount),
+            "gasPrice": Wei(gas_price),
+            "data": HexBytes(data),
+        }
+        if not CONFIG["active_network"]["reverting_tx_gas_limit"]:
+            try:
+                await aio.call(dict((k, v) for k, v in tx.items() if v))
+            except ValueError as e:
+                raise VirtualMachineError(e) from None
+        if gas_limit:
+            tx["gas"] = Wei(gas_limit)
+        elif CONFIG["active_network"]["gas_limit"] not in (True, False, None):
+            tx["gas"] = Wei(CONFIG["active_network"]["gas_limit"])
+        else:
+            try:
+                tx["gas"] = await aio.estimate_gas(dict((k, v) for k, v in tx.items() if v))
+            except ValueError:
+                if not CONFIG["active_network"]["reverting_tx_gas_limit"]:
+                    raise
+                tx["gas"] = CONFIG["active_network"]["reverting_tx_gas_limit"]
+        async with self._get_async_lock():
+            # the thread lock is also held, so that transactions sent from other
+            # threads cannot be given the same nonce. it is polled rather than
+            # acquired in the executor, so a cancelled coroutine never holds it
+            while not self._lock.acquire(blocking=False):
+                await asyncio.sleep(0.01)
+            try:
+                tx["nonce"] = await aio.get_transaction_count(self.address, "pending")
+                try:
+                    txid = await self._transact_async(tx)
+                    revert_data = None
+                except ValueError as e:
+                    txid, revert_data = _raise_or_return_tx(e)
+            finally:
+                self._lock.release()
+        return TransactionReceipt(
+            txid, self, silent=silent, revert_data=revert_data, blocking=False
+        )
+
 
 class Account(_PrivateKeyAccount):
 
@@ -331,6 +551,9 @@ class Account(_PrivateKeyAccount):
         self._check_for_revert(tx)
         return web3.eth.sendTransaction(tx)
 
+    async def _transact_async(self, tx: Dict) -> str:
+        return await aio.send_transaction(tx)
+
 
 class LocalAccount(_PrivateKeyAccount):
 
@@ -342,10 +565,15 @@ class LocalAccount(_PrivateKeyAccount):
         private_key: Account private key.
         public_key: Account public key."""
 
-    def __init__(self, address: str, account: Account, priv_key: Union[int, bytes, str]) -> None:
+    def __init__(
+        self,
+        address: str,
+        account: eth_account.signers.local.LocalAccount,
+        priv_key: Union[int, bytes, str],
+    ) -> None:
         self._acct = account
         self.private_key = priv_key
-        self.public_key = eth_keys.keys.PrivateKey(HexBytes(priv_key)).public_key
+        self.public_key = eth_keys.keys.PrivateKey(account.key).public_key
         super().__init__(address)
 
     def save(self, filename: str, overwrite: bool = False) -> str:
@@ -381,6 +609,74 @@ class LocalAccount(_PrivateKeyAccount):
         signed_tx = self._acct.sign_transaction(tx).rawTransaction  # type: ignore
         return web3.eth.sendRawTransaction(signed_tx)
 
+    async def _transact_async(self, tx: Dict) -> str:
+        signed_tx = self._acct.sign_transaction(tx).rawTransaction  # type: ignore
+        return await aio.send_raw_transaction(signed_tx)
+
+
+def _get_keystore_path(filename: str) -> Path:
+    project_path = CONFIG["brownie_folder"].joinpath("data/accounts")
+    filename = str(filename)
+    if not filename.endswith(".json"):
+        filename += ".json"
+    json_file = Path(filename).expanduser()
+    if not json_file.exists():
+        json_file = project_path.joinpath(filename)
+        if not json_file.exists():
+            raise FileNotFoundError(f"Cannot find {json_file}")
+    return json_file
+
+
+def _decrypt_keystore(keystore: Dict, password: str) -> Tuple[bytes, float]:
+    # called from a worker process by Accounts.load_many
+    start = time.time()
+    priv_key = eth_account.Account.decrypt(keystore, password)
+    return bytes(priv_key), time.time() - start
+
+
+def _derive_accounts(mnemonic: str, indexes: Sequence[int]) -> Dict:
+    # derives eth_account objects for each index, may be called from a worker process
+    seed = hashlib.pbkdf2_hmac(
+        "sha512", unicodedata.normalize("NFKD", mnemonic).encode(), b"mnemonic", 2048
+    )
+    digest = hmac.new(b"Bitcoin seed", seed, hashlib.sha512).digest()
+    key, chain_code = digest[:32], digest[32:]
+    for i in _BIP44_PATH:
+        key, chain_code = _derive_child(key, chain_code, i)
+    # the parent public key is the same for every child, so only compute it once
+    public_key = _compressed_public_key(key)
+    accounts = {}
+    for i in indexes:
+        child_key, _ = _derive_child(key, chain_code, i, public_key)
+        accounts[i] = eth_account.Account.from_key(child_key)
+    return accounts
+
+
+def _derive_child(
+    key: bytes, chain_code: bytes, index: int, public_key: Optional[bytes] = None
+) -> Tuple[bytes, bytes]:
+    # BIP-32 private parent key -> private child key
+    if index >= 2 ** 31:
+        data = b"\x00" + key
+    else:
+        data = public_key or _compressed_public_key(key)
+    digest = hmac.new(chain_code, data + index.to_bytes(4, "big"), hashlib.sha512).digest()
+    child = (int.from_bytes(digest[:32], "big") + int.from_bytes(key, "big")) % _SECP256K1_N
+    return child.to_bytes(32, "big"), digest[32:]
+
+
+def _compressed_public_key(key: bytes) -> bytes:
+    public_key = eth_keys.keys.PrivateKey(key).public_key.to_bytes()
+    return bytes([2 + (public_key[-1] & 1)]) + public_key[:32]
+
+
+def _check_evm_version(contract: Any) -> None:
+    evm = contract._build["compiler"]["evm_version"]
+    if rpc.is_active() and not rpc.evm_compatible(evm):
+        raise IncompatibleEVMVersion(
+            f"Local RPC using '{rpc.evm_version()}' but contract was compiled for '{evm}'"
+        )
+
 
 def _raise_or_return_tx(exc: ValueError) -> Any:
     try:
@@ -0,0 +1,182 @@
+#!/usr/bin/python3
+
+import asyncio
+import itertools
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+
+import websockets
+from hexbytes import HexBytes
+from web3 import HTTPProvider, WebsocketProvider
+from web3.middleware.pythonic import receipt_formatter, transaction_formatter
+
+from .rpc import Rpc
+from .web3 import web3
+
+rpc = Rpc()
+
+_transport: Optional[Tuple[Any, "AsyncTransport"]] = None
+
+
+class AsyncTransport(ABC):
+
+    """Base class for sending JSON-RPC requests from within an event loop."""
+
+    @abstractmethod
+    async def request(self, method: str, params: List) -> Any:
+        """Sends a JSON-RPC request and returns the result. Raises ValueError
+        if the node returns an error, in the same way as web3."""
+
+
+class WebsocketTransport(AsyncTransport):
+
+    """Sends requests over a single websocket connection. Any number of
+    requests may be in flight at once, responses are matched by their id."""
+
+    def __init__(self, uri: str) -> None:
+        self.uri = uri
+        self._ws: Any = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._count = itertools.count()
+
+    def __repr__(self) -> str:
+        return f"<WebsocketTransport object '{self.uri}'>"
+
+    async def request(self, method: str, params: List) -> Any:
+        ws = await self._connect()
+        request_id = next(self._count)
+        future = asyncio.get_event_loop().create_future()
+        self._pending[request_id] = future
+        payload = {"jsonrpc": "2.0", "method": method, "params": params, "id": request_id}
+        try:
+            await ws.send(json.dumps(payload))
+            response = await future
+        finally:
+            self._pending.pop(request_id, None)
+        return _get_result(response)
+
+    async def _connect(self) -> Any:
+        # the connection is bound to the event loop that created it
+        loop = asyncio.get_event_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._lock = asyncio.Lock()
+            self._ws = None
+        async with self._lock:  # type: ignore
+            if self._ws is None or self._ws.closed:
+                self._ws = await websockets.connect(self.uri, max_size=None)
+                loop.create_task(self._listen(self._ws))
+        return self._ws
+
+    async def _listen(self, ws: Any) -> None:
+        try:
+            while True:
+                response = json.loads(await ws.recv())
+                future = self._pending.get(response.get("id"))
+                if future is not None and not future.done():
+                    future.set_result(response)
+        except websockets.exceptions.ConnectionClosed:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("Websocket connection closed"))
+
+
+class ExecutorTransport(AsyncTransport):
+
+    """Sends requests through the active web3 provider, using the event loop's
+    default executor. Used when a websocket connection is not available."""
+
+    def __init__(self, provider: Any) -> None:
+        self.provider = provider
+
+    def __repr__(self) -> str:
+        return f"<ExecutorTransport object '{type(self.provider).__name__}'>"
+
+    async def request(self, method: str, params: List) -> Any:
+        loop = asyncio.get_event_loop()
+        response = await loop.run_in_executor(None, self.provider.make_request, method, params)
+        return _get_result(response)
+
+
+def get_transport() -> AsyncTransport:
+    """Returns the asynchronous transport for the active network.
+
+    A websocket is used when connected via websocket, or when connected to a
+    local test RPC (which also accepts websocket connections on the same port).
+    Otherwise requests are sent through the web3 provider in an executor."""
+    global _transport
+    provider = web3.provider
+    if provider is None:
+        raise ConnectionError("Not connected to any network")
+    if _transport is None or _transport[0] is not provider:
+        if isinstance(provider, WebsocketProvider):
+            transport: AsyncTransport = WebsocketTransport(provider.endpoint_uri)
+        elif isinstance(provider, HTTPProvider) and rpc.is_active():
+            transport = WebsocketTransport("ws" + provider.endpoint_uri[4:])
+        else:
+            transport = ExecutorTransport(provider)
+        _transport = (provider, transport)
+    return _transport[1]
+
+
+async def request(method: str, params: List) -> Any:
+    """Sends a JSON-RPC request using the active transport."""
+    return await get_transport().request(method, params)
+
+
+async def call(tx: Dict, block: Any = "latest") -> HexBytes:
+    """Performs an eth_call and returns the raw return data."""
+    return HexBytes(await request("eth_call", [_format_tx(tx), block]))
+
+
+async def estimate_gas(tx: Dict) -> int:
+    """Returns the estimated gas for a transaction."""
+    return int(await request("eth_estimateGas", [_format_tx(tx)]), 16)
+
+
+async def get_transaction_count(address: str, block: str = "latest") -> int:
+    """Returns the transaction count of an address."""
+    return int(await request("eth_getTransactionCount", [address, block]), 16)
+
+
+async def send_transaction(tx: Dict) -> str:
+    """Broadcasts a transaction from an account unlocked on the node. Returns the txid."""
+    return await request("eth_sendTransaction", [_format_tx(tx)])
+
+
+async def send_raw_transaction(raw_tx: bytes) -> str:
+    """Broadcasts a signed transaction. Returns the txid."""
+    return await request("eth_sendRawTransaction", [HexBytes(raw_tx).hex()])
+
+
+async def get_transaction(txid: str) -> Optional[Dict]:
+    """Returns a transaction, or None if it is not known to the node."""
+    tx = await request("eth_getTransactionByHash", [txid])
+    return transaction_formatter(tx) if tx else None
+
+
+async def get_transaction_receipt(txid: str) -> Optional[Dict]:
+    """Returns a transaction receipt, or None if the transaction is still pending."""
+    receipt = await request("eth_getTransactionReceipt", [txid])
+    return receipt_formatter(receipt) if receipt else None
+
+
+def _format_tx(tx: Dict) -> Dict:
+    # converts transaction values to the hexstrings expected by the node
+    formatted = {}
+    for key, value in tx.items():
+        if isinstance(value, bytes):
+            value = HexBytes(value).hex()
+        elif isinstance(value, int):
+            value = hex(value)
+        formatted[key] = value
+    return formatted
+
+
+def _get_result(response: Dict) -> Any:
+    if "error" in response:
+        raise ValueError(response["error"])
+    return response["result"]
@@ -0,0 +1,125 @@
+#!/usr/bin/python3
+
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+import requests
+from web3 import HTTPProvider
+
+from brownie.convert import Wei
+from brownie.exceptions import RPCRequestError
+
+from .web3 import _resolve_address, web3
+
+
+class Batch:
+
+    """Collects read-only JSON-RPC requests so they can be sent together.
+
+    Requests are sent when the context manager exits. Results are then
+    available via Batch.results, in the order the requests were added."""
+
+    def __init__(self, chunk_size: int = 100) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.chunk_size = chunk_size
+        self.results: List = []
+        self._pending: List[Tuple[str, List, Optional[Callable]]] = []
+
+    def __enter__(self) -> "Batch":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        if exc_type is None:
+            self.execute()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def __iter__(self) -> Iterator:
+        return iter(self.results)
+
+    def request(self, method: str, params: List, formatter: Optional[Callable] = None) -> int:
+        """Adds a request to the batch.
+
+        Args:
+            method: JSON-RPC method name.
+            params: List of parameters for the method.
+            formatter: Optional callable applied to the result.
+
+        Returns:
+            Index of the result within Batch.results"""
+        self._pending.append((method, params, formatter))
+        return len(self._pending) - 1
+
+    def balance(self, address: Any) -> int:
+        """Adds a request for the ether balance of an address, in wei."""
+        return self.request("eth_getBalance", [_resolve_address(str(address)), "latest"], _to_wei)
+
+    def nonce(self, address: Any) -> int:
+        """Adds a request for the transaction count of an address."""
+        return self.request(
+            "eth_getTransactionCount", [_resolve_address(str(address)), "latest"], _to_int
+        )
+
+    def execute(self) -> List:
+        """Sends all pending requests and returns the results."""
+        pending, self._pending = self._pending, []
+        results = []
+        for i in range(0, len(pending), self.chunk_size):
+            chunk = pending[i : i + self.chunk_size]
+            responses = _send_batch([(method, params) for method, params, _ in chunk])
+            for (method, params, formatter), response in zip(chunk, responses):
+                results.append(formatter(response) if formatter else response)
+        self.results = results
+        return results
+
+
+def batch(chunk_size: int = 100) -> Batch:
+    """Returns a Batch object, used as a context manager to send multiple
+    read-only requests in as few round trips as possible.
+
+    Args:
+        chunk_size: Maximum number of requests sent within a single JSON-RPC batch."""
+    return Batch(chunk_size)
+
+
+def _send_batch(calls: List[Tuple[str, List]]) -> List:
+    # sends a list of (method, params) as a single JSON-RPC batch request
+    if not calls:
+        return []
+    provider = web3.provider
+    if provider is None:
+        raise ConnectionError("Not connected to any network")
+    if not isinstance(provider, HTTPProvider):
+        # IPC and websocket providers are queried one request at a time
+        responses = [provider.make_request(*i) for i in calls]  # type: ignore
+    else:
+        payload = [
+            {"jsonrpc": "2.0", "method": method, "params": params, "id": i}
+            for i, (method, params) in enumerate(calls)
+        ]
+        response = requests.post(
+            provider.endpoint_uri, json=payload, **provider.get_request_kwargs()
+        )
+        response.raise_for_status()
+        data = response.json()
+        if isinstance(data, dict):
+            # the node rejected the entire batch
+            raise RPCRequestError(data.get("error", {}).get("message", str(data)))
+        responses = sorted(data, key=lambda k: k["id"])
+        if [i["id"] for i in responses] != list(range(len(calls))):
+            raise RPCRequestError(
+                f"Batch returned {len(responses)} responses for {len(calls)} requests"
+            )
+    for response in responses:
+        if "error" in response:
+            raise RPCRequestError(response["error"]["message"])
+    return [i["result"] for i in responses]
+
+
+def _to_int(value: str) -> int:
+    return int(value, 16)
+
+
+def _to_wei(value: str) -> Wei:
+    return Wei(int(value, 16))
@@ -0,0 +1,125 @@
+#!/usr/bin/python3
+
+import re
+from typing import Any, Dict, List, Tuple
+
+from eth_abi import decode_abi
+from eth_abi.exceptions import InsufficientDataBytes
+from eth_abi.grammar import TupleType, parse
+from hexbytes import HexBytes
+
+from brownie.convert import ReturnValue, _get_formatter, _import_numpy
+
+_raw_regex = re.compile(r"(u?int\d*|address|bytes\d+)\[(\d*)\]")
+
+
+def decode_raw(abi_params: List, data: Any) -> ReturnValue:
+    """Decodes ABI encoded data, returning numeric arrays as NumPy arrays.
+
+    One-dimensional arrays of integers, addresses and fixed length bytes are
+    read directly from the encoded data without creating a Python object for
+    each item. Where possible the returned array is a read-only view on the
+    data, without copying:
+
+        * uint / int of 64 bits or less: big-endian integer array, using the
+          smallest dtype that fits the type
+        * uint / int of more than 64 bits: object array of Python ints
+        * address: uint8 array with shape (length, 20)
+        * bytes1 to bytes32: uint8 array with shape (length, N)
+
+    All other values are decoded and formatted in the same way as a regular
+    call. Requires NumPy.
+
+    Args:
+        abi_params: ABI of the encoded values, e.g. the outputs of a function
+        data: ABI encoded data as bytes or a hexstring
+
+    Returns: ReturnValue of decoded values."""
+    np = _import_numpy("Raw decoding")
+    data = bytes(HexBytes(data))
+    values = []
+    head = 0
+    for param in abi_params:
+        type_str = _get_type_str(param)
+        abi_type = parse(type_str)
+        size = _get_head_size(abi_type)
+        match = _raw_regex.fullmatch(param["type"])
+        if match:
+            values.append(_decode_array(np, data, head, *match.groups()))
+        elif abi_type.is_dynamic:
+            # the value is re-encoded as a single item tuple, offsets within a
+            # dynamic value are relative to its own start so they remain valid
+            encoded = (32).to_bytes(32, "big") + data[_read_int(data, head) :]
+            values.append(_decode_value(param, type_str, encoded))
+        else:
+            values.append(_decode_value(param, type_str, data[head : head + size]))
+        head += size
+    return ReturnValue(values, abi_params)
+
+
+def _get_type_str(param: Dict) -> str:
+    # returns the canonical type string, expanding tuples into their components
+    if not param["type"].startswith("tuple"):
+        return param["type"]
+    components = ",".join(_get_type_str(i) for i in param["components"])
+    return f"({components}){param['type'][5:]}"
+
+
+def _get_head_size(abi_type: Any) -> int:
+    if abi_type.is_dynamic:
+        return 32
+    if isinstance(abi_type, TupleType):
+        size = sum(_get_head_size(i) for i in abi_type.components)
+    else:
+        size = 32
+    for dimension in abi_type.arrlist or ():
+        size *= dimension[0]
+    return size
+
+
+def _read_int(data: bytes, offset: int) -> int:
+    if offset + 32 > len(data):
+        raise InsufficientDataBytes(f"Tried to read 32 bytes at offset {offset}")
+    return int.from_bytes(data[offset : offset + 32], "big")
+
+
+def _decode_value(param: Dict, type_str: str, encoded: bytes) -> Any:
+    value = decode_abi([type_str], encoded)[0]
+    return _get_formatter([param])([value])[0]
+
+
+def _decode_array(np: Any, data: bytes, head: int, base_type: str, length: str) -> Any:
+    if length:
+        start, count = head, int(length)
+    else:
+        offset = _read_int(data, head)
+        start, count = offset + 32, _read_int(data, offset)
+    if start + count * 32 > len(data):
+        raise InsufficientDataBytes(f"Tried to read {count * 32} bytes at offset {start}")
+
+    if base_type == "address":
+        return _view(np, data, start + 12, (count, 20), np.uint8)
+    if base_type.startswith("bytes"):
+        return _view(np, data, start, (count, int(base_type[5:])), np.uint8)
+
+    signed = base_type.startswith("int")
+    bits = int(base_type.lstrip("uint") or 256)
+    if bits > 64:
+        values = [
+            int.from_bytes(data[i : i + 32], "big", signed=signed)
+            for i in range(start, start + count * 32, 32)
+        ]
+        array = np.empty(count, dtype=object)
+        array[:] = values
+        return array
+    width = next(i for i in (1, 2, 4, 8) if i * 8 >= bits)
+    dtype = np.dtype(f">{'i' if signed else 'u'}{width}")
+    return _view(np, data, start + 32 - width, (count,), dtype)
+
+
+def _view(np: Any, data: bytes, offset: int, shape: Tuple, dtype: Any) -> Any:
+    # returns a read-only strided view of one value per 32 byte word
+    if not shape[0]:
+        return np.empty(shape, dtype=dtype)
+    strides = (32,) if len(shape) == 1 else (32, 1)
+    return np.ndarray(shape, dtype=dtype, buffer=data, offset=offset, strides=strides)
@@ -0,0 +1,467 @@
+#!/usr/bin/python3
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from hexbytes import HexBytes
+
+from brownie._config import CONFIG
+from brownie._singleton import _Singleton
+
+from .batch import Batch
+from .rpc import Rpc, _revert_register
+from .web3 import web3
+
+rpc = Rpc()
+
+# error messages given by nodes when a log query matches too many results
+_too_many_regex = re.compile(
+    r"more than \d+ results|too many|response size|exceed|range is too (large|wide)", re.I
+)
+
+
+class CallCache(metaclass=_Singleton):
+
+    """Singleton cache for the results of contract calls within the current block.
+
+    The cache is disabled by default. When enabled, results of eth_call are
+    stored until a new block is mined, a transaction is broadcast, or the local
+    RPC is reverted or reset.
+
+    Attributes:
+        hits: Number of calls returned from the cache.
+        misses: Number of calls that were sent to the node."""
+
+    def __init__(self) -> None:
+        self._enabled = False
+        self._max_size = 1024
+        self._block_ttl: float = 0
+        self._height: Optional[int] = None
+        self._height_checked: float = 0
+        self._cache: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        _revert_register(self)
+
+    def __repr__(self) -> str:
+        status = "enabled" if self._enabled else "disabled"
+        return f"<CallCache object ({status}, {len(self._cache)} items)>"
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def is_enabled(self) -> bool:
+        """Returns True if the cache is enabled."""
+        return self._enabled
+
+    def enable(self, max_size: int = 1024, block_ttl: float = 0) -> None:
+        """Enables the cache.
+
+        Args:
+            max_size: Maximum number of results to hold. When full, the least
+                      recently used result is discarded.
+            block_ttl: Number of seconds to wait between checking the block
+                       height. If 0, the height is checked prior to every call."""
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        with self._lock:
+            self._enabled = True
+            self._max_size = max_size
+            self._block_ttl = block_ttl
+            while len(self._cache) > max_size:
+                self._cache.popitem(last=False)
+
+    def disable(self) -> None:
+        """Disables and clears the cache."""
+        with self._lock:
+            self._enabled = False
+            self._clear()
+
+    def clear(self) -> None:
+        """Clears all cached results."""
+        with self._lock:
+            self._clear()
+
+    def stats(self) -> Dict:
+        """Returns a dict of cache statistics."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "size": len(self._cache),
+            "max_size": self._max_size,
+        }
+
+    def call(self, tx: Dict) -> HexBytes:
+        """Performs an eth_call, returning a cached result where possible.
+
+        Args:
+            tx: Transaction dict, as given to web3.eth.call
+
+        Returns: Raw return data from the call."""
+        if not self._enabled:
+            return web3.eth.call(tx)
+        with self._lock:
+            self._check_height()
+            key = (self._height, tx.get("to"), tx.get("data"), tx.get("from")) + tuple(
+                sorted((k, str(v)) for k, v in tx.items() if k not in ("to", "data", "from"))
+            )
+            if key in self._cache:
+                self.hits += 1
+                self._cache.move_to_end(key)
+                return self._cache[key]
+            height = self._height
+        data = web3.eth.call(tx)
+        with self._lock:
+            self.misses += 1
+            if self._enabled and self._height == height:
+                self._cache[key] = data
+                if len(self._cache) > self._max_size:
+                    self._cache.popitem(last=False)
+        return data
+
+    def _check_height(self) -> None:
+        if self._height is not None and time.time() - self._height_checked < self._block_ttl:
+            return
+        height = web3.eth.blockNumber
+        self._height_checked = time.time()
+        if height != self._height:
+            self._cache.clear()
+            self._height = height
+
+    def _clear(self) -> None:
+        self._cache.clear()
+        self._height = None
+
+    def _reset(self) -> None:
+        self.clear()
+
+    def _revert(self, height: int) -> None:
+        self.clear()
+
+
+class HistoricalCallCache(metaclass=_Singleton):
+
+    """Singleton on-disk cache for the results of contract calls at past blocks.
+
+    The result of a call at a final block can never change, so it is stored
+    permanently in an SQLite database, keyed by the genesis hash of the chain.
+    A block is considered final once it has the number of confirmations given
+    by the 'finality_depth' network setting. Calls on a local test RPC are
+    never stored, as the chain may be reverted or reset.
+
+    Attributes:
+        hits: Number of calls returned from the cache.
+        misses: Number of calls that were sent to the node."""
+
+    def __init__(self) -> None:
+        self._path = CONFIG["brownie_folder"].joinpath("data/history.db")
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self) -> str:
+        return f"<HistoricalCallCache object '{self._path}'>"
+
+    def call(self, tx: Dict, block: Union[int, str]) -> HexBytes:
+        """Performs an eth_call at a past block, returning a stored result where possible.
+
+        Args:
+            tx: Transaction dict, as given to web3.eth.call
+            block: Block number to perform the call at. Block tags such as
+                   "latest" are passed to the node without using the cache.
+
+        Returns: Raw return data from the call."""
+        if isinstance(block, str) and block.startswith("0x"):
+            block = int(block, 16)
+        if not isinstance(block, int):
+            self.misses += 1
+            return web3.eth.call(tx, block)
+        key = _get_key(tx)
+        result = self._get(key, [block])
+        if block in result:
+            self.hits += 1
+            return result[block]
+        data = web3.eth.call(tx, block)
+        self.misses += 1
+        self._set(key, {block: data})
+        return data
+
+    def call_range(self, tx: Dict, blocks: Sequence[int]) -> List[HexBytes]:
+        """Performs an eth_call at each of the given blocks. Results that are
+        not already stored are requested together in a single batch.
+
+        Args:
+            tx: Transaction dict, as given to web3.eth.call
+            blocks: Sequence of block numbers to perform the call at.
+
+        Returns: List of raw return data, in the same order as blocks."""
+        key = _get_key(tx)
+        results = self._get(key, blocks)
+        missing = sorted(set(blocks).difference(results))
+        self.hits += len(blocks) - len(missing)
+        if missing:
+            formatted = dict((k, hex(v) if isinstance(v, int) else v) for k, v in tx.items())
+            with Batch() as batch:
+                for block in missing:
+                    batch.request("eth_call", [formatted, hex(block)], HexBytes)
+            fetched = dict(zip(missing, batch.results))
+            self.misses += len(missing)
+            self._set(key, fetched)
+            results.update(fetched)
+        return [results[i] for i in blocks]
+
+    def clear(self) -> None:
+        """Deletes all stored results."""
+        with self._lock:
+            self._connect().execute("DELETE FROM calls")
+            self._conn.commit()  # type: ignore
+
+    def stats(self) -> Dict:
+        """Returns a dict of cache statistics."""
+        total = self.hits + self.misses
+        with self._lock:
+            size = self._connect().execute("SELECT COUNT(*) FROM calls").fetchone()[0]
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "size": size,
+        }
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(str(self._path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS calls (chain TEXT, block INTEGER, tx TEXT,"
+                " result BLOB, PRIMARY KEY (chain, block, tx))"
+            )
+        return self._conn
+
+    def _get(self, key: str, blocks: Sequence[int]) -> Dict:
+        if rpc.is_active():
+            return {}
+        chain = web3.genesis_hash
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT block, result FROM calls WHERE chain=? AND tx=? AND block BETWEEN ? AND ?",
+                (chain, key, min(blocks), max(blocks)),
+            )
+            return dict((block, HexBytes(result)) for block, result in rows)
+
+    def _set(self, key: str, results: Dict) -> None:
+        if rpc.is_active():
+            return
+        final = web3.eth.blockNumber - CONFIG["active_network"].get("finality_depth", 12)
+        rows = [
+            (web3.genesis_hash, block, key, bytes(data))
+            for block, data in results.items()
+            if block <= final
+        ]
+        if not rows:
+            return
+        with self._lock:
+            conn = self._connect()
+            conn.executemany("INSERT OR REPLACE INTO calls VALUES (?,?,?,?)", rows)
+            conn.commit()
+
+
+class LogCache(metaclass=_Singleton):
+
+    """Singleton on-disk cache for event logs at past blocks.
+
+    Logs are requested from the node in chunks of blocks, several chunks at a
+    time. If the node rejects a chunk because it matches too many results, the
+    chunk is split and the chunk size is reduced for the rest of the query.
+
+    Logs at final blocks can never change, so they are stored permanently in
+    an SQLite database along with the block ranges that have been queried.
+    Repeating a query only requests the blocks that have not been queried
+    before. Finality is determined in the same way as HistoricalCallCache.
+
+    Attributes:
+        hits: Number of blocks where logs were returned from the cache.
+        misses: Number of blocks where logs were requested from the node."""
+
+    def __init__(self) -> None:
+        self._path = CONFIG["brownie_folder"].joinpath("data/logs.db")
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self) -> str:
+        return f"<LogCache object '{self._path}'>"
+
+    def get_logs(self, address: str, topics: List, from_block: int, to_block: int) -> List[Dict]:
+        """Returns all logs matching a filter within a range of blocks.
+
+        Args:
+            address: Address of the contract that emitted the logs.
+            topics: List of topics to filter by, as given to eth_getLogs
+            from_block: First block of the range.
+            to_block: Last block of the range, inclusive.
+
+        Returns: List of logs, ordered by block number and log index."""
+        params = {"address": address, "topics": topics}
+        if rpc.is_active():
+            final = from_block - 1
+        else:
+            final = web3.eth.blockNumber - CONFIG["active_network"].get("finality_depth", 12)
+        final = min(final, to_block)
+
+        logs = []
+        if final >= from_block:
+            key = json.dumps(params, sort_keys=True)
+            missing = self._get_missing(key, from_block, final)
+            self.hits += final - from_block + 1 - sum(stop - start + 1 for start, stop in missing)
+            for start, stop in missing:
+                for chunk_start, chunk_stop, chunk in _fetch_logs(params, start, stop):
+                    self.misses += chunk_stop - chunk_start + 1
+                    self._set(key, chunk_start, chunk_stop, chunk)
+            logs = self._get(key, from_block, final)
+
+        start = max(from_block, final + 1)
+        if start <= to_block:
+            for chunk_start, chunk_stop, chunk in _fetch_logs(params, start, to_block):
+                self.misses += chunk_stop - chunk_start + 1
+                logs.extend(chunk)
+        return sorted(logs, key=lambda k: (k["blockNumber"], k["logIndex"]))
+
+    def clear(self) -> None:
+        """Deletes all stored logs."""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM logs")
+                conn.execute("DELETE FROM log_ranges")
+
+    def stats(self) -> Dict:
+        """Returns a dict of cache statistics."""
+        total = self.hits + self.misses
+        with self._lock:
+            size = self._connect().execute("SELECT COUNT(*) FROM logs").fetchone()[0]
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "size": size,
+        }
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(str(self._path), timeout=30, check_same_thread=False)
+            with self._conn:
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS logs (chain TEXT, query TEXT, block INTEGER,"
+                    " log_index INTEGER, log TEXT, PRIMARY KEY (chain, query, block, log_index))"
+                )
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS log_ranges (chain TEXT, query TEXT,"
+                    " start INTEGER, stop INTEGER)"
+                )
+        return self._conn
+
+    def _get_missing(self, key: str, from_block: int, to_block: int) -> List[Tuple[int, int]]:
+        # returns the ranges of blocks between from_block and to_block that are not stored
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT start, stop FROM log_ranges WHERE chain=? AND query=? AND stop>=? AND "
+                "start<=? ORDER BY start",
+                (web3.genesis_hash, key, from_block, to_block),
+            )
+            missing = []
+            for start, stop in rows:
+                if start > from_block:
+                    missing.append((from_block, start - 1))
+                from_block = max(from_block, stop + 1)
+        if from_block <= to_block:
+            missing.append((from_block, to_block))
+        return missing
+
+    def _get(self, key: str, from_block: int, to_block: int) -> List[Dict]:
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT log FROM logs WHERE chain=? AND query=? AND block BETWEEN ? AND ?",
+                (web3.genesis_hash, key, from_block, to_block),
+            )
+            return [json.loads(i[0]) for i in rows]
+
+    def _set(self, key: str, start: int, stop: int, logs: List[Dict]) -> None:
+        chain = web3.genesis_hash
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO logs VALUES (?,?,?,?,?)",
+                    [(chain, key, i["blockNumber"], i["logIndex"], json.dumps(i)) for i in logs],
+                )
+                # the new range is merged with any stored ranges that it overlaps or adjoins
+                rows = conn.execute(
+                    "SELECT start, stop FROM log_ranges WHERE chain=? AND query=? AND stop>=? AND "
+                    "start<=?",
+                    (chain, key, start - 1, stop + 1),
+                ).fetchall()
+                start = min([start] + [i[0] for i in rows])
+                stop = max([stop] + [i[1] for i in rows])
+                conn.execute(
+                    "DELETE FROM log_ranges WHERE chain=? AND query=? AND start>=? AND stop<=?",
+                    (chain, key, start, stop),
+                )
+                conn.execute("INSERT INTO log_ranges VALUES (?,?,?,?)", (chain, key, start, stop))
+
+
+def _fetch_logs(params: Dict, from_block: int, to_block: int) -> Iterator[Tuple[int, int, List]]:
+    # requests logs in chunks of blocks, yielding (start, stop, logs) as each chunk completes
+    chunk_size = CONFIG["active_network"].get("log_chunk_size", 10000)
+    max_workers = CONFIG["active_network"].get("log_concurrency", 4)
+    pending = deque([(from_block, to_block)])
+    futures: Dict = {}
+    with ThreadPoolExecutor(max_workers) as executor:
+        while pending or futures:
+            while pending and len(futures) < max_workers:
+                start, stop = pending.popleft()
+                if stop - start >= chunk_size:
+                    pending.appendleft((start + chunk_size, stop))
+                    stop = start + chunk_size - 1
+                future = executor.submit(_get_logs, params, start, stop)
+                futures[future] = (start, stop)
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                start, stop = futures.pop(future)
+                try:
+                    logs = future.result()
+                except ValueError as e:
+                    if start == stop or not _too_many_regex.search(str(e)):
+                        raise
+                    chunk_size = min(chunk_size, max((stop - start + 1) // 2, 1))
+                    pending.appendleft((start, stop))
+                    continue
+                yield start, stop, logs
+
+
+def _get_logs(params: Dict, from_block: int, to_block: int) -> List[Dict]:
+    logs = web3.eth.getLogs({**params, "fromBlock": from_block, "toBlock": to_block})
+    return [dict((k, _to_json(v)) for k, v in i.items()) for i in logs]
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, bytes):
+        return HexBytes(value).hex()
+    if isinstance(value, (list, tuple)):
+        return [_to_json(i) for i in value]
+    return value
+
+
+def _get_key(tx: Dict) -> str:
+    # the call parameters that determine the result, independent of key order
+    return json.dumps(tx, sort_keys=True, default=str)
@@ -1,29 +1,55 @@
 #!/usr/bin/python3
 
-import re
+import json
+import sys
+import threading
+from collections import OrderedDict
+from copy import deepcopy
 from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
-import eth_abi
+from eth_abi.decoding import ContextFramesBytesIO, TupleDecoder
+from eth_abi.encoding import TupleEncoder
+from eth_abi.registry import registry
 from eth_hash.auto import keccak
 from hexbytes import HexBytes
 
 from brownie._config import ARGV, CONFIG
-from brownie.convert import Wei, _format_input, _format_output
+from brownie.convert import Wei, _format_input, _format_output, to_address
 from brownie.exceptions import (
     ContractExists,
     ContractNotFound,
+    RPCRequestError,
     UndeployedLibrary,
     VirtualMachineError,
 )
+from brownie.project.compiler import link_bytecode
 from brownie.typing import AccountsType, TransactionReceiptType
 from brownie.utils import color
 
+from . import aio
+from .bulk import decode_raw
+from .cache import CallCache, HistoricalCallCache
 from .event import _get_topics
+from .logs import ContractEvents
+from .multicall import Multicall
 from .rpc import Rpc, _revert_register
-from .state import _add_contract, _find_contract, _remove_contract
+from .state import _add_contract, _contract_lock, _find_contract, _remove_contract
+from .storage import ContractStorage
 from .web3 import _resolve_address, web3
 
 rpc = Rpc()
+call_cache = CallCache()
+historical_cache = HistoricalCallCache()
+
+# codecs and method tables are shared between all methods and contracts with the same ABI
+_encoders: Dict[Tuple, TupleEncoder] = {}
+_decoders: Dict[Tuple, TupleDecoder] = {}
+_abi_tables: Dict[str, Dict] = {}
+# most contracts share the ABI object from their build data, so tables are first
+# looked up by the id of the ABI to avoid serializing it for every instance. a copy
+# of the ABI is kept with each table, so that an ABI changed in place is not matched
+_abi_table_ids: OrderedDict = OrderedDict()
+_abi_table_lock = threading.Lock()
 
 
 class _ContractBase:
@@ -36,11 +62,12 @@ class _ContractBase:
         self._name = name
         self.abi = abi
         self.topics = _get_topics(abi)
-        self.signatures = dict((i["name"], _signature(i)) for i in abi if i["type"] == "function")
+        self._abi_table = _get_abi_table(abi)
+        self.signatures = self._abi_table["signatures"]
+        self.selectors = self._abi_table["selectors"]
 
     def get_method(self, calldata: str) -> Optional[str]:
-        sig = calldata[:10].lower()
-        return next((k for k, v in self.signatures.items() if v == sig), None)
+        return self.selectors.get(calldata[:10].lower())
 
 
 class ContractContainer(_ContractBase):
@@ -52,59 +79,92 @@ class ContractContainer(_ContractBase):
         abi: Complete contract ABI.
         bytecode: Bytecode used to deploy the contract.
         signatures: Dictionary of {'function name': "bytes4 signature"}
+        selectors: Dictionary of {"bytes4 signature": 'function name'}
         topics: Dictionary of {'event name': "bytes32 topic"}"""
 
     def __init__(self, project: Any, build: Dict) -> None:
         self.tx = None
         self.bytecode = build["bytecode"]
-        self._contracts: List["ProjectContract"] = []
+        # contracts are stored by address, the list is only built when indexing
+        self._contracts: Dict[str, "ProjectContract"] = {}
+        self._contract_list: Optional[List["ProjectContract"]] = None
+        # addresses of contracts deployed from this container, this session or via a
+        # manifest, and whether their bytecode is known to exist on the active network
+        self._deployed: Dict[str, bool] = {}
         super().__init__(project, build, build["contractName"], build["abi"])
         self.deploy = ContractConstructor(self, self._name)
         _revert_register(self)
 
     def __iter__(self) -> Iterator:
-        return iter(self._contracts)
+        return iter(self._get_list())
 
     def __getitem__(self, i: Any) -> "ProjectContract":
-        return self._contracts[i]
+        return self._get_list()[i]
 
     def __delitem__(self, key: Any) -> None:
-        item = self._contracts[key]
-        _remove_contract(item)
-        self._contracts.remove(item)
+        with _contract_lock:
+            item = self._get_list()[key]
+            _remove_contract(item)
+            del self._contracts[item.address]
+            self._deployed.pop(item.address, None)
+            self._contract_list = None
+
+    def __contains__(self, item: Any) -> bool:
+        address = _get_address(item)
+        if address not in self._contracts:
+            return False
+        return isinstance(item, str) or self._contracts[address] == item
 
     def __len__(self) -> int:
         return len(self._contracts)
 
     def __repr__(self) -> str:
-        return str(self._contracts)
+        return str(self._get_list())
+
+    def _get_list(self) -> List["ProjectContract"]:
+        with _contract_lock:
+            if self._contract_list is None:
+                self._contract_list = list(self._contracts.values())
+            return self._contract_list
 
     def _reset(self) -> None:
-        for contract in self._contracts:
-            _remove_contract(contract)
-            contract._reverted = True
-        self._contracts.clear()
+        with _contract_lock:
+            for contract in self._contracts.values():
+                _remove_contract(contract)
+                contract._reverted = True
+            self._contracts.clear()
+            self._contract_list = None
+            self._deployed.clear()
 
     def _revert(self, height: int) -> None:
-        reverted = [
-            i
-            for i in self._contracts
-            if (i.tx and i.tx.block_number > height) or len(web3.eth.getCode(i.address).hex()) <= 4
-        ]
-        for contract in reverted:
-            _remove_contract(contract)
-            self._contracts.remove(contract)
-            contract._reverted = True
+        with _contract_lock:
+            # the bytecode is only queried for contracts with an unknown creation block
+            reverted = [
+                i
+                for i in self._contracts.values()
+                if (i._height is not None and i._height > height)
+                or (i._height is None and len(web3.eth.getCode(i.address).hex()) <= 4)
+            ]
+            for contract in reverted:
+                _remove_contract(contract)
+                del self._contracts[contract.address]
+                self._deployed.pop(contract.address, None)
+                contract._reverted = True
+            if reverted:
+                self._contract_list = None
 
     def remove(self, contract: "ProjectContract") -> None:
         """Removes a contract from the container.
 
         Args:
             contract: Contract instance of address string of the contract."""
-        if contract not in self._contracts:
-            raise TypeError("Object is not in container.")
-        self._contracts.remove(contract)
-        _remove_contract(contract)
+        with _contract_lock:
+            if contract not in self:
+                raise TypeError("Object is not in container.")
+            contract = self._contracts.pop(_get_address(contract))
+            self._deployed.pop(contract.address, None)
+            self._contract_list = None
+            _remove_contract(contract)
 
     def at(
         self,
@@ -120,20 +180,68 @@ class ContractContainer(_ContractBase):
             address: Address string of the contract.
             owner: Default Account instance to send contract transactions from.
             tx: Transaction ID of the contract creation."""
-        contract = _find_contract(address)
-        if contract:
-            if contract._name == self._name and contract._project == self._project:
-                return contract
-            raise ContractExists(
-                f"'{contract._name}' declared at {address} in project '{contract._project._name}'"
-            )
-        contract = ProjectContract(self._project, self._build, address, owner, tx)
-        self._contracts.append(contract)
-        return contract
+        return self._at(address, owner, tx, None)
+
+    def _at(
+        self,
+        address: str,
+        owner: Optional[AccountsType],
+        tx: Optional[TransactionReceiptType],
+        height: Optional[int],
+    ) -> "ProjectContract":
+        with _contract_lock:
+            contract = _find_contract(address)
+            if contract:
+                if contract._name == self._name and contract._project == self._project:
+                    return contract
+                raise ContractExists(
+                    f"'{contract._name}' declared at {address} in project "
+                    f"'{contract._project._name}'"
+                )
+            contract = ProjectContract(self._project, self._build, address, owner, tx, height)
+            self._contracts[contract.address] = contract
+            self._contract_list = None
+            return contract
+
+    def deploy_if_changed(self, *args: Tuple) -> Union["ProjectContract", TransactionReceiptType]:
+        """Returns the most recent deployment of this contract, or deploys it if
+        there are none. Deployments recorded in the project's deployment
+        manifest are only included if their bytecode is unchanged, and if
+        bytecode still exists at their address.
+
+        Constructor arguments are only used when deploying.
+
+        Args:
+            *args: Constructor arguments. The last argument MUST be a dictionary
+                   of transaction values containing at minimum a 'from' key.
+
+        Returns:
+            ProjectContract instance, or a TransactionReceipt if the deployment reverts"""
+        for contract in reversed(self._get_list()):
+            if contract.address not in self._deployed:
+                continue
+            if not self._deployed[contract.address]:
+                # manifest deployments are loaded without eth_getCode, so the bytecode
+                # is checked once here in case the contract has self-destructed
+                if len(web3.eth.getCode(contract.address).hex()) <= 4:
+                    self.remove(contract)
+                    continue
+                self._deployed[contract.address] = True
+            return contract
+        return self.deploy(*args)
 
     def _add_from_tx(self, tx: TransactionReceiptType) -> None:
         tx._confirmed.wait()
-        self.at(tx.contract_address, tx.sender, tx)
+        contract = self.at(tx.contract_address, tx.sender, tx)
+        self._deployed[contract.address] = True
+        self._project._add_deployment(contract)
+
+    def _add_from_manifest(self, address: str, height: int) -> None:
+        # the manifest records the block the contract was deployed in, and that its
+        # bytecode matches the build data, so the contract is added without eth_getCode.
+        # deploy_if_changed checks that the bytecode exists before returning it
+        contract = self._at(address, None, None, height)
+        self._deployed.setdefault(contract.address, False)
 
 
 class ContractConstructor:
@@ -148,6 +256,9 @@ class ContractConstructor:
         except Exception:
             self.abi = {"inputs": [], "name": "constructor", "type": "constructor"}
         self._name = name
+        self._encoder = _get_encoder(self.abi["inputs"])
+        # linked bytecode, keyed by a tuple of library addresses
+        self._linked: Dict[Tuple, str] = {}
 
     def __repr__(self) -> str:
         return f"<{type(self).__name__} object '{self._name}.constructor({_inputs(self.abi)})'>"
@@ -174,59 +285,90 @@ class ContractConstructor:
         )
 
     def encode_input(self, *args: tuple) -> str:
-        bytecode = self._parent.bytecode
-        # find and replace unlinked library pointers in bytecode
-        for marker in re.findall("_{1,}[^_]*_{1,}", bytecode):
-            library = marker.strip("_")
+        bytecode = self._get_linked_bytecode()
+        data = _format_input(self.abi, args)
+        return bytecode + self._encoder(data).hex()
+
+    def _get_linked_bytecode(self) -> str:
+        # insert the addresses of the most recently deployed libraries into the bytecode
+        references = self._parent._build["linkReferences"]
+        if not references:
+            return self._parent.bytecode
+        addresses = {}
+        for library in references:
             if not self._parent._project[library]:
                 raise UndeployedLibrary(
                     f"Contract requires '{library}' library, but it has not been deployed yet"
                 )
-            address = self._parent._project[library][-1].address[-40:]
-            bytecode = bytecode.replace(marker, address)
-
-        data = _format_input(self.abi, args)
-        types = [i[1] for i in _params(self.abi["inputs"])]
-        return bytecode + eth_abi.encode_abi(types, data).hex()
+            addresses[library] = self._parent._project[library][-1].address
+        key = tuple(sorted(addresses.items()))
+        if key not in self._linked:
+            self._linked[key] = link_bytecode(self._parent.bytecode, references, addresses)
+        return self._linked[key]
 
 
 class _DeployedContractBase(_ContractBase):
     """Methods for interacting with a deployed contract.
 
     Each public contract method is available as a ContractCall or ContractTx
-    instance, created when this class is instantiated.
+    instance, created the first time it is accessed.
 
     Attributes:
         bytecode: Bytecode of the deployed contract, including constructor args.
+        events: ContractEvents object for querying past events, created on
+                first access.
         tx: TransactionReceipt of the of the tx that deployed the contract."""
 
     _reverted = False
 
     def __init__(
-        self, address: str, owner: Optional[AccountsType] = None, tx: TransactionReceiptType = None
+        self,
+        address: str,
+        owner: Optional[AccountsType] = None,
+        tx: TransactionReceiptType = None,
+        height: Optional[int] = None,
     ) -> None:
         address = _resolve_address(address)
-        self.bytecode = web3.eth.getCode(address).hex()[2:]
-        if not self.bytecode:
-            raise ContractNotFound(f"No contract deployed at {address}")
+        bytecode = _get_deployed_bytecode(self._build, address, tx, height)
+        if bytecode is None:
+            bytecode = web3.eth.getCode(address).hex()[2:]
+            if not bytecode:
+                raise ContractNotFound(f"No contract deployed at {address}")
+        # identical bytecode is common when many instances of a contract exist
+        self.bytecode = sys.intern(bytecode)
         self._owner = owner
         self.tx = tx
         self.address = address
-        fn_names = [i["name"] for i in self.abi if i["type"] == "function"]
-        for abi in [i for i in self.abi if i["type"] == "function"]:
-            name = f"{self._name}.{abi['name']}"
-            if fn_names.count(abi["name"]) == 1:
-                self._check_and_set(abi["name"], _get_method_object(address, abi, name, owner))
-                continue
-            if not hasattr(self, abi["name"]):
-                self._check_and_set(abi["name"], OverloadedMethod(address, name, owner))
-            key = ",".join(i["type"] for i in abi["inputs"]).replace("256", "")
-            getattr(self, abi["name"]).methods[key] = _get_method_object(address, abi, name, owner)
-
-    def _check_and_set(self, name: str, obj: Any) -> None:
-        if hasattr(self, name):
-            raise AttributeError(f"Namespace collision: '{self._name}.{name}'")
+        # block height the contract was created at, if known
+        self._height = tx.block_number if tx is not None else height
+        self._methods = self._abi_table["methods"]
+        if type(self) not in self._abi_table["checked"]:
+            for name in self._methods:
+                if name in self.__dict__ or hasattr(type(self), name):
+                    raise AttributeError(f"Namespace collision: '{self._name}.{name}'")
+            self._abi_table["checked"].add(type(self))
+
+    def __getattr__(self, name: str) -> Any:
+        # contract methods and events are created on first access
+        methods = self.__dict__.get("_methods", {})
+        if name == "events" and "_methods" in self.__dict__ and name not in methods:
+            self.events = ContractEvents(self.address, self.abi, self.topics)
+            return self.events
+        if name not in methods:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        fn_name = f"{self._name}.{name}"
+        if len(methods[name]) == 1:
+            obj = _get_method_object(self.address, methods[name][0], fn_name, self._owner)
+        else:
+            obj = OverloadedMethod(self.address, fn_name, self._owner)
+            for abi in methods[name]:
+                key = ",".join(i["type"] for i in abi["inputs"]).replace("256", "")
+                obj.methods[key] = _get_method_object(self.address, abi, fn_name, self._owner)
         setattr(self, name, obj)
+        return obj
+
+    def __dir__(self) -> List:
+        return sorted(set(super().__dir__()).union(self._methods, ["events"]))
 
     def __hash__(self) -> int:
         return hash(f"{self._name}{self.address}{self._project}")
@@ -299,9 +441,12 @@ class ProjectContract(_DeployedContractBase):
         address: str,
         owner: Optional[AccountsType],
         tx: TransactionReceiptType = None,
+        height: Optional[int] = None,
     ) -> None:
         _ContractBase.__init__(self, project, build, build["contractName"], build["abi"])
-        _DeployedContractBase.__init__(self, address, owner, tx)
+        _DeployedContractBase.__init__(self, address, owner, tx, height)
+        if "storage" not in self._methods:
+            self.storage = ContractStorage(self.address, build["storageLayout"])
         _add_contract(self)
 
 
@@ -335,30 +480,101 @@ class _ContractMethod:
         self.abi = abi
         self._owner = owner
         self.signature = _signature(abi)
+        self._encoder = _get_encoder(abi["inputs"])
+        self._decoder = _get_decoder(abi.get("outputs", []))
 
     def __repr__(self) -> str:
         pay = "payable " if self.abi["stateMutability"] == "payable" else ""
         return f"<{type(self).__name__} {pay}object '{self.abi['name']}({_inputs(self.abi)})'>"
 
-    def call(self, *args: Tuple) -> Any:
+    def call(self, *args: Tuple, block: Optional[Union[int, str]] = None) -> Any:
         """Calls the contract method without broadcasting a transaction.
 
         Args:
             *args: Contract method inputs. You can optionally provide a
                    dictionary of transaction properties as the last arg.
+            block: Block number or tag to perform the call at. Results at
+                   final blocks are stored permanently on disk.
 
         Returns:
             Contract method return value(s)."""
-        args, tx = _get_tx(self._owner, args)
-        if tx["from"]:
-            tx["from"] = str(tx["from"])
-        tx.update({"to": self._address, "data": self.encode_input(*args)})
+        tx = self._get_call_tx(args)
         try:
-            data = web3.eth.call(dict((k, v) for k, v in tx.items() if v))
+            if block is None:
+                data = call_cache.call(tx)
+            else:
+                data = historical_cache.call(tx, block)
         except ValueError as e:
             raise VirtualMachineError(e) from None
         return self.decode_output(data)
 
+    def call_range(self, args: Any, start: int, stop: int, step: int = 1) -> List:
+        """Calls the contract method at each block in range(start, stop, step).
+
+        Results that are not already stored on disk are requested together
+        in a single batch.
+
+        Args:
+            args: Contract method inputs, as a list or tuple. A single value
+                  may be given for methods that take one input.
+            start: First block number.
+            stop: Block number to stop before.
+            step: Number of blocks between each call.
+
+        Returns:
+            List of contract method return values, one for each block."""
+        if not isinstance(args, (list, tuple)):
+            args = (args,)
+        blocks = range(start, stop, step)
+        if not blocks:
+            return []
+        try:
+            results = historical_cache.call_range(self._get_call_tx(tuple(args)), blocks)
+        except RPCRequestError as e:
+            raise VirtualMachineError({"message": str(e)}) from None
+        return [self.decode_output(i) for i in results]
+
+    async def call_async(self, *args: Tuple) -> Any:
+        """Calls the contract method without broadcasting a transaction, and
+        without blocking the event loop.
+
+        Args:
+            *args: Contract method inputs. You can optionally provide a
+                   dictionary of transaction properties as the last arg.
+
+        Returns:
+            Contract method return value(s)."""
+        try:
+            data = await aio.call(self._get_call_tx(args))
+        except ValueError as e:
+            raise VirtualMachineError(e) from None
+        return self.decode_output(data)
+
+    def call_many(
+        self, args_list: List, chunk_size: int = 100, require_success: bool = True
+    ) -> List:
+        """Calls the contract method once for each set of inputs, aggregating
+        the calls into as few requests as possible via a multicall contract.
+
+        Args:
+            args_list: List of contract method inputs. Each item is a list or
+                       tuple of inputs, or the input value for methods that
+                       take one input.
+            chunk_size: Maximum number of calls to aggregate in one request.
+            require_success: If False, failed calls return None instead of raising.
+
+        Returns:
+            List of contract method return values."""
+        multicall = Multicall(chunk_size=chunk_size, require_success=require_success)
+        inputs = self.abi["inputs"]
+        # with one array or struct input, every item is the input value
+        single = len(inputs) == 1 and inputs[0]["type"].endswith(("]", "tuple"))
+        for args in args_list:
+            if single or not isinstance(args, (list, tuple)):
+                args = (args,)
+            multicall.add(self, *args)
+        return multicall.execute()
+
     def transact(self, *args: Tuple) -> TransactionReceiptType:
         """Broadcasts a transaction that calls this contract method.
 
@@ -382,6 +598,13 @@ class _ContractMethod:
             data=self.encode_input(*args),
         )
 
+    def _get_call_tx(self, args: Tuple) -> Dict:
+        args, tx = _get_tx(self._owner, args)
+        if tx["from"]:
+            tx["from"] = str(tx["from"])
+        tx.update({"to": self._address, "data": self.encode_input(*args)})
+        return dict((k, v) for k, v in tx.items() if v)
+
     def encode_input(self, *args: Tuple) -> str:
         """Returns encoded ABI data to call the method with the given arguments.
 
@@ -391,19 +614,21 @@ class _ContractMethod:
         Returns:
             Hexstring of encoded ABI data."""
         data = _format_input(self.abi, args)
-        types = [i[1] for i in _params(self.abi["inputs"])]
-        return self.signature + eth_abi.encode_abi(types, data).hex()
+        return self.signature + self._encoder(data).hex()
 
-    def decode_output(self, hexstr: str) -> Tuple:
+    def decode_output(self, hexstr: str, raw: bool = False) -> Tuple:
         """Decodes hexstring data returned by this method.
 
         Args:
             hexstr: Hexstring of returned call data
+            raw: If True, numeric arrays are returned as NumPy arrays
 
         Returns: Decoded values."""
-        types = [i[1] for i in _params(self.abi["outputs"])]
-        result = eth_abi.decode_abi(types, HexBytes(hexstr))
-        result = _format_output(self.abi, result)
+        if raw:
+            result = decode_raw(self.abi["outputs"], hexstr)
+        else:
+            result = self._decoder(ContextFramesBytesIO(HexBytes(hexstr)))
+            result = _format_output(self.abi, result)
         if len(result) == 1:
             result = result[0]
         return result
@@ -442,17 +667,18 @@ class ContractCall(_ContractMethod):
         abi: Contract ABI specific to this method.
         signature: Bytes4 method signature."""
 
-    def __call__(self, *args: Tuple) -> Callable:
+    def __call__(self, *args: Tuple, block: Optional[Union[int, str]] = None) -> Callable:
         """Calls the contract method without broadcasting a transaction.
 
         Args:
             *args: Contract method inputs. You can optionally provide a
                    dictionary of transaction properties as the last arg.
+            block: Block number or tag to perform the call at.
 
         Returns:
             Contract method return value(s)."""
-        if not ARGV["always_transact"]:
-            return self.call(*args)
+        if not ARGV["always_transact"] or block is not None:
+            return self.call(*args, block=block)
         rpc._internal_snap()
         args, tx = _get_tx(self._owner, args)
         tx["gas_price"] = 0
@@ -493,6 +719,84 @@ def _params(abi_params: List) -> List:
     return types
 
 
+def _get_encoder(abi_params: List) -> TupleEncoder:
+    types = tuple(i[1] for i in _params(abi_params))
+    if types not in _encoders:
+        _encoders[types] = TupleEncoder(encoders=[registry.get_encoder(i) for i in types])
+    return _encoders[types]
+
+
+def _get_decoder(abi_params: List) -> TupleDecoder:
+    types = tuple(i[1] for i in _params(abi_params))
+    if types not in _decoders:
+        _decoders[types] = TupleDecoder(decoders=[registry.get_decoder(i) for i in types])
+    return _decoders[types]
+
+
+def _get_abi_table(abi: List) -> Dict:
+    # returns a dict of signatures, selectors and {'function name': [abi, ..]}
+    with _abi_table_lock:
+        cached = _abi_table_ids.get(id(abi))
+        if cached is not None and cached[0] is abi and cached[1] == abi:
+            _abi_table_ids.move_to_end(id(abi))
+            return cached[2]
+        table = _build_abi_table(abi)
+        # the ABI is held in the cache so that its id cannot be reused
+        _abi_table_ids[id(abi)] = (abi, deepcopy(abi), table)
+        if len(_abi_table_ids) > 1024:
+            _abi_table_ids.popitem(last=False)
+        return table
+
+
+def _build_abi_table(abi: List) -> Dict:
+    abi = [i for i in abi if i["type"] == "function"]
+    key = json.dumps(abi, sort_keys=True)
+    if key not in _abi_tables:
+        sigs = [(i["name"], _signature(i)) for i in abi]
+        methods: Dict = {}
+        for i in abi:
+            methods.setdefault(i["name"], []).append(i)
+        _abi_tables[key] = {
+            "signatures": dict(sigs),
+            "selectors": dict((v, k) for k, v in sigs),
+            "methods": methods,
+            "checked": set(),
+        }
+    return _abi_tables[key]
+
+
+def _get_address(item: Any) -> Optional[str]:
+    if isinstance(item, _DeployedContractBase):
+        return item.address
+    if isinstance(item, str):
+        try:
+            return to_address(item)
+        except ValueError:
+            return None
+    return None
+
+
+def _get_deployed_bytecode(
+    build: Optional[Dict],
+    address: str,
+    tx: Optional[TransactionReceiptType],
+    height: Optional[int] = None,
+) -> Optional[str]:
+    # when a contract is created from it's deployment receipt or a deployment
+    # manifest, the runtime bytecode is taken from the build data instead of
+    # querying eth_getCode
+    if not build or build["type"] == "library":
+        return None
+    if tx is None and height is None:
+        return None
+    if tx is not None and tx.contract_address != address:
+        return None
+    bytecode = build["deployedBytecode"]
+    if not bytecode or "_" in bytecode:
+        return None
+    return bytecode
+
+
 def _inputs(abi: Dict) -> str:
     params = _params(abi["inputs"])
     return ", ".join(f"{i[1]}{' '+i[0] if i[0] else ''}" for i in params)
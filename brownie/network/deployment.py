@@ -0,0 +1,226 @@
+#!/usr/bin/python3
+
+import queue
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+from .account import _check_evm_version
+from .contract import _get_tx
+from .state import _find_contract
+from .transaction import TransactionReceipt
+
+
+class Deployment:
+
+    """A single contract deployment within a DeploymentPlan.
+
+    When given as a constructor argument to another deployment in the same
+    plan, it is replaced with the address of the deployed contract.
+
+    Attributes:
+        name: Name of the deployment within the plan.
+        container: ContractContainer of the contract being deployed.
+        contract: The deployed contract, once the deployment has confirmed.
+        tx: TransactionReceipt of the deployment, once it has been broadcast."""
+
+    def __init__(
+        self, name: str, container: Any, args: Tuple, tx: Dict, depends_on: Sequence
+    ) -> None:
+        self.name = name
+        self.container = container
+        self.contract: Any = None
+        self.tx: Optional[TransactionReceipt] = None
+        self._args = args
+        self._tx = tx
+        self._depends_on = depends_on
+
+    def __repr__(self) -> str:
+        return f"<Deployment object '{self.name}'>"
+
+
+class DeploymentPlan:
+
+    """Deploys a system of contracts, broadcasting each deployment as soon as
+    the deployments it depends on have confirmed.
+
+    A deployment depends on another if it is given as a constructor argument,
+    if it is a library that must be linked into the bytecode, or if it is
+    explicitly declared via depends_on. Independent deployments are broadcast
+    together using consecutive nonces, without waiting for each to confirm.
+    Deploying accounts should not send other transactions until the plan has
+    been executed."""
+
+    def __init__(self, deployer: Any = None, silent: bool = False) -> None:
+        self.deployer = deployer
+        self.silent = silent
+        self._deployments: Dict[str, Deployment] = {}
+
+    def __repr__(self) -> str:
+        return f"<DeploymentPlan object ({len(self)} deployments)>"
+
+    def __getitem__(self, name: str) -> Deployment:
+        return self._deployments[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._deployments
+
+    def __iter__(self) -> Iterator:
+        return iter(self._deployments.values())
+
+    def __len__(self) -> int:
+        return len(self._deployments)
+
+    def add(
+        self, container: Any, *args: Any, name: Optional[str] = None, depends_on: Sequence = ()
+    ) -> Deployment:
+        """Adds a contract deployment to the plan.
+
+        Args:
+            container: ContractContainer of the contract to deploy.
+            *args: Constructor arguments. Deployment objects are replaced with
+                   the address of the deployed contract. You can optionally
+                   provide a dictionary of transaction properties as the last arg.
+            name: Unique name of the deployment. Defaults to the contract name.
+            depends_on: Deployments, or deployment names, that must confirm
+                        before this deployment is broadcast.
+
+        Returns:
+            Deployment object"""
+        name = name or container._name
+        if name in self._deployments:
+            raise ValueError(f"Plan already contains a deployment named '{name}'")
+        args, tx = _get_tx(self.deployer, args)
+        if not tx["from"]:
+            raise AttributeError(
+                "No deployer given. You must set a deployer for the plan, or supply"
+                " a tx dict with a 'from' field as the last argument."
+            )
+        deployment = Deployment(name, container, args, tx, depends_on)
+        self._deployments[name] = deployment
+        return deployment
+
+    def execute(self) -> Dict:
+        """Broadcasts every deployment and waits for all of them to confirm.
+
+        If a deployment fails, no further deployments are broadcast. The
+        exception is raised once all broadcast deployments have confirmed.
+
+        Returns:
+            Dict of {'deployment name': Contract}"""
+        dependencies = self._get_dependencies()
+        pending = dict((k, v) for k, v in self._deployments.items() if v.contract is None)
+        confirmed = set(k for k, v in self._deployments.items() if v.contract is not None)
+        nonces: Dict[str, int] = {}
+        completed: queue.Queue = queue.Queue()
+        in_flight = 0
+        error: Optional[BaseException] = None
+        failed: Optional[Deployment] = None
+
+        while True:
+            if error is None and failed is None:
+                ready = [i for i in pending.values() if dependencies[i.name] <= confirmed]
+                for deployment in ready:
+                    try:
+                        self._broadcast(deployment, nonces, completed)
+                    except Exception as e:
+                        error = e
+                        break
+                    del pending[deployment.name]
+                    in_flight += 1
+            if not in_flight:
+                break
+            deployment, exc = completed.get()
+            in_flight -= 1
+            if exc is not None:
+                error = error or exc
+            elif deployment.tx.status == 1:  # type: ignore
+                deployment.container._add_from_tx(deployment.tx)
+                deployment.contract = _find_contract(deployment.tx.contract_address)  # type: ignore
+                confirmed.add(deployment.name)
+            elif failed is None:
+                failed = deployment
+
+        if error is not None:
+            raise error
+        if failed is not None:
+            failed.tx._evaluate_confirmed()  # type: ignore
+        return dict((k, v.contract) for k, v in self._deployments.items())
+
+    def _get_dependencies(self) -> Dict[str, Set[str]]:
+        # returns {'deployment name': {names of required deployments}}
+        dependencies = {}
+        for deployment in self._deployments.values():
+            names = set(i.name for i in _get_deployments(deployment._args) if i.contract is None)
+            names.update(getattr(i, "name", i) for i in deployment._depends_on)
+            libraries = deployment.container._build["linkReferences"]
+            names.update(k for k, v in self._deployments.items() if v.container._name in libraries)
+            for name in names.difference(self._deployments):
+                raise ValueError(f"'{deployment.name}' depends on unknown deployment '{name}'")
+            dependencies[deployment.name] = names
+
+        resolved: Set[str] = set()
+        remaining = dict(dependencies)
+        while remaining:
+            ready = [k for k, v in remaining.items() if v <= resolved]
+            if not ready:
+                raise ValueError(f"Circular dependency between: {', '.join(sorted(remaining))}")
+            resolved.update(ready)
+            for name in ready:
+                del remaining[name]
+        return dependencies
+
+    def _broadcast(self, deployment: Deployment, nonces: Dict, completed: queue.Queue) -> None:
+        _check_evm_version(deployment.container)
+        account = deployment._tx["from"]
+        data = deployment.container.deploy.encode_input(*_resolve_args(deployment._args))
+        with account._lock:
+            # the nonce is only queried once, after that nonces are assigned in order
+            if account.address not in nonces:
+                nonces[account.address] = account._pending_nonce()
+            txid, revert_data = account._send_deployment(
+                data,
+                deployment._tx["value"],
+                deployment._tx["gas"],
+                deployment._tx["gasPrice"],
+                nonces[account.address],
+            )
+            nonces[account.address] += 1
+        deployment.tx = TransactionReceipt(
+            txid,
+            account,
+            silent=self.silent,
+            name=deployment.container._name + ".constructor",
+            revert_data=revert_data,
+            blocking=False,
+        )
+        thread = threading.Thread(
+            target=_await_confirmation, args=(deployment, completed, self.silent), daemon=True
+        )
+        thread.start()
+
+
+def _await_confirmation(deployment: Deployment, completed: queue.Queue, silent: bool) -> None:
+    try:
+        deployment.tx._await_confirmation(silent)  # type: ignore
+    except Exception as e:
+        completed.put((deployment, e))
+    else:
+        completed.put((deployment, None))
+
+
+def _get_deployments(args: Any) -> List[Deployment]:
+    # returns all Deployment objects within (possibly nested) arguments
+    if isinstance(args, Deployment):
+        return [args]
+    if isinstance(args, (list, tuple)):
+        return [x for i in args for x in _get_deployments(i)]
+    return []
+
+
+def _resolve_args(args: Any) -> Any:
+    # replaces Deployment objects with the address of the deployed contract
+    if isinstance(args, Deployment):
+        return args.contract.address
+    if isinstance(args, (list, tuple)):
+        return type(args)(_resolve_args(i) for i in args)
+    return args
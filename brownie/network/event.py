@@ -1,16 +1,25 @@
 #!/usr/bin/python3
 
 import json
+import sqlite3
+import threading
 from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Iterator, List, Sequence, Tuple, Union, ValuesView
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union, ValuesView
 
 import eth_event
+from eth_abi.decoding import ContextFramesBytesIO, TupleDecoder
+from eth_abi.exceptions import InsufficientDataBytes
+from eth_abi.registry import registry
+from eth_event import EventError
+from hexbytes import HexBytes
 
 from brownie._config import CONFIG
 from brownie.convert import _format_event
 from brownie.exceptions import EventLookupError
 
+from .bulk import _get_type_str, decode_raw
+
 
 class EventDict:
     """Dict/list hybrid container, base class for all events fired in a transaction."""
@@ -25,13 +34,12 @@ class EventDict:
             for pos, i in enumerate(events)
         ]
 
-        self._dict: Dict = OrderedDict()
+        grouped: Dict = OrderedDict()
         for event in self._ordered:
-            if event.name not in self._dict:
-                events = [i for i in self._ordered if i.name == event.name]
-                self._dict[event.name] = _EventItem(
-                    event.name, events, tuple(i.pos[0] for i in events)
-                )
+            grouped.setdefault(event.name, []).append(event)
+        self._dict: Dict = OrderedDict(
+            (k, _EventItem(k, v, tuple(i.pos[0] for i in v))) for k, v in grouped.items()
+        )
 
     def __repr__(self) -> str:
         return str(self)
@@ -41,7 +49,7 @@ class EventDict:
 
     def __contains__(self, name: str) -> bool:
         """returns True if an event fired with the given name."""
-        return name in [i.name for i in self._ordered]
+        return name in self._dict
 
     def __getitem__(self, key: Union[str, int]) -> "_EventItem":
         """if key is int: returns the n'th event that was fired
@@ -71,7 +79,9 @@ class EventDict:
 
     def count(self, name: str) -> int:
         """EventDict.count(name) -> integer -- return number of occurrences of name"""
-        return len([i.name for i in self._ordered if i.name == name])
+        if name not in self._dict:
+            return 0
+        return len(self._dict[name])
 
     def items(self) -> List:
         """EventDict.items() -> a list object providing a view on EventDict's items"""
@@ -158,28 +168,205 @@ class _EventItem:
         return list(self._ordered[0].values())
 
 
-def __get_path() -> Path:
-    return CONFIG["brownie_folder"].joinpath("data/topics.json")
+class TopicRegistry:
+
+    """Event ABIs indexed by their encoded topic.
+
+    Topics are stored in an SQLite database. New topics are written in a
+    single transaction when a contract ABI is registered, so that many
+    processes may add topics at the same time. Topics are loaded from the
+    database as they are needed, and a decoder is compiled once for each
+    topic."""
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._abis: Dict[str, Dict] = {}
+        self._decoders: Dict[str, Callable] = {}
+
+    def __repr__(self) -> str:
+        return f"<TopicRegistry object '{self._path}'>"
+
+    def __contains__(self, topic: str) -> bool:
+        return self.get(topic) is not None
+
+    def __getitem__(self, topic: str) -> Dict:
+        abi = self.get(topic)
+        if abi is None:
+            raise KeyError(topic)
+        return abi
+
+    def get(self, topic: str, default: Any = None) -> Any:
+        """Returns the event ABI for a topic, or default if it is unknown."""
+        if topic not in self._abis:
+            with self._lock:
+                row = (
+                    self._connect()
+                    .execute("SELECT abi FROM topics WHERE topic=?", (topic,))
+                    .fetchone()
+                )
+            if row is None:
+                return default
+            self._abis[topic] = json.loads(row[0])
+        return self._abis[topic]
+
+    def update(self, event_abis: Dict) -> None:
+        """Adds event ABIs, as given by eth_event.get_event_abi"""
+        new = dict((k, v) for k, v in event_abis.items() if self._abis.get(k) != v)
+        if not new:
+            return
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO topics VALUES (?, ?)",
+                    [(k, json.dumps(v, sort_keys=True)) for k, v in new.items()],
+                )
+            self._abis.update(new)
+            for topic in new:
+                self._decoders.pop(topic, None)
+
+    def get_decoder(self, topic: str) -> Callable:
+        """Returns a function that decodes a log with the given topic into the
+        format given by eth_event.decode_event"""
+        if topic not in self._decoders:
+            self._decoders[topic] = _compile_decoder(self[topic])
+        return self._decoders[topic]
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(str(self._path), timeout=30, check_same_thread=False)
+            with conn:
+                created = not conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type='table' AND name='topics'"
+                ).fetchone()
+                conn.execute("CREATE TABLE IF NOT EXISTS topics (topic TEXT PRIMARY KEY, abi TEXT)")
+                # topics were previously stored in a json file, it is imported once
+                # when the database is created
+                legacy_path = self._path.with_name("topics.json")
+                if created and legacy_path.exists():
+                    try:
+                        with legacy_path.open() as fp:
+                            topics = json.load(fp)
+                    except json.decoder.JSONDecodeError:
+                        topics = {}
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO topics VALUES (?, ?)",
+                        [(k, json.dumps(v, sort_keys=True)) for k, v in topics.items()],
+                    )
+            self._conn = conn
+        return self._conn
+
+
+def _compile_decoder(abi: Dict) -> Callable:
+    inputs = abi["inputs"]
+    data_types = [_get_type_str(i) for i in inputs if not i["indexed"]]
+    data_decoder = TupleDecoder(decoders=[registry.get_decoder(i) for i in data_types])
+    empty_data = bytes(32 * len(data_types))
+    # indexed dynamic types, arrays and tuples are hashed and cannot be decoded
+    topic_decoders = [
+        None
+        if "[" in i["type"] or i["type"] in ("bytes", "string", "tuple")
+        else registry.get_decoder(i["type"])
+        for i in inputs
+        if i["indexed"]
+    ]
+
+    def decoder(log: Dict) -> Dict:
+        try:
+            data = bytes(HexBytes(log["data"])) or empty_data
+            values = iter(data_decoder(ContextFramesBytesIO(data)))
+        except InsufficientDataBytes:
+            raise EventError("Insufficient event data")
+        except OverflowError:
+            raise EventError("Cannot decode event due to overflow error")
+        topics = iter(zip(log["topics"][1:], topic_decoders))
+        result = []
+        for i in inputs:
+            item = {"name": i["name"], "type": i["type"]}
+            if "components" in i:
+                item["components"] = i["components"]
+            result.append(item)
+            if not i["indexed"]:
+                item.update(value=_bytes_to_hex(next(values)), decoded=True)
+                continue
+            try:
+                topic, topic_decoder = next(topics)
+            except StopIteration:
+                raise EventError("Insufficient event data")
+            topic = HexBytes(topic)
+            try:
+                if topic_decoder is None:
+                    raise InsufficientDataBytes
+                value = topic_decoder(ContextFramesBytesIO(topic))
+            except (InsufficientDataBytes, OverflowError):
+                item.update(value=topic.hex(), decoded=False)
+                continue
+            item.update(value=_bytes_to_hex(value), decoded=True)
+        return {"name": abi["name"], "data": result}
+
+    return decoder
+
+
+def _bytes_to_hex(value: Any) -> Any:
+    if isinstance(value, bytes):
+        return "0x" + value.hex()
+    return value
 
 
 def _get_topics(abi: List) -> Dict:
-    new_topics = _topics.copy()
-    new_topics.update(eth_event.get_event_abi(abi))
-    if new_topics != _topics:
-        _topics.update(new_topics)
-        with __get_path().open("w") as fp:
-            json.dump(new_topics, fp, sort_keys=True, indent=2)
+    _topics.update(eth_event.get_event_abi(abi))
     return eth_event.get_topics(abi)
 
 
+def decode_logs(logs: List, raw: bool = False) -> Union["EventDict", List[None]]:
+    """Decodes a list of event logs.
+
+    Args:
+        logs: Event logs, as given in a transaction receipt
+        raw: If True, numeric arrays within the event data are returned as
+             NumPy arrays. See brownie.network.bulk.decode_raw
+
+    Returns: EventDict of decoded events."""
+    if not raw:
+        return _decode_logs(logs)
+    if not logs:
+        return []
+    return EventDict([_decode_raw_log(i) for i in logs if i["topics"]])
+
+
 def _decode_logs(logs: List) -> Union["EventDict", List[None]]:
     if not logs:
         return []
-    events = eth_event.decode_logs(logs, _topics)
-    events = [_format_event(i) for i in events]
+    events = [
+        _format_event(_topics.get_decoder(HexBytes(i["topics"][0]).hex())(i))
+        for i in logs
+        if i["topics"]
+    ]
     return EventDict(events)
 
 
+def _decode_raw_log(log: Dict, abi: Optional[Dict] = None) -> Dict:
+    if abi is None:
+        abi = _topics[HexBytes(log["topics"][0]).hex()]
+    # indexed values are decoded by eth_event, the data is decoded separately
+    indexed = [i for i in abi["inputs"] if i["indexed"]]
+    event = _format_event(
+        eth_event.decode_event({"topics": log["topics"], "data": "0x"}, {**abi, "inputs": indexed})
+    )
+    topics = iter(event["data"])
+    values = iter(decode_raw([i for i in abi["inputs"] if not i["indexed"]], log["data"]))
+    data = []
+    for i in abi["inputs"]:
+        if i["indexed"]:
+            data.append(next(topics))
+            continue
+        data.append({"name": i["name"], "type": i["type"], "value": next(values)})
+        data[-1]["decoded"] = True
+    return {"name": abi["name"], "data": data}
+
+
 def _decode_trace(trace: Sequence) -> Union["EventDict", List[None]]:
     if not trace:
         return []
@@ -188,8 +375,4 @@ def _decode_trace(trace: Sequence) -> Union["EventDict", List[None]]:
     return EventDict(events)
 
 
-try:
-    with __get_path().open() as fp:
-        _topics: Dict = json.load(fp)
-except (FileNotFoundError, json.decoder.JSONDecodeError):
-    _topics = {}
+_topics = TopicRegistry(CONFIG["brownie_folder"].joinpath("data/topics.db"))
@@ -0,0 +1,149 @@
+#!/usr/bin/python3
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+from brownie._config import CONFIG
+from brownie.convert import Wei
+
+from .rpc import _revert_register
+from .web3 import web3
+
+_active_strategy: Optional["GasStrategy"] = None
+
+
+class GasStrategy(ABC):
+
+    """Base class for gas price strategies.
+
+    Subclasses must implement _fetch_gas_price, and should increment
+    self.rpc_calls for every request made to the node."""
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.rpc_calls = 0
+        self._lock = threading.Lock()
+        _revert_register(self)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} object>"
+
+    def get_gas_price(self) -> Wei:
+        """Returns the gas price to use for a transaction, in wei."""
+        with self._lock:
+            self.requests += 1
+            return Wei(self._fetch_gas_price())
+
+    def stats(self) -> Dict:
+        """Returns a dict of {'requests', 'rpc_calls', 'saved'}, where saved is the
+        number of RPC calls avoided compared to querying eth_gasPrice per request."""
+        return {
+            "requests": self.requests,
+            "rpc_calls": self.rpc_calls,
+            "saved": self.requests - self.rpc_calls,
+        }
+
+    @abstractmethod
+    def _fetch_gas_price(self) -> int:
+        """Returns the current gas price, in wei."""
+
+    def _reset(self) -> None:
+        pass
+
+    def _revert(self, height: int) -> None:
+        self._reset()
+
+
+class NodeGasStrategy(GasStrategy):
+
+    """Uses the gas price reported by the node via eth_gasPrice. The result is
+    cached for ttl seconds."""
+
+    def __init__(self, ttl: float = 15) -> None:
+        super().__init__()
+        self.ttl = ttl
+        self._cached: Optional[Tuple[float, int]] = None
+
+    def _fetch_gas_price(self) -> int:
+        if self._cached is None or time.time() - self._cached[0] >= self.ttl:
+            self.rpc_calls += 1
+            self._cached = (time.time(), web3.eth.gasPrice)
+        return self._cached[1]
+
+    def _reset(self) -> None:
+        self._cached = None
+
+
+class PercentileGasStrategy(GasStrategy):
+
+    """Uses a percentile of the gas prices paid by transactions within a rolling
+    window of recent blocks. Only blocks that have not been seen are queried. If
+    there are no transactions within the window, falls back to eth_gasPrice."""
+
+    def __init__(self, percentile: int = 50, window: int = 20, ttl: float = 15) -> None:
+        if not 0 <= percentile <= 100:
+            raise ValueError("percentile must be between 0 and 100")
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        super().__init__()
+        self.percentile = percentile
+        self.window = window
+        self.ttl = ttl
+        self._blocks: Deque[Tuple[int, List[int]]] = deque()
+        self._cached: Optional[Tuple[float, int]] = None
+
+    def _fetch_gas_price(self) -> int:
+        if self._cached is not None and time.time() - self._cached[0] < self.ttl:
+            return self._cached[1]
+        self.rpc_calls += 1
+        height = web3.eth.blockNumber
+        start = max(height - self.window + 1, 0)
+        if self._blocks:
+            start = max(start, self._blocks[-1][0] + 1)
+        for number in range(start, height + 1):
+            self.rpc_calls += 1
+            block = web3.eth.getBlock(number, True)
+            self._blocks.append((number, [i["gasPrice"] for i in block["transactions"]]))
+        while self._blocks and self._blocks[0][0] <= height - self.window:
+            self._blocks.popleft()
+
+        prices = sorted(x for i in self._blocks for x in i[1])
+        if prices:
+            price = prices[min(len(prices) * self.percentile // 100, len(prices) - 1)]
+        else:
+            self.rpc_calls += 1
+            price = web3.eth.gasPrice
+        self._cached = (time.time(), price)
+        return price
+
+    def _reset(self) -> None:
+        self._blocks.clear()
+        self._cached = None
+
+
+STRATEGIES = {"node": NodeGasStrategy, "percentile": PercentileGasStrategy}
+
+
+def get_strategy() -> GasStrategy:
+    """Returns the active gas price strategy, creating it from the network
+    configuration if it does not exist."""
+    global _active_strategy
+    if _active_strategy is None:
+        config = dict(CONFIG["active_network"].get("gas_strategy") or {"type": "node"})
+        name = config.pop("type", "node")
+        if name not in STRATEGIES:
+            raise ValueError(f"Unknown gas strategy '{name}'")
+        _active_strategy = STRATEGIES[name](**config)
+    return _active_strategy
+
+
+def set_strategy(strategy: Optional[GasStrategy]) -> None:
+    """Sets the active gas price strategy. If None, the strategy will be created
+    from the network configuration when it is next required."""
+    global _active_strategy
+    if strategy is not None and not isinstance(strategy, GasStrategy):
+        raise TypeError("Gas strategy must be a GasStrategy instance")
+    _active_strategy = strategy
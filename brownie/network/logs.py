@@ -0,0 +1,143 @@
+#!/usr/bin/python3
+
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+from eth_abi import encode_single
+from eth_hash.auto import keccak
+
+from brownie.convert import _format_event, _format_single
+
+from .cache import LogCache
+from .event import EventDict, _compile_decoder, _decode_raw_log, _EventItem
+from .web3 import web3
+
+log_cache = LogCache()
+
+
+class ContractEvents:
+
+    """Historical event queries for a deployed contract. Each event in the
+    contract ABI is available as a ContractEvent attribute, created the first
+    time it is accessed."""
+
+    def __init__(self, address: str, abi: List, topics: Dict) -> None:
+        self._address = address
+        self._topics = topics
+        self._abis = dict(
+            (i["name"], i) for i in abi if i["type"] == "event" and not i.get("anonymous")
+        )
+        self._events: Dict[str, ContractEvent] = {}
+
+    def __repr__(self) -> str:
+        return f"<ContractEvents object '{self._address}'>"
+
+    def __getattr__(self, name: str) -> "ContractEvent":
+        if name not in self.__dict__.get("_abis", {}):
+            raise AttributeError(f"Contract has no event '{name}'")
+        return self[name]
+
+    def __getitem__(self, name: str) -> "ContractEvent":
+        if name not in self._events:
+            self._events[name] = ContractEvent(self._address, self._abis[name], self._topics[name])
+        return self._events[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._abis
+
+    def __dir__(self) -> List:
+        return sorted(set(super().__dir__()).union(self._abis))
+
+    def __iter__(self) -> Iterator:
+        return iter(self[i] for i in self._abis)
+
+    def __len__(self) -> int:
+        return len(self._abis)
+
+
+class ContractEvent:
+
+    """A single event of a deployed contract.
+
+    Attributes:
+        abi: Event ABI.
+        topic: Encoded topic of the event."""
+
+    def __init__(self, address: str, abi: Dict, topic: str) -> None:
+        self._address = address
+        self.abi = abi
+        self.topic = topic
+        self._decoder: Optional[Callable] = None
+
+    def __repr__(self) -> str:
+        inputs = ",".join(i["type"] for i in self.abi["inputs"])
+        return f"<ContractEvent object '{self.abi['name']}({inputs})'>"
+
+    def get(
+        self,
+        from_block: int,
+        to_block: Optional[int] = None,
+        filters: Optional[Dict] = None,
+        raw: bool = False,
+    ) -> Union[_EventItem, List]:
+        """Returns all occurences of the event within a range of blocks.
+
+        Logs are requested in chunks of blocks, several chunks at a time. Logs
+        at final blocks are stored on disk so that only blocks which have not
+        been queried before are requested again.
+
+        Args:
+            from_block: First block to query.
+            to_block: Last block to query, inclusive. Defaults to the latest block.
+            filters: Dict of {'indexed argument name': value}. A list of values
+                     matches any of the values.
+            raw: If True, numeric arrays within the event data are returned as
+                 NumPy arrays. See brownie.network.bulk.decode_raw
+
+        Returns: _EventItem of decoded events, in the order they were emitted."""
+        if to_block is None:
+            to_block = web3.eth.blockNumber
+        if from_block > to_block:
+            raise ValueError("from_block cannot be greater than to_block")
+        topics = self._get_filter_topics(filters or {})
+        logs = log_cache.get_logs(self._address, topics, from_block, to_block)
+        if not logs:
+            return []
+        # logs are decoded with this ABI, the topic registry may hold a different
+        # ABI with the same signature but other indexed arguments
+        if raw:
+            events = [_decode_raw_log(i, self.abi) for i in logs]
+        else:
+            if self._decoder is None:
+                self._decoder = _compile_decoder(self.abi)
+            events = [_format_event(self._decoder(i)) for i in logs]
+        return EventDict(events)[self.abi["name"]]
+
+    def _get_filter_topics(self, filters: Dict) -> List:
+        indexed = [i for i in self.abi["inputs"] if i["indexed"]]
+        for name in filters:
+            if name not in (i["name"] for i in indexed):
+                raise ValueError(f"'{self.abi['name']}' has no indexed argument '{name}'")
+        topics: List = [self.topic]
+        for abi in indexed:
+            value = filters.get(abi["name"])
+            if value is None:
+                topics.append(None)
+            elif isinstance(value, (list, tuple)):
+                topics.append([_encode_topic(abi, i) for i in value])
+            else:
+                topics.append(_encode_topic(abi, value))
+        while topics[-1] is None:
+            topics.pop()
+        return topics
+
+
+def _encode_topic(abi: Dict, value: Any) -> str:
+    type_ = abi["type"]
+    if "[" in type_ or type_ == "tuple":
+        raise ValueError(f"Cannot filter by '{abi['name']}' - indexed {type_} values are hashed")
+    value = _format_single(type_, value)
+    if type_ == "string":
+        return "0x" + keccak(value.encode()).hex()
+    if type_ == "bytes":
+        return "0x" + keccak(value).hex()
+    return "0x" + encode_single(type_, value).hex()
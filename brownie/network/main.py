@@ -5,6 +5,7 @@ from typing import Optional, Tuple, Union
 from brownie._config import CONFIG, _modify_network_config
 from brownie.convert import Wei
 
+from . import gas
 from .account import Accounts
 from .rpc import Rpc
 from .web3 import web3
@@ -21,6 +22,7 @@ def connect(network: str = None, launch_rpc: bool = True) -> None:
     Network information is retrieved from brownie-config.json"""
     if is_connected():
         raise ConnectionError(f"Already connected to network '{CONFIG['active_network']['name']}'")
+    gas.set_strategy(None)
     try:
         active = _modify_network_config(network or CONFIG["network"]["default"])
         if "host" not in active:
@@ -43,6 +45,7 @@ def connect(network: str = None, launch_rpc: bool = True) -> None:
                 rpc.launch(**active["test_rpc"])
         else:
             Accounts()._reset()
+            _load_deployments()
 
     except Exception:
         CONFIG["active_network"] = {"name": None}
@@ -55,7 +58,11 @@ def disconnect(kill_rpc: bool = True) -> None:
     if not is_connected():
         raise ConnectionError("Not connected to any network")
     CONFIG["active_network"] = {"name": None}
-    if kill_rpc and rpc.is_active():
+    gas.set_strategy(None)
+    if not rpc.is_active():
+        # contracts from a persistent network must not remain when connecting to another
+        _reset_deployments()
+    elif kill_rpc:
         if rpc.is_child():
             rpc.kill()
         else:
@@ -115,3 +122,40 @@ def gas_price(*args: Tuple[Union[int, str, bool, None]]) -> Union[int, bool]:
                 raise TypeError(f"Invalid gas price '{args[0]}'")
             CONFIG["active_network"]["gas_price"] = price
     return CONFIG["active_network"]["gas_price"]
+
+
+def gas_strategy(*args: Tuple[Union[gas.GasStrategy, str, None]]) -> gas.GasStrategy:
+    """Gets and optionally sets the gas price strategy.
+
+    The strategy is used to determine the gas price when no default gas price
+    has been set.
+
+    * If a GasStrategy instance is given, it becomes the active strategy.
+    * If a string is given, the named strategy is created with default settings.
+    * If set to None, the strategy is created from the network configuration."""
+    if not is_connected():
+        raise ConnectionError("Not connected to any network")
+    if args:
+        strategy = args[0]
+        if isinstance(strategy, str):
+            if strategy not in gas.STRATEGIES:
+                raise ValueError(f"Unknown gas strategy '{strategy}'")
+            strategy = gas.STRATEGIES[strategy]()
+        gas.set_strategy(strategy)  # type: ignore
+    return gas.get_strategy()
+
+
+def _load_deployments() -> None:
+    # imported here to avoid a circular import
+    from brownie.project.main import get_loaded_projects
+
+    for project in get_loaded_projects():
+        project._load_deployments()
+
+
+def _reset_deployments() -> None:
+    from brownie.project.main import get_loaded_projects
+
+    for project in get_loaded_projects():
+        for container in project:
+            container._reset()
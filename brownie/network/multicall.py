@@ -0,0 +1,169 @@
+#!/usr/bin/python3
+
+from typing import Any, Iterator, List, Optional, Tuple
+
+import eth_abi
+from eth_hash.auto import keccak
+from hexbytes import HexBytes
+
+from brownie._config import CONFIG
+from brownie._singleton import _Singleton
+from brownie.exceptions import ContractNotFound, VirtualMachineError
+
+from .rpc import Rpc, _revert_register
+from .web3 import _resolve_address, web3
+
+rpc = Rpc()
+
+_SIGNATURE = "0x" + keccak(b"tryAggregate(bool,(address,bytes)[])")[:4].hex()
+_INPUT_TYPES = ["bool", "(address,bytes)[]"]
+_OUTPUT_TYPES = ["(bool,bytes)[]"]
+
+
+class _Aggregator(metaclass=_Singleton):
+
+    """Tracks the multicall aggregator deployed on the local test RPC via
+    deploy_aggregator."""
+
+    def __init__(self) -> None:
+        self.address: Optional[str] = None
+        self.height = 0
+        _revert_register(self)
+
+    def get_address(self) -> str:
+        address = CONFIG["active_network"].get("multicall_address")
+        if address:
+            return _resolve_address(address)
+        if self.address is None:
+            raise ContractNotFound(
+                "No multicall aggregator on this network, set 'multicall_address' in the"
+                " network configuration or deploy one with deploy_aggregator()"
+            )
+        return self.address
+
+    def deploy(self, account: Any) -> Any:
+        if not rpc.is_active():
+            raise SystemError(
+                "The aggregator can only be deployed on a local test RPC, set"
+                " 'multicall_address' in the network configuration instead"
+            )
+        # imported here to avoid a circular import
+        from brownie.project import compile_source
+
+        source = CONFIG["brownie_folder"].joinpath("data/contracts/Multicall.sol").read_text()
+        container = compile_source(source, evm_version=rpc.evm_version()).Multicall  # type: ignore
+        contract = account.deploy(container)
+        self.address = contract.address
+        self.height = web3.eth.blockNumber
+        return contract
+
+    def _reset(self) -> None:
+        self.address = None
+
+    def _revert(self, height: int) -> None:
+        if height < self.height:
+            self.address = None
+
+
+class Multicall:
+
+    """Collects contract calls so they can be sent as a single call to an
+    aggregator contract.
+
+    Calls are sent when the context manager exits. Results are then available
+    via Multicall.results, in the order the calls were added."""
+
+    def __init__(
+        self, address: Optional[str] = None, chunk_size: int = 100, require_success: bool = True
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.address = _resolve_address(address) if address else None
+        self.chunk_size = chunk_size
+        self.require_success = require_success
+        self.results: List = []
+        self._pending: List[Tuple[Any, str]] = []
+
+    def __enter__(self) -> "Multicall":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        if exc_type is None:
+            self.execute()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def __iter__(self) -> Iterator:
+        return iter(self.results)
+
+    def add(self, fn: Any, *args: Tuple) -> int:
+        """Adds a contract call to the multicall.
+
+        Args:
+            fn: ContractCall or ContractTx instance.
+            *args: Contract method inputs. Calls are made by the aggregator,
+                   so a dictionary of transaction properties cannot be given.
+
+        Returns:
+            Index of the result within Multicall.results"""
+        if args and isinstance(args[-1], dict):
+            raise ValueError(
+                "Cannot set transaction properties in a multicall, calls are always"
+                " made from the aggregator contract"
+            )
+        self._pending.append((fn, fn.encode_input(*args)))
+        return len(self._pending) - 1
+
+    def execute(self) -> List:
+        """Sends all pending calls and returns the decoded results.
+
+        When require_success is False, the result of each failed call is None."""
+        pending, self._pending = self._pending, []
+        if not pending:
+            self.results = []
+            return []
+        address = self.address or _Aggregator().get_address()
+        results = []
+        for i in range(0, len(pending), self.chunk_size):
+            chunk = pending[i : i + self.chunk_size]
+            for (fn, _), (success, data) in zip(chunk, self._aggregate(address, chunk)):
+                results.append(fn.decode_output(data) if success else None)
+        self.results = results
+        return results
+
+    def _aggregate(self, address: str, chunk: List[Tuple[Any, str]]) -> List:
+        calls = [(fn._address, HexBytes(data)) for fn, data in chunk]
+        data = _SIGNATURE + eth_abi.encode_abi(_INPUT_TYPES, [self.require_success, calls]).hex()
+        try:
+            response = web3.eth.call({"to": address, "data": data})
+        except ValueError as e:
+            raise VirtualMachineError(e) from None
+        return eth_abi.decode_abi(_OUTPUT_TYPES, HexBytes(response))[0]
+
+
+def multicall(
+    address: Optional[str] = None, chunk_size: int = 100, require_success: bool = True
+) -> Multicall:
+    """Returns a Multicall object, used as a context manager to aggregate many
+    contract calls into as few eth_call requests as possible.
+
+    Args:
+        address: Address of the aggregator contract. If None, the
+                 'multicall_address' network setting is used, or on a local
+                 test RPC the aggregator from deploy_aggregator.
+        chunk_size: Maximum number of calls to aggregate in a single request.
+        require_success: If False, failed calls return None instead of raising."""
+    return Multicall(address, chunk_size, require_success)
+
+
+def deploy_aggregator(account: Any) -> Any:
+    """Deploys the multicall aggregator bundled with Brownie to the local test
+    RPC. It is used by multicall and ContractCall.call_many until the RPC is
+    reset, or reverted to before the deployment.
+
+    Args:
+        account: Account to deploy the aggregator from.
+
+    Returns: ProjectContract instance of the aggregator."""
+    return _Aggregator().deploy(account)
@@ -1,5 +1,6 @@
 #!/usr/bin/python3
 
+import threading
 from typing import Any, Dict, Iterator, List
 
 from brownie._singleton import _Singleton
@@ -8,16 +9,20 @@ from brownie.convert import to_address
 from .rpc import _revert_register
 
 _contract_map: Dict = {}
+_contract_lock = threading.RLock()
 
 
 class TxHistory(metaclass=_Singleton):
 
     """List-like singleton container that contains TransactionReceipt objects.
     Whenever a transaction is broadcast, the TransactionReceipt is automatically
-    added to this container."""
+    added to this container.
+
+    Methods that modify the container are thread safe."""
 
     def __init__(self) -> None:
         self._list: List = []
+        self._lock = threading.Lock()
         self.gas_profile: Dict = {}
         _revert_register(self)
 
@@ -40,16 +45,20 @@ class TxHistory(metaclass=_Singleton):
         return len(self._list)
 
     def _reset(self) -> None:
-        self._list.clear()
+        with self._lock:
+            self._list.clear()
 
     def _revert(self, height: int) -> None:
-        self._list = [i for i in self._list if i.block_number <= height]
+        with self._lock:
+            self._list = [i for i in self._list if i.block_number <= height]
 
     def _add_tx(self, tx: Any) -> None:
-        self._list.append(tx)
+        with self._lock:
+            self._list.append(tx)
 
     def clear(self) -> None:
-        self._list.clear()
+        with self._lock:
+            self._list.clear()
 
     def copy(self) -> List:
         """Returns a shallow copy of the object as a list"""
@@ -68,23 +77,24 @@ class TxHistory(metaclass=_Singleton):
         return [i for i in self._list if i.receiver == account or i.sender == account]
 
     def _gas(self, fn_name: str, gas_used: int) -> None:
-        if fn_name not in self.gas_profile:
-            self.gas_profile[fn_name] = {
-                "avg": gas_used,
-                "high": gas_used,
-                "low": gas_used,
-                "count": 1,
-            }
-            return
-        gas = self.gas_profile[fn_name]
-        gas.update(
-            {
-                "avg": (gas["avg"] * gas["count"] + gas_used) // (gas["count"] + 1),
-                "high": max(gas["high"], gas_used),
-                "low": min(gas["low"], gas_used),
-            }
-        )
-        gas["count"] += 1
+        with self._lock:
+            if fn_name not in self.gas_profile:
+                self.gas_profile[fn_name] = {
+                    "avg": gas_used,
+                    "high": gas_used,
+                    "low": gas_used,
+                    "count": 1,
+                }
+                return
+            gas = self.gas_profile[fn_name]
+            gas.update(
+                {
+                    "avg": (gas["avg"] * gas["count"] + gas_used) // (gas["count"] + 1),
+                    "high": max(gas["high"], gas_used),
+                    "low": min(gas["low"], gas_used),
+                }
+            )
+            gas["count"] += 1
 
 
 def _find_contract(address: Any) -> Any:
@@ -95,15 +105,19 @@ def _find_contract(address: Any) -> Any:
 
 
 def _get_current_dependencies() -> List:
-    dependencies = set(v._name for v in _contract_map.values())
-    for contract in _contract_map.values():
+    with _contract_lock:
+        contracts = list(_contract_map.values())
+    dependencies = set(v._name for v in contracts)
+    for contract in contracts:
         dependencies.update(contract._build["dependencies"])
     return sorted(dependencies)
 
 
 def _add_contract(contract: Any) -> None:
-    _contract_map[contract.address] = contract
+    with _contract_lock:
+        _contract_map[contract.address] = contract
 
 
 def _remove_contract(contract: Any) -> None:
-    del _contract_map[contract.address]
+    with _contract_lock:
+        del _contract_map[contract.address]
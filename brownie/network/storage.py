@@ -0,0 +1,84 @@
+#!/usr/bin/python3
+
+from typing import Any, Dict, List, Optional
+
+from hexbytes import HexBytes
+
+from brownie.convert import _format_single
+
+from .batch import Batch
+
+
+class ContractStorage:
+
+    """Reads the state variables of a deployed contract directly from storage,
+    using the storage layout generated when the contract was compiled. This
+    includes variables that have no public getter.
+
+    Attributes:
+        layout: List of dicts describing the storage location of each variable."""
+
+    def __init__(self, address: str, layout: List) -> None:
+        self._address = address
+        self.layout = layout
+
+    def __repr__(self) -> str:
+        return f"<ContractStorage object '{self._address}'>"
+
+    def read_all(self, block: Any = "latest") -> Dict:
+        """Reads the value of every state variable that is stored in place.
+
+        All required slots are requested in a single batch of eth_getStorageAt
+        calls. Variables that are mappings, arrays, structs, bytes or strings
+        are not included.
+
+        Args:
+            block: Block number to read the state at.
+
+        Returns: Dict of {'variable name': value}"""
+        variables = [(i, _get_abi_type(i)) for i in self.layout]
+        variables = [i for i in variables if i[1] is not None]
+        slots = sorted(set(i["slot"] for i, _ in variables))
+        if isinstance(block, int):
+            block = hex(block)
+        with Batch() as batch:
+            for slot in slots:
+                batch.request("eth_getStorageAt", [self._address, hex(slot), block], _to_bytes32)
+        values = dict(zip(slots, batch.results))
+
+        result: Dict = {}
+        for item, abi_type in variables:
+            end = 32 - item["offset"]
+            data = values[item["slot"]][end - item["numberOfBytes"] : end]
+            name = item["label"]
+            if name in result:
+                # a private variable in a base contract may share a name
+                name = f"{item['contract']}.{name}"
+            result[name] = _decode(abi_type, data)  # type: ignore
+        return result
+
+
+def _get_abi_type(item: Dict) -> Optional[str]:
+    # returns the ABI type used to decode a variable, or None if it is not a value type
+    type_str = item["type"]
+    if item["encoding"] != "inplace" or "[" in type_str:
+        return None
+    if type_str.startswith(("address", "contract ")):
+        return "address"
+    if type_str.startswith("enum "):
+        return f"uint{item['numberOfBytes'] * 8}"
+    if type_str.startswith(("uint", "int", "bytes", "bool")):
+        return type_str
+    return None
+
+
+def _decode(abi_type: str, data: bytes) -> Any:
+    if abi_type.startswith("bytes"):
+        return _format_single(abi_type, data)
+    if abi_type == "address":
+        return _format_single(abi_type, "0x" + data.hex())
+    return _format_single(abi_type, int.from_bytes(data, "big", signed=abi_type[0] == "i"))
+
+
+def _to_bytes32(value: str) -> bytes:
+    return bytes(HexBytes(value)).rjust(32, b"\x00")
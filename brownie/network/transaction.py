@@ -1,5 +1,6 @@
 #!/usr/bin/python3
 
+import asyncio
 import threading
 import time
 from hashlib import sha1
@@ -19,11 +20,14 @@ from brownie.project.sources import highlight_source
 from brownie.test import coverage
 from brownie.utils import color
 
+from . import aio
+from .cache import CallCache
 from .event import _decode_logs, _decode_trace
 from .state import TxHistory, _find_contract
 from .web3 import web3
 
 history = TxHistory()
+call_cache = CallCache()
 
 
 def trace_property(fn: Callable) -> Any:
@@ -81,6 +85,8 @@ class TransactionReceipt:
         "_return_value",
         "_revert_msg",
         "_revert_pc",
+        "_revert_type",
+        "_silent",
         "_trace",
         "block_number",
         "contract_address",
@@ -108,6 +114,7 @@ class TransactionReceipt:
         silent: bool = False,
         name: str = "",
         revert_data: Optional[Tuple] = None,
+        blocking: bool = True,
     ) -> None:
         """Instantiates a new TransactionReceipt object.
 
@@ -117,12 +124,15 @@ class TransactionReceipt:
             silent: toggles console verbosity
             name: contract function being called
             revert_data: (revert string, program counter, revert type)
+            blocking: if False, returns immediately and the transaction is
+                      confirmed by awaiting TransactionReceipt.wait()
         """
         if isinstance(txid, bytes):
             txid = txid.hex()
         if not silent:
             print(f"{color['key']}Transaction sent{color}: {color['value']}{txid}{color}")
         history._add_tx(self)
+        call_cache.clear()
 
         self._raw_trace = None
         self._trace = None
@@ -136,21 +146,25 @@ class TransactionReceipt:
         self.status = -1
         self.txid = txid
         self.fn_name = name
+        self._silent = silent
 
         if name and "." in name:
             self.contract_name, self.fn_name = name.split(".", maxsplit=1)
 
         # avoid querying the trace to get the revert string if possible
-        revert_msg, self._revert_pc, revert_type = revert_data or (None, None, None)
+        revert_msg, self._revert_pc, self._revert_type = revert_data or (None, None, None)
         if revert_msg:
             # revert message was returned
             self._revert_msg = revert_msg
-        elif revert_type == "revert":
+        elif self._revert_type == "revert":
             # check for dev revert string as a comment
             revert_msg = build._get_dev_revert(self._revert_pc)
             if isinstance(revert_msg, str):
                 self._revert_msg = revert_msg
 
+        if not blocking:
+            return
+
         # threaded to allow impatient users to ctrl-c to stop waiting in the console
         confirm_thread = threading.Thread(
             target=self._await_confirmation, args=(silent,), daemon=True
@@ -160,18 +174,7 @@ class TransactionReceipt:
             confirm_thread.join()
             if ARGV["cli"] == "console":
                 return
-            # if coverage evaluation is active, evaluate the trace
-            if ARGV["coverage"] and not coverage._check_cached(self.coverage_hash) and self.trace:
-                self._expand_trace()
-            if not self.status:
-                if revert_msg is None:
-                    # no revert message and unable to check dev string - have to get trace
-                    self._expand_trace()
-                # raise from a new function to reduce pytest traceback length
-                _raise(
-                    f"{revert_type} {self.revert_msg or ''}",
-                    self._traceback_string() if ARGV["revert"] else self._error_string(1),
-                )
+            self._evaluate_confirmed()
         except KeyboardInterrupt:
             if ARGV["cli"] != "console":
                 raise
@@ -193,6 +196,9 @@ class TransactionReceipt:
     def events(self) -> Optional[List]:
         if not self.status:
             self._get_trace()
+        elif self._events is None:
+            # logs are only decoded when they are first accessed
+            self._events = _decode_logs(self.logs)
         return self._events
 
     @trace_property
@@ -223,6 +229,48 @@ class TransactionReceipt:
             self._expand_trace()
         return self._trace
 
+    async def wait(self, poll_interval: float = 0.1) -> "TransactionReceipt":
+        """Awaits confirmation of the transaction without blocking the event loop.
+
+        Args:
+            poll_interval: Seconds to wait between queries to the node.
+
+        Returns:
+            This TransactionReceipt."""
+        if not self._confirmed.is_set():
+            tx = await aio.get_transaction(self.txid)
+            while tx is None:
+                await asyncio.sleep(poll_interval)
+                tx = await aio.get_transaction(self.txid)
+            self._set_from_tx(tx)
+            receipt = await aio.get_transaction_receipt(self.txid)
+            while receipt is None:
+                await asyncio.sleep(poll_interval)
+                receipt = await aio.get_transaction_receipt(self.txid)
+            if not self._confirmed.is_set():
+                call_cache.clear()
+                self._set_from_receipt(receipt)
+                self._confirmed.set()
+                if not self._silent:
+                    print(self._confirm_output())
+        if ARGV["cli"] != "console":
+            self._evaluate_confirmed()
+        return self
+
+    def _evaluate_confirmed(self) -> None:
+        # if coverage evaluation is active, evaluate the trace
+        if ARGV["coverage"] and not coverage._check_cached(self.coverage_hash) and self.trace:
+            self._expand_trace()
+        if not self.status:
+            if self._revert_msg is None:
+                # no revert message and unable to check dev string - have to get trace
+                self._expand_trace()
+            # raise from a new function to reduce pytest traceback length
+            _raise(
+                f"{self._revert_type} {self.revert_msg or ''}",
+                self._traceback_string() if ARGV["revert"] else self._error_string(1),
+            )
+
     def _await_confirmation(self, silent: bool) -> None:
         # await tx showing in mempool
         while True:
@@ -243,6 +291,7 @@ class TransactionReceipt:
 
         # await confirmation
         receipt = web3.eth.waitForTransactionReceipt(self.txid, None)
+        call_cache.clear()
         self._set_from_receipt(receipt)
         self._confirmed.set()
         if not silent:
@@ -279,8 +328,6 @@ class TransactionReceipt:
         )
         self.coverage_hash = sha1(base.encode()).hexdigest()
 
-        if self.status:
-            self._events = _decode_logs(receipt["logs"])
         if self.fn_name:
             history._gas(self._full_name(), receipt["gasUsed"])
 
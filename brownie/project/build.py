@@ -16,6 +16,7 @@ BUILD_KEYS = [
     "deployedBytecode",
     "deployedSourceMap",
     "dependencies",
+    "linkReferences",
     "offset",
     "opcodes",
     "pcMap",
@@ -23,6 +24,7 @@ BUILD_KEYS = [
     "source",
     "sourceMap",
     "sourcePath",
+    "storageLayout",
     "type",
 ]
 
@@ -267,6 +267,7 @@ def generate_build_json(
     source_nodes = solcast.from_standard_output(deepcopy(output_json))
     statement_nodes = _get_statement_nodes(source_nodes)
     branch_nodes = _get_branch_nodes(source_nodes)
+    ast_nodes = _get_ast_nodes(output_json)
 
     for path, contract_name in [(k, v) for k in path_list for v in output_json["contracts"][k]]:
 
@@ -276,6 +277,7 @@ def generate_build_json(
         abi = output_json["contracts"][path][contract_name]["abi"]
         evm = output_json["contracts"][path][contract_name]["evm"]
         bytecode = _format_link_references(evm)
+        link_references = _get_link_references(evm)
         hash_ = sources.get_hash(input_json["sources"][path]["content"], contract_name, minified)
         node = next(i[contract_name] for i in source_nodes if i.absolutePath == path)
         paths = sorted(
@@ -303,6 +305,7 @@ def generate_build_json(
             "deployedBytecode": evm["deployedBytecode"]["object"],
             "deployedSourceMap": evm["deployedBytecode"]["sourceMap"],
             "dependencies": [i.name for i in node.dependencies],
+            "linkReferences": link_references,
             # 'networks': {},
             "offset": node.offset,
             "opcodes": evm["deployedBytecode"]["opcodes"],
@@ -311,6 +314,7 @@ def generate_build_json(
             "source": input_json["sources"][path]["content"],
             "sourceMap": evm["bytecode"]["sourceMap"],
             "sourcePath": path,
+            "storageLayout": _get_storage_layout(ast_nodes[node.id], ast_nodes),
             "type": node.contractKind,
         }
 
@@ -320,13 +324,153 @@ def generate_build_json(
     return build_json
 
 
-def _format_link_references(evm: Dict) -> Dict:
+def _format_link_references(evm: Dict) -> str:
     # Standardizes formatting for unlinked libraries within bytecode
-    bytecode = evm["bytecode"]["object"]
-    references = [(k, x) for v in evm["bytecode"]["linkReferences"].values() for k, x in v.items()]
-    for n, loc in [(i[0], x["start"] * 2) for i in references for x in i[1]]:
-        bytecode = f"{bytecode[:loc]}__{n[:36]:_<36}__{bytecode[loc+40:]}"
-    return bytecode
+    references = _get_link_references(evm)
+    placeholders = dict((k, f"__{k[:36]:_<36}__") for k in references)
+    return link_bytecode(evm["bytecode"]["object"], references, placeholders)
+
+
+def _get_link_references(evm: Dict) -> Dict:
+    # Returns {'library name': [offset, ..]}, where offsets are the positions of
+    # each library address within the bytecode hexstring
+    references: Dict = {}
+    for source in evm["bytecode"]["linkReferences"].values():
+        for name, locations in source.items():
+            references.setdefault(name, []).extend(i["start"] * 2 for i in locations)
+    return dict((k, sorted(v)) for k, v in references.items())
+
+
+def link_bytecode(bytecode: str, references: Dict, addresses: Dict) -> str:
+    """Inserts library addresses into bytecode.
+
+    Args:
+        bytecode: Bytecode hexstring
+        references: Link references as given in the build json,
+                    {'library name': [offset, ..]}
+        addresses: Dictionary of {'library name': "address or placeholder"}
+
+    Returns: Linked bytecode hexstring"""
+    offsets = sorted((x, addresses[k]) for k, v in references.items() for x in v)
+    parts = []
+    last = 0
+    for offset, address in offsets:
+        parts += [bytecode[last:offset], address[-40:]]
+        last = offset + 40
+    parts.append(bytecode[last:])
+    return "".join(parts)
+
+
+def _get_ast_nodes(output_json: Dict) -> Dict:
+    # Returns {'node id': node} for every contract, struct and enum definition
+    ast_nodes = {}
+    for source in output_json["sources"].values():
+        for node in source["ast"]["nodes"]:
+            ast_nodes[node["id"]] = node
+            if node["nodeType"] == "ContractDefinition":
+                ast_nodes.update((i["id"], i) for i in node["nodes"])
+    return ast_nodes
+
+
+def _get_storage_layout(contract_node: Dict, ast_nodes: Dict) -> List:
+    # Returns the storage location of each state variable, following the
+    # layout rules of the solidity compiler
+    variables = []
+    for node_id in contract_node["linearizedBaseContracts"][::-1]:
+        base = ast_nodes[node_id]
+        variables.extend(
+            (base["name"], i)
+            for i in base["nodes"]
+            if i["nodeType"] == "VariableDeclaration"
+            and not i.get("constant")
+            and i.get("mutability", "mutable") == "mutable"
+        )
+    positions, _ = _get_storage_positions([i[1] for i in variables], ast_nodes)
+    layout = []
+    for (contract_name, node), (slot, offset, size) in zip(variables, positions):
+        type_name = node["typeName"]
+        type_str = type_name["typeDescriptions"]["typeString"]
+        if type_name["nodeType"] == "Mapping":
+            encoding = "mapping"
+        elif type_name["nodeType"] == "ArrayTypeName" and not type_name.get("length"):
+            encoding = "dynamic_array"
+        elif type_str.split()[0] in ("bytes", "string"):
+            encoding = "bytes"
+        else:
+            encoding = "inplace"
+        layout.append(
+            {
+                "label": node["name"],
+                "contract": contract_name,
+                "slot": slot,
+                "offset": offset,
+                "numberOfBytes": size,
+                "type": re.sub(r" (storage|memory|calldata) (ref|pointer)$", "", type_str),
+                "encoding": encoding,
+            }
+        )
+    return layout
+
+
+def _get_storage_positions(variables: List, ast_nodes: Dict) -> Tuple[List, int]:
+    # Returns a list of (slot, offset, size) for each variable declaration, and
+    # the total number of slots used. Value types smaller than 32 bytes are packed
+    # into a single slot, structs and static arrays always begin a new slot.
+    positions = []
+    slot = offset = 0
+    for node in variables:
+        size, packed = _get_storage_size(node["typeName"], ast_nodes)
+        if offset and (offset + size > 32 or not packed):
+            slot += 1
+            offset = 0
+        positions.append((slot, offset, size))
+        if packed:
+            offset += size
+        else:
+            slot += size // 32
+            offset = 0
+    return positions, slot + (1 if offset else 0)
+
+
+def _get_storage_size(type_name: Dict, ast_nodes: Dict) -> Tuple[int, bool]:
+    # Returns the number of bytes a type occupies in storage, and a boolean
+    # indicating if it may be packed together with other values
+    node_type = type_name["nodeType"]
+    if node_type == "Mapping":
+        return 32, True
+    if node_type == "FunctionTypeName":
+        return (24 if type_name["visibility"] == "external" else 8), True
+    if node_type == "ArrayTypeName":
+        type_str = type_name["typeDescriptions"]["typeString"].split(" storage")[0]
+        length = re.search(r"\[(\d*)\]$", type_str).group(1)  # type: ignore
+        if not length:
+            return 32, True
+        size, packed = _get_storage_size(type_name["baseType"], ast_nodes)
+        if packed:
+            per_slot = 32 // size
+            return -(-int(length) // per_slot) * 32, False
+        return int(length) * size, False
+    if node_type == "UserDefinedTypeName":
+        node = ast_nodes[type_name["referencedDeclaration"]]
+        if node["nodeType"] == "EnumDefinition":
+            return max(1, -(-(len(node["members"]) - 1).bit_length() // 8)), True
+        if node["nodeType"] == "StructDefinition":
+            return _get_storage_positions(node["members"], ast_nodes)[1] * 32, False
+        return 20, True
+    # elementary types
+    type_str = type_name["typeDescriptions"]["typeString"].split()[0]
+    if type_str == "bool":
+        return 1, True
+    if type_str == "address":
+        return 20, True
+    if type_str in ("bytes", "string"):
+        return 32, True
+    bits = re.search(r"\d+", type_str)
+    if bits is None:
+        return 32, True
+    if type_str.startswith("bytes"):
+        return int(bits.group()), True
+    return int(bits.group()) // 8, True
 
 
 def _get_bytecode_hash(bytecode: Dict) -> str:
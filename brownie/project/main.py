@@ -1,12 +1,17 @@
 #!/usr/bin/python3
 
 import json
+import os
 import shutil
 import sys
+import tempfile
+import threading
+import time
 import zipfile
+from contextlib import contextmanager
 from io import BytesIO
 from pathlib import Path
-from typing import Any, Dict, Iterator, KeysView, List, Optional, Set, Union
+from typing import Any, Dict, Generator, Iterator, KeysView, List, Optional, Set, Union
 
 import requests
 
@@ -16,18 +21,35 @@ from brownie._config import (
     _load_project_compiler_config,
     _load_project_config,
 )
-from brownie.exceptions import ProjectAlreadyLoaded, ProjectNotFound
+from brownie.exceptions import (
+    ContractExists,
+    ContractNotFound,
+    ProjectAlreadyLoaded,
+    ProjectNotFound,
+)
 from brownie.network.contract import ContractContainer
+from brownie.network.rpc import Rpc
+from brownie.network.web3 import web3
 from brownie.project import compiler
 from brownie.project.build import BUILD_KEYS, Build
 from brownie.project.sources import Sources, get_hash
 from brownie.utils import color
 
-FOLDERS = ["contracts", "scripts", "reports", "tests", "build", "build/contracts"]
+FOLDERS = [
+    "contracts",
+    "scripts",
+    "reports",
+    "tests",
+    "build",
+    "build/contracts",
+    "build/deployments",
+]
 MIXES_URL = "https://github.com/brownie-mix/{}-mix/archive/master.zip"
 
 _loaded_projects = []
 
+rpc = Rpc()
+
 
 class _ProjectBase:
     def __init__(self, name: str, contract_sources: Dict, project_path: Optional[Path]) -> None:
@@ -35,6 +57,7 @@ class _ProjectBase:
         self._name = name
         self._sources = Sources(contract_sources)
         self._build = Build(self._sources)
+        self._deployment_lock = threading.Lock()
 
     def _compile(self, sources: Dict, compiler_config: Dict, silent: bool) -> None:
         build_json = compiler.compile_and_format(
@@ -62,6 +85,63 @@ class _ProjectBase:
                 self._containers[key] = container
                 setattr(self, container._name, container)
 
+    def _get_deployment_path(self) -> Optional[Path]:
+        # deployments are only recorded for projects on a persistent network
+        if self._project_path is None or rpc.is_active() or not web3.isConnected():
+            return None
+        filename = f"{_get_chain_id()}-{web3.genesis_hash}.json"
+        return self._project_path.joinpath("build/deployments").joinpath(filename)
+
+    def _load_deployments(self) -> None:
+        # adds previously deployed contracts to their containers, if the bytecode is unchanged
+        path = self._get_deployment_path()
+        if path is None or not path.exists():
+            return
+        with path.open() as fp:
+            manifest = json.load(fp)
+        for name, deployments in manifest["contracts"].items():
+            if name not in self._containers:
+                continue
+            container = self._containers[name]
+            for data in deployments:
+                if data["bytecodeSha1"] != container._build["bytecodeSha1"]:
+                    continue
+                try:
+                    container._add_from_manifest(data["address"], data["blockNumber"])
+                except (ContractExists, ContractNotFound):
+                    continue
+
+    def _add_deployment(self, contract: Any) -> None:
+        # records a deployed contract in the deployment manifest for the active network
+        path = self._get_deployment_path()
+        if path is None:
+            return
+        # the file lock prevents other processes from writing the manifest at the same time
+        with self._deployment_lock, _lock_file(path):
+            if path.exists():
+                with path.open() as fp:
+                    manifest = json.load(fp)
+            else:
+                manifest = {
+                    "chainId": _get_chain_id(),
+                    "genesisHash": web3.genesis_hash,
+                    "contracts": {},
+                }
+            manifest["contracts"].setdefault(contract._name, []).append(
+                {
+                    "address": contract.address,
+                    "blockNumber": contract.tx.block_number,
+                    "bytecodeSha1": contract._build["bytecodeSha1"],
+                    "txid": contract.tx.txid,
+                }
+            )
+            # the manifest is replaced atomically, so it is never left partly written
+            with tempfile.NamedTemporaryFile(
+                "w", dir=str(path.parent), suffix=".tmp", delete=False
+            ) as fp:
+                json.dump(manifest, fp, sort_keys=True, indent=2)
+            os.replace(fp.name, str(path))
+
     def __getitem__(self, key: str) -> ContractContainer:
         return self._containers[key]
 
@@ -138,6 +218,7 @@ class Project(_ProjectBase):
         self._compiler_config["version"] = solc_version
         self._compile(changed, self._compiler_config, False)
         self._create_containers()
+        self._load_deployments()
 
         # add project to namespaces, apply import blackmagic
         name = self._name
@@ -366,6 +447,38 @@ def load(project_path: Union[Path, str, None] = None, name: Optional[str] = None
     return Project(name, project_path)
 
 
+def _get_chain_id() -> int:
+    try:
+        return int(web3.eth.chainId)
+    except ValueError:
+        # eth_chainId is not available on older clients
+        return int(web3.net.version)
+
+
+@contextmanager
+def _lock_file(path: Path, timeout: int = 30) -> Generator:
+    # holds a lock on a file shared between processes, by creating a .lock file beside it.
+    # a lock older than the timeout was left behind by a process that died, and is removed
+    lock_path = path.with_name(f"{path.name}.lock")
+    lock_path.parent.mkdir(exist_ok=True)
+    while True:
+        try:
+            os.close(os.open(str(lock_path), os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            break
+        except FileExistsError:
+            try:
+                if time.time() - lock_path.stat().st_mtime > timeout:
+                    lock_path.unlink()
+                    continue
+            except FileNotFoundError:
+                continue
+            time.sleep(0.05)
+    try:
+        yield
+    finally:
+        lock_path.unlink()
+
+
 def _create_folders(project_path: Path) -> None:
     for path in [i for i in FOLDERS]:
         project_path.joinpath(path).mkdir(exist_ok=True)
@@ -0,0 +1,23 @@
+#!/usr/bin/python3
+
+import pytest
+
+from brownie.convert import EthAddress
+
+addr = "0x14b0Ed2a7C4cC60DD8F676AE44D0831d3c9b2a9E"
+
+
+def test_eq():
+    assert EthAddress(addr) == addr
+    assert EthAddress(addr) == addr.lower()
+    assert EthAddress(addr) == EthAddress(addr.upper()[2:])
+    assert EthAddress(addr) != "0x" + "00" * 20
+
+
+def test_invalid_comparison():
+    with pytest.raises(TypeError):
+        EthAddress(addr) == "potato"
+    with pytest.raises(TypeError):
+        EthAddress(addr) == addr[:-1]
+    with pytest.raises(TypeError):
+        EthAddress(addr) == addr[2:]
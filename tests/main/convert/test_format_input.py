@@ -2,7 +2,7 @@
 
 import pytest
 
-from brownie.convert import _format_input
+from brownie.convert import _format_input, _get_formatter
 
 abi = {
     "inputs": [
@@ -44,3 +44,30 @@ def test_wrong_length_nested_array():
 def test_non_sequence():
     with pytest.raises(TypeError):
         _format_input(abi, ["123", (1,), ([1, 1], [2, 2]), "0xff"])
+
+
+def test_tuple_array():
+    tuple_abi = {
+        "inputs": [
+            {
+                "name": "values",
+                "type": "tuple[]",
+                "components": [{"name": "a", "type": "uint8"}, {"name": "b", "type": "bool"}],
+            }
+        ],
+        "name": "tupleFunction",
+    }
+    result = _format_input(tuple_abi, [[(1, True), (2, 0)]])
+    assert result == [[(1, True), (2, False)]]
+    assert result[0][1].dict() == {"a": 2, "b": False}
+
+
+def test_error_message():
+    with pytest.raises(OverflowError, match="testFunction argument #1: '\\(256,\\)'"):
+        _format_input(abi, [(1, 2, 3), (256,), ([1, 1], [2, 2]), "0xff"])
+
+
+def test_formatter_cached():
+    formatter = _get_formatter(abi["inputs"])
+    assert _get_formatter([i.copy() for i in abi["inputs"]]) is formatter
+    assert _get_formatter(abi["inputs"][:2]) is not formatter
@@ -1,5 +1,7 @@
 #!/usr/bin/python3
 
+import pickle
+
 import pytest
 
 from brownie.convert import EthAddress, HexString, ReturnValue, Wei
@@ -11,12 +13,12 @@ def return_value(accounts, tester):
 
 
 def test_type(return_value):
-    assert type(return_value) is ReturnValue
+    assert isinstance(return_value, ReturnValue)
     assert type(return_value["_addr"]) is EthAddress
     assert type(return_value["_bool"]) is ReturnValue
     assert type(return_value["_bool"][0]) is bool
     assert type(return_value["_num"]) is Wei
-    assert type(return_value["_bytes"]) is ReturnValue
+    assert isinstance(return_value["_bytes"], ReturnValue)
     assert type(return_value["_bytes"][0][0]) is HexString
 
 
@@ -85,11 +87,30 @@ def test_getitem(accounts, return_value):
 def test_getitem_slice(accounts, return_value):
     s = return_value[1:3]
     assert s == [[False, False, False], accounts[2]]
-    assert type(s) is ReturnValue
+    assert isinstance(s, ReturnValue)
     assert s[0] == s["_bool"]
     assert "_num" not in s
 
 
+def test_getattr(accounts, return_value):
+    assert return_value._addr == accounts[2]
+    assert return_value._num == return_value[0]
+    assert return_value.count(88) == 1
+
+
+def test_class_reused(accounts, tester, return_value):
+    other = tester.manyValues(1, [True, True, True], accounts[1], [])
+    assert type(other) is type(return_value)
+    assert type(other) is not ReturnValue
+
+
+def test_pickle():
+    value = ReturnValue([1, (2, 3)], [{"name": "a"}, {"name": "b"}])
+    result = pickle.loads(pickle.dumps(value))
+    assert result == value
+    assert result.dict() == {"a": 1, "b": (2, 3)}
+
+
 def test_ethaddress_typeerror():
     e = EthAddress("0x0063046686E46Dc6F15918b61AE2B121458534a5")
     with pytest.raises(TypeError):
@@ -2,7 +2,7 @@
 
 import pytest
 
-from brownie.convert import to_address
+from brownie.convert import EthAddress, checksum_cache_stats, to_address
 
 addr = "0x14b0Ed2a7C4cC60DD8F676AE44D0831d3c9b2a9E"
 addr_encoded = b"\x14\xb0\xed*|L\xc6\r\xd8\xf6v\xaeD\xd0\x83\x1d<\x9b*\x9e"
@@ -26,3 +26,18 @@ def test_wrong_length():
         to_address(addr[:20])
     with pytest.raises(ValueError):
         to_address(addr + "00")
+
+
+def test_eth_address():
+    result = to_address(EthAddress(addr))
+    assert result == addr
+    assert type(result) is str
+
+
+def test_cache_stats():
+    to_address(addr)
+    stats = checksum_cache_stats()
+    to_address(addr.lower())
+    to_address(addr_encoded)
+    assert checksum_cache_stats()["hits"] == stats["hits"] + 2
+    assert checksum_cache_stats()["size"] == stats["size"]
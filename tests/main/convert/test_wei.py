@@ -64,3 +64,10 @@ def test_gt():
 def test_ge():
     assert Wei("2 ether") >= "1 ether"
     assert Wei("2 ether") >= "2 ether"
+
+
+def test_compare_int():
+    assert Wei("1 ether") == 10 ** 18
+    assert Wei("1 ether") > Wei("1 gwei")
+    assert type(Wei(1) + 1) is Wei
+    assert Wei(3) - Wei(1) == 2
@@ -0,0 +1,63 @@
+#!/usr/bin/python3
+
+import pytest
+
+from brownie.convert import Wei, WeiArray
+
+np = pytest.importorskip("numpy")
+
+
+def test_init():
+    values = WeiArray(["1 ether", 2 ** 255, "0.5 gwei", None, Wei(3), b"\xff"])
+    assert values.tolist() == [10 ** 18, 2 ** 255, 500000000, 0, 3, 255]
+
+
+def test_init_numpy():
+    assert WeiArray(np.array([1, 2], dtype=">u8")).tolist() == [1, 2]
+    assert WeiArray(np.array([8.3e32, 1.0])).tolist() == [830000000000000000000000000000000, 1]
+
+
+def test_getitem():
+    values = WeiArray([1, 2, 3])
+    assert type(values[0]) is Wei
+    assert values[np.int64(2)] == 3
+    assert values[1:].tolist() == [2, 3]
+    assert values[values > 1].tolist() == [2, 3]
+    assert list(values) == [1, 2, 3]
+
+
+def test_arithmetic():
+    values = WeiArray(["1 ether", "2 ether"])
+    assert (values + "1 gwei").tolist() == [10 ** 18 + 10 ** 9, 2 * 10 ** 18 + 10 ** 9]
+    assert (values - [1, 2]).tolist() == [10 ** 18 - 1, 2 * 10 ** 18 - 2]
+    assert ("3 ether" - values).tolist() == [2 * 10 ** 18, 10 ** 18]
+    assert (np.array([1, 1]) + values).tolist() == [10 ** 18 + 1, 2 * 10 ** 18 + 1]
+    assert (-values).tolist() == [-(10 ** 18), -2 * 10 ** 18]
+
+
+def test_exact():
+    values = WeiArray([2 ** 256 - 1, 2 ** 256 - 1])
+    assert values.sum() == 2 ** 257 - 2
+    assert type(values.sum()) is Wei
+    assert (values - 1).tolist() == [2 ** 256 - 2, 2 ** 256 - 2]
+
+
+def test_compare():
+    values = WeiArray(["1 ether", "2 ether", "3 ether"])
+    assert (values > "1.5 ether").tolist() == [False, True, True]
+    assert (values == ["1 ether", 0, "3 ether"]).tolist() == [True, False, True]
+    assert (values <= WeiArray(["1 ether"] * 3)).tolist() == [True, False, False]
+
+
+def test_length_mismatch():
+    with pytest.raises(ValueError):
+        WeiArray([1, 2, 3]) + [1, 2]
+
+
+def test_to_numpy():
+    values = WeiArray([1, 2 ** 100])
+    assert values.to_numpy().dtype == object
+    assert np.asarray(values).tolist() == [1, 2 ** 100]
+    assert values[:1].to_numpy(np.uint64).dtype == np.uint64
+    with pytest.raises(OverflowError):
+        values.to_numpy(np.uint64)
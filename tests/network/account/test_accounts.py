@@ -30,6 +30,39 @@ def test_contains(accounts):
     assert 12345 not in accounts
 
 
+def test_from_mnemonic(accounts):
+    # ganache is launched with the mnemonic "brownie"
+    expected = [i.address for i in accounts]
+    accounts.clear()
+    local = accounts.from_mnemonic("brownie", count=10)
+    assert [i.address for i in local] == expected
+    assert type(local[0]) is LocalAccount
+    assert len(accounts) == 10
+
+
+def test_from_mnemonic_offset(accounts):
+    expected = accounts[3].address
+    account = accounts.from_mnemonic("brownie", offset=3)
+    assert account.address == expected
+    assert len(accounts) == 10
+
+
+def test_from_mnemonic_pool(accounts, monkeypatch):
+    single = accounts.from_mnemonic("potato", count=4)
+    accounts.clear()
+    monkeypatch.setattr("brownie.network.account._POOL_THRESHOLD", 1)
+    monkeypatch.setattr("brownie.network.account._mnemonic_cache", {})
+    monkeypatch.setattr("os.cpu_count", lambda: 2)
+    pooled = accounts.from_mnemonic("potato", count=4)
+    assert [i.address for i in single] == [i.address for i in pooled]
+
+
+def test_public_key(devnetwork, accounts):
+    local = accounts.add(priv_key)
+    assert local.public_key.to_checksum_address() == addr
+    assert accounts.from_mnemonic("potato").public_key.to_checksum_address() == accounts[-1]
+
+
 def test_add(devnetwork, accounts):
     assert len(accounts) == 10
     local = accounts.add()
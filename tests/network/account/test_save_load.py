@@ -63,3 +63,34 @@ def test_load_not_exists(accounts, tmpdir):
         accounts.load(tmpdir + "/temp.json")
     with pytest.raises(FileNotFoundError):
         accounts.load("temp")
+
+
+def test_load_many(accounts, tmpdir):
+    a = accounts.add(priv_key)
+    b = accounts.add()
+    a.save(tmpdir + "/a.json")
+    b.save(tmpdir + "/b.json")
+    accounts._reset()
+    loaded = accounts.load_many([tmpdir + "/b.json", tmpdir + "/a.json"], "", silent=True)
+    assert [i.address for i in loaded] == [b.address, addr]
+    assert a in accounts and b in accounts
+
+
+def test_load_many_password_callable(accounts, tmpdir):
+    a = accounts.add(priv_key)
+    a.save(tmpdir + "/a.json")
+    accounts._reset()
+    calls = []
+
+    def password(path):
+        calls.append(path.name)
+        return ""
+
+    loaded = accounts.load_many([tmpdir + "/a.json"], password, silent=True)
+    assert calls == ["a.json"]
+    assert loaded[0].address == addr
+
+
+def test_load_many_not_exists(accounts, tmpdir):
+    with pytest.raises(FileNotFoundError):
+        accounts.load_many([tmpdir + "/temp.json"], "")
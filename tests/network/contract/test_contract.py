@@ -3,9 +3,11 @@
 from copy import deepcopy
 
 import pytest
+from eth_hash.auto import keccak
 
 from brownie import Wei
 from brownie.exceptions import ContractExists, ContractNotFound
+from brownie.network import contract
 from brownie.network.contract import (
     Contract,
     ContractCall,
@@ -75,6 +77,87 @@ def test_overloaded(testproject, tester, build):
     repr(fn)
 
 
+def test_get_method(tester):
+    for name, sig in tester.signatures.items():
+        assert tester.get_method(sig + "00" * 32) == name
+    assert tester.get_method("0xffffffff") is None
+
+
+def test_get_method_overloaded(testproject, tester, build):
+    build["abi"].append(
+        {
+            "constant": False,
+            "inputs": [{"name": "_to", "type": "address"}],
+            "name": "revertStrings",
+            "outputs": [{"name": "", "type": "bool"}],
+            "payable": False,
+            "stateMutability": "nonpayable",
+            "type": "function",
+        }
+    )
+    del testproject.BrownieTester[0]
+    c = Contract(None, tester.address, build["abi"])
+    for fn in c.revertStrings.methods.values():
+        assert c.get_method(fn.signature) == "revertStrings"
+
+
+def test_selectors_shared(testproject, tester, build):
+    assert tester.selectors is testproject.BrownieTester.selectors
+    del testproject.BrownieTester[0]
+    c = Contract(None, tester.address, build["abi"])
+    assert c.selectors is tester.selectors
+
+
+def test_methods_created_on_access(testproject, tester, build):
+    del testproject.BrownieTester[0]
+    c = Contract(None, tester.address, build["abi"])
+    assert "getTuple" not in c.__dict__
+    assert "getTuple" in dir(c)
+    assert c.getTuple is c.getTuple
+    assert "getTuple" in c.__dict__
+    with pytest.raises(AttributeError):
+        c.potato
+
+
+def test_abi_table_not_serialized_again(tester, monkeypatch):
+    table = contract._get_abi_table(tester.abi)
+    monkeypatch.setattr(contract.json, "dumps", None)
+    assert contract._get_abi_table(tester.abi) is table
+
+
+def test_abi_table_changed_in_place(tester):
+    abi = deepcopy(tester.abi)
+    table = contract._get_abi_table(abi)
+    abi.append(
+        {
+            "constant": True,
+            "inputs": [],
+            "name": "potato",
+            "outputs": [{"name": "", "type": "uint256"}],
+            "payable": False,
+            "stateMutability": "view",
+            "type": "function",
+        }
+    )
+    new_table = contract._get_abi_table(abi)
+    assert "potato" not in table["methods"]
+    assert "potato" in new_table["methods"]
+    assert "0x" + keccak(b"potato()")[:4].hex() in new_table["selectors"]
+
+
+def test_deployment_skips_getcode(BrownieTester, accounts, web3, monkeypatch):
+    monkeypatch.setattr(web3.eth, "getCode", None)
+    c = BrownieTester.deploy(True, {"from": accounts[0]})
+    monkeypatch.undo()
+    assert c.bytecode == web3.eth.getCode(c.address).hex()[2:]
+
+
+def test_bytecode_shared(BrownieTester, accounts):
+    a = BrownieTester.deploy(True, {"from": accounts[0]})
+    b = BrownieTester.deploy(True, {"from": accounts[0]})
+    assert a.bytecode is b.bytecode
+
+
 def test_set_methods(tester):
     for item in tester.abi:
         if item["type"] != "function":
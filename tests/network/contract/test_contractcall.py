@@ -1,5 +1,9 @@
 #!/usr/bin/python3
 
+import sys
+
+import pytest
+
 
 def test_attributes(accounts, tester):
     assert tester.getTuple._address == tester.address
@@ -40,3 +44,9 @@ def test_tuples(tester, accounts):
     value = ["blahblah", accounts[1], ["yesyesyes", "0x1234"]]
     tester.setTuple(value)
     assert tester.getTuple(accounts[1], {"from": accounts[0]}) == value
+
+
+def test_decode_output_raw_without_numpy(tester, monkeypatch):
+    monkeypatch.setitem(sys.modules, "numpy", None)
+    with pytest.raises(ImportError, match="pip install numpy"):
+        tester.owner.decode_output("0x" + "00" * 32, raw=True)
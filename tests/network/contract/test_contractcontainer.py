@@ -63,3 +63,32 @@ def test_load_unload_project(BrownieTester, testproject, rpc, accounts):
     assert len(BrownieTester) == 0
     testproject.load()
     assert testproject.BrownieTester != BrownieTester
+
+
+def test_revert_skips_getcode(BrownieTester, accounts, rpc, web3, monkeypatch):
+    BrownieTester.deploy(True, {"from": accounts[0]})
+    rpc.snapshot()
+    BrownieTester.deploy(True, {"from": accounts[0]})
+    monkeypatch.setattr(web3.eth, "getCode", None)
+    rpc.revert()
+    assert len(BrownieTester) == 1
+
+
+def test_revert_at_unknown_height(BrownieTester, accounts, rpc):
+    rpc.snapshot()
+    t = BrownieTester.deploy(True, {"from": accounts[0]})
+    BrownieTester.remove(t)
+    BrownieTester.at(t.address)
+    assert BrownieTester[0]._height is None
+    rpc.revert()
+    assert len(BrownieTester) == 0
+
+
+def test_contains_address(BrownieTester, accounts):
+    t = BrownieTester.deploy(True, {"from": accounts[0]})
+    assert t.address in BrownieTester
+    assert t.address.lower() in BrownieTester
+    assert accounts[0].address not in BrownieTester
+    assert "potato" not in BrownieTester
+    BrownieTester.remove(t.address)
+    assert t not in BrownieTester
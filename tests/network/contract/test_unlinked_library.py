@@ -3,6 +3,7 @@
 import pytest
 
 from brownie.exceptions import UndeployedLibrary
+from brownie.network import DeploymentPlan
 
 
 def test_unlinked_library(accounts, librarytester):
@@ -21,3 +22,19 @@ def test_multiple_projects(accounts, librarytester, librarytester2):
     contract = accounts[0].deploy(librarytester["Unlinked"])
     assert lib.address[2:].lower() in contract.bytecode
     assert lib2.address[2:].lower() not in contract.bytecode
+
+
+def test_library_redeployed(accounts, librarytester):
+    accounts[0].deploy(librarytester["TestLib"])
+    accounts[0].deploy(librarytester["Unlinked"])
+    lib = accounts[0].deploy(librarytester["TestLib"])
+    contract = accounts[0].deploy(librarytester["Unlinked"])
+    assert lib.address[2:].lower() in contract.bytecode
+
+
+def test_deployment_plan(accounts, librarytester):
+    plan = DeploymentPlan(accounts[0])
+    plan.add(librarytester["Unlinked"])
+    plan.add(librarytester["TestLib"])
+    result = plan.execute()
+    assert result["TestLib"].address[2:].lower() in result["Unlinked"].bytecode
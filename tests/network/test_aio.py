@@ -0,0 +1,134 @@
+#!/usr/bin/python3
+
+import asyncio
+import threading
+
+import pytest
+
+from brownie.exceptions import VirtualMachineError
+from brownie.network import aio
+
+
+def run(coroutine):
+    return asyncio.get_event_loop().run_until_complete(coroutine)
+
+
+def test_transport(devnetwork):
+    assert type(aio.get_transport()) is aio.WebsocketTransport
+    assert aio.get_transport() is aio.get_transport()
+
+
+def test_not_connected(network):
+    with pytest.raises(ConnectionError):
+        aio.get_transport()
+
+
+def test_call_async(tester, accounts):
+    assert run(tester.owner.call_async()) == tester.owner()
+    assert run(tester.getTuple.call_async(accounts[0])) == tester.getTuple(accounts[0])
+
+
+def test_call_async_reverts(tester):
+    with pytest.raises(VirtualMachineError):
+        run(tester.revertStrings.call_async(0))
+
+
+def test_transfer_async(accounts):
+    balance = accounts[1].balance()
+    tx = run(accounts[0].transfer_async(accounts[1], 1000))
+    assert tx.status == -1
+    assert run(tx.wait()) is tx
+    assert tx.status == 1
+    assert accounts[1].balance() == balance + 1000
+
+
+def test_concurrent_transfers(accounts):
+    async def main():
+        txs = await asyncio.gather(
+            *[accounts[i % 3].transfer_async(accounts[9], 100) for i in range(12)]
+        )
+        return await asyncio.gather(*[i.wait() for i in txs])
+
+    txs = run(main())
+    assert [i.status for i in txs] == [1] * 12
+    for i in range(3):
+        assert sorted(x.nonce for x in txs if x.sender == accounts[i]) == list(range(4))
+
+
+def test_sync_and_async_transfers(accounts):
+    async def main():
+        txs = await asyncio.gather(
+            *[accounts[0].transfer_async(accounts[9], 100) for i in range(4)]
+        )
+        return await asyncio.gather(*[i.wait() for i in txs])
+
+    nonce = accounts[0].nonce
+    threads = [
+        threading.Thread(target=accounts[0].transfer, args=(accounts[9], 100)) for i in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    run(main())
+    for thread in threads:
+        thread.join()
+    assert accounts[0].nonce == nonce + 8
+
+
+def test_gas_price_not_in_loop(accounts, monkeypatch):
+    gas_price = accounts[0]._gas_price
+    threads = []
+    monkeypatch.setattr(
+        accounts[0], "_gas_price", lambda: threads.append(threading.current_thread()) or gas_price()
+    )
+    tx = run(accounts[0].transfer_async(accounts[1], 100))
+    run(tx.wait())
+    assert threads and threads[0] is not threading.main_thread()
+
+
+def test_transport_is_abstract():
+    with pytest.raises(TypeError):
+        aio.AsyncTransport()
+
+
+def test_local_account(accounts):
+    local = accounts.add()
+    accounts[0].transfer(local, "1 ether")
+    tx = run(local.transfer_async(accounts[0], "0.5 ether"))
+    run(tx.wait())
+    assert tx.status == 1
+    assert tx.sender == local
+
+
+def test_transfer_async_reverts(accounts, tester, console_mode):
+    tx = run(accounts[0].transfer_async(tester, 0, data=tester.revertStrings.encode_input(5)))
+    run(tx.wait())
+    assert tx.status == 1
+    data = tester.revertStrings.encode_input(0)
+    tx = run(accounts[0].transfer_async(tester, 0, data=data))
+    run(tx.wait())
+    assert tx.status == 0
+    assert tx.revert_msg == "zero"
+
+
+def test_cancel_while_locked(accounts):
+    locked = threading.Event()
+    release = threading.Event()
+
+    def hold_lock():
+        with accounts[0]._lock:
+            locked.set()
+            release.wait()
+
+    thread = threading.Thread(target=hold_lock)
+    thread.start()
+    locked.wait()
+    try:
+        with pytest.raises(asyncio.TimeoutError):
+            run(asyncio.wait_for(accounts[0].transfer_async(accounts[1], 100), 2))
+    finally:
+        release.set()
+        thread.join()
+    assert not accounts[0]._lock.locked()
+    assert accounts[0].transfer(accounts[1], 100).status == 1
+    tx = run(accounts[0].transfer_async(accounts[1], 100))
+    assert run(tx.wait()).status == 1
@@ -0,0 +1,99 @@
+#!/usr/bin/python3
+
+import pytest
+import requests
+
+from brownie.convert import Wei
+from brownie.exceptions import RPCRequestError
+
+
+@pytest.fixture
+def post_count(monkeypatch):
+    count = [0]
+    post = requests.post
+
+    def counter(*args, **kwargs):
+        count[0] += 1
+        return post(*args, **kwargs)
+
+    monkeypatch.setattr("brownie.network.batch.requests.post", counter)
+    yield count
+
+
+def test_balances(accounts, post_count):
+    accounts[0].transfer(accounts[1], "1 ether")
+    balances = accounts.balances()
+    assert balances == [i.balance() for i in accounts]
+    assert type(balances[0]) is Wei
+    assert post_count[0] == 1
+
+
+def test_nonces(accounts, post_count):
+    accounts[0].transfer(accounts[1], "1 ether")
+    accounts[0].transfer(accounts[1], "1 ether")
+    nonces = accounts.nonces()
+    assert nonces == [i.nonce for i in accounts]
+    assert nonces[:2] == [2, 0]
+    assert post_count[0] == 1
+
+
+def test_batch_order(devnetwork, accounts, tester):
+    with devnetwork.batch() as batch:
+        batch.balance(tester)
+        batch.nonce(accounts[0])
+        batch.balance(accounts[2])
+    assert batch.results == [tester.balance(), accounts[0].nonce, accounts[2].balance()]
+
+
+def test_chunks(devnetwork, accounts, post_count):
+    with devnetwork.batch(chunk_size=3) as batch:
+        for account in accounts:
+            batch.balance(account)
+    assert len(batch.results) == 10
+    assert post_count[0] == 4
+
+
+def test_generic_request(devnetwork, web3):
+    with devnetwork.batch() as batch:
+        batch.request("eth_blockNumber", [], lambda k: int(k, 16))
+    assert batch.results == [web3.eth.blockNumber]
+
+
+def test_error(devnetwork):
+    with pytest.raises(RPCRequestError):
+        with devnetwork.batch() as batch:
+            batch.request("eth_potato", [])
+
+
+def test_not_connected(network):
+    with pytest.raises(ConnectionError):
+        with network.batch() as batch:
+            batch.request("eth_blockNumber", [])
+
+
+class _Response:
+    def __init__(self, data):
+        self.data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.data
+
+
+def test_batch_rejected(devnetwork, monkeypatch):
+    response = _Response({"jsonrpc": "2.0", "id": None, "error": {"message": "batch too large"}})
+    monkeypatch.setattr("brownie.network.batch.requests.post", lambda *a, **k: response)
+    with pytest.raises(RPCRequestError, match="batch too large"):
+        with devnetwork.batch() as batch:
+            batch.request("eth_blockNumber", [])
+
+
+def test_missing_response(devnetwork, monkeypatch):
+    response = _Response([{"jsonrpc": "2.0", "id": 0, "result": "0x1"}])
+    monkeypatch.setattr("brownie.network.batch.requests.post", lambda *a, **k: response)
+    with pytest.raises(RPCRequestError):
+        with devnetwork.batch() as batch:
+            batch.request("eth_blockNumber", [])
+            batch.request("eth_blockNumber", [])
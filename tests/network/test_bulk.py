@@ -0,0 +1,82 @@
+#!/usr/bin/python3
+
+import pytest
+from eth_abi import encode_abi
+from eth_abi.exceptions import InsufficientDataBytes
+
+from brownie.network.bulk import decode_raw
+
+np = pytest.importorskip("numpy")
+
+
+def _params(*types):
+    return [{"name": f"v{c}", "type": i} for c, i in enumerate(types)]
+
+
+def test_small_uint():
+    data = encode_abi(["uint8[]", "uint24[]", "uint64[2]"], [[1, 255], [70000], [2 ** 64 - 1, 0]])
+    result = decode_raw(_params("uint8[]", "uint24[]", "uint64[2]"), data)
+    assert result[0].dtype == np.dtype(">u1")
+    assert result[1].dtype == np.dtype(">u4")
+    assert result[0].tolist() == [1, 255]
+    assert result[1].tolist() == [70000]
+    assert result[2].tolist() == [2 ** 64 - 1, 0]
+
+
+def test_signed():
+    data = encode_abi(["int16[]", "int128[]"], [[-32768, 1], [-(2 ** 127), 2 ** 127 - 1]])
+    result = decode_raw(_params("int16[]", "int128[]"), data)
+    assert result[0].tolist() == [-32768, 1]
+    assert result[1].dtype == object
+    assert result[1].tolist() == [-(2 ** 127), 2 ** 127 - 1]
+
+
+def test_large_uint():
+    data = encode_abi(["uint256[]"], [[2 ** 256 - 1, 3]])
+    result = decode_raw(_params("uint256[]"), data)[0]
+    assert result.dtype == object
+    assert result.sum() == 2 ** 256 + 2
+
+
+def test_address_and_bytes():
+    addresses = ["0x" + "ab" * 19 + "00", "0x" + "01" * 20]
+    types = ["address[]", "bytes32[]", "bytes4[]"]
+    data = encode_abi(types, [addresses, [b"\xff" * 32], [b"abcd"]])
+    result = decode_raw(_params(*types), data)
+    assert result[0].shape == (2, 20)
+    assert ["0x" + i.tobytes().hex() for i in result[0]] == addresses
+    assert result[1].shape == (1, 32)
+    assert result[2].tobytes() == b"abcd"
+
+
+def test_zero_copy():
+    data = encode_abi(["uint32[]"], [[1, 2, 3]])
+    result = decode_raw(_params("uint32[]"), data)[0]
+    assert not result.flags.owndata
+    assert not result.flags.writeable
+
+
+def test_empty_array():
+    data = encode_abi(["uint8[]", "address[]"], [[], []])
+    result = decode_raw(_params("uint8[]", "address[]"), data)
+    assert result[0].shape == (0,)
+    assert result[1].shape == (0, 20)
+
+
+def test_other_values_formatted():
+    abi = _params("string", "uint8[]", "uint256", "uint32[2][]")
+    abi.append({"name": "t", "type": "tuple", "components": _params("bool", "bytes")})
+    types = ["string", "uint8[]", "uint256", "uint32[2][]", "(bool,bytes)"]
+    data = encode_abi(types, ["potato", [1, 2], 31337, [[1, 2], [3, 4]], (True, b"\x12")])
+    result = decode_raw(abi, data)
+    assert result["v0"] == "potato"
+    assert result["v1"].tolist() == [1, 2]
+    assert result["v2"] == "31337 wei"
+    assert result["v3"] == [[1, 2], [3, 4]]
+    assert result["t"] == (True, "0x12")
+
+
+def test_insufficient_data():
+    data = encode_abi(["uint8[]"], [[1, 2, 3]])
+    with pytest.raises(InsufficientDataBytes):
+        decode_raw(_params("uint8[]"), data[:-32])
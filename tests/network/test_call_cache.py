@@ -0,0 +1,94 @@
+#!/usr/bin/python3
+
+import pytest
+
+from brownie.network import call_cache
+
+
+@pytest.fixture
+def cache():
+    call_cache.enable()
+    call_cache.hits = 0
+    call_cache.misses = 0
+    yield call_cache
+    call_cache.disable()
+
+
+def test_disabled_by_default(tester):
+    assert not call_cache.is_enabled()
+    tester.owner()
+    tester.owner()
+    assert len(call_cache) == 0
+
+
+def test_cache_hit(cache, tester):
+    owner = tester.owner()
+    assert tester.owner() == owner
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+    assert len(cache) == 1
+
+
+def test_different_args(cache, tester, accounts):
+    tester.getTuple(accounts[0])
+    tester.getTuple(accounts[1])
+    assert cache.stats()["misses"] == 2
+    assert cache.stats()["hits"] == 0
+
+
+def test_cleared_on_transaction(cache, tester, accounts):
+    tester.owner()
+    accounts[0].transfer(accounts[1], 1000)
+    assert len(cache) == 0
+    tester.owner()
+    assert cache.stats()["misses"] == 2
+
+
+def test_state_change_visible(cache, tester, accounts):
+    value = ["blahblah", accounts[1], ["yesyesyes", "0x1234"]]
+    tester.setTuple(value)
+    tester.getTuple(accounts[1])
+    value[0] = "potato"
+    tester.setTuple(value)
+    assert tester.getTuple(accounts[1])[0] == "potato"
+
+
+def test_cleared_on_mine(cache, tester, rpc):
+    tester.owner()
+    rpc.mine()
+    tester.owner()
+    assert cache.stats()["hits"] == 0
+
+
+def test_cleared_on_revert(cache, tester, rpc):
+    rpc.snapshot()
+    tester.owner()
+    rpc.revert()
+    assert len(cache) == 0
+
+
+def test_cleared_on_reset(cache, tester, rpc):
+    tester.owner()
+    rpc.reset()
+    assert len(cache) == 0
+
+
+def test_max_size(cache, tester, accounts):
+    cache.enable(max_size=2)
+    for i in range(4):
+        tester.getTuple(accounts[i])
+    assert len(cache) == 2
+    tester.getTuple(accounts[3])
+    assert cache.stats()["hits"] == 1
+
+
+def test_invalid_max_size():
+    with pytest.raises(ValueError):
+        call_cache.enable(max_size=0)
+
+
+def test_disable_clears(cache, tester):
+    tester.owner()
+    cache.disable()
+    assert len(cache) == 0
+    assert not cache.is_enabled()
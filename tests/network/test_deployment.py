@@ -0,0 +1,92 @@
+#!/usr/bin/python3
+
+import pytest
+
+from brownie import compile_source
+from brownie.exceptions import VirtualMachineError
+from brownie.network import DeploymentPlan
+
+
+def test_deploy(BrownieTester, ExternalCallTester, accounts):
+    plan = DeploymentPlan(accounts[0])
+    plan.add(BrownieTester, True)
+    plan.add(ExternalCallTester)
+    result = plan.execute()
+    assert result["BrownieTester"] == BrownieTester[-1]
+    assert result["ExternalCallTester"] == ExternalCallTester[-1]
+    assert result["BrownieTester"].owner() == accounts[0]
+
+
+def test_nonces_assigned_in_order(BrownieTester, accounts, history):
+    nonce = accounts[0].nonce
+    plan = DeploymentPlan(accounts[0])
+    for i in range(3):
+        plan.add(BrownieTester, True, name=f"tester{i}")
+    plan.execute()
+    assert sorted(i.nonce for i in history[-3:]) == [nonce, nonce + 1, nonce + 2]
+    assert len(BrownieTester) == 3
+
+
+def test_dependency_as_argument(ExternalCallTester, accounts):
+    source = """pragma solidity ^0.5.0;
+contract Holder {
+    address public target;
+    constructor(address _target) public { target = _target; }
+}"""
+    Holder = compile_source(source).Holder
+    plan = DeploymentPlan(accounts[0])
+    ext = plan.add(ExternalCallTester)
+    holder = plan.add(Holder, ext)
+    plan.execute()
+    assert ext.tx.block_number < holder.tx.block_number
+    assert holder.contract.target() == ext.contract.address
+
+
+def test_depends_on(BrownieTester, ExternalCallTester, accounts):
+    plan = DeploymentPlan(accounts[0])
+    ext = plan.add(ExternalCallTester)
+    tester = plan.add(BrownieTester, True, depends_on=[ext])
+    plan.execute()
+    assert ext.tx.block_number < tester.tx.block_number
+
+
+def test_tx_dict(BrownieTester, accounts):
+    plan = DeploymentPlan()
+    with pytest.raises(AttributeError):
+        plan.add(BrownieTester, True)
+    plan.add(BrownieTester, True, {"from": accounts[1]})
+    assert plan.execute()["BrownieTester"].owner() == accounts[1]
+
+
+def test_duplicate_name(BrownieTester, accounts):
+    plan = DeploymentPlan(accounts[0])
+    plan.add(BrownieTester, True)
+    with pytest.raises(ValueError):
+        plan.add(BrownieTester, True)
+
+
+def test_unknown_dependency(BrownieTester, accounts):
+    plan = DeploymentPlan(accounts[0])
+    plan.add(BrownieTester, True, depends_on=["potato"])
+    with pytest.raises(ValueError):
+        plan.execute()
+
+
+def test_circular_dependency(BrownieTester, ExternalCallTester, accounts, history):
+    plan = DeploymentPlan(accounts[0])
+    plan.add(BrownieTester, True, depends_on=["ExternalCallTester"])
+    plan.add(ExternalCallTester, depends_on=["BrownieTester"])
+    with pytest.raises(ValueError):
+        plan.execute()
+    assert not history
+
+
+def test_failed_deployment(BrownieTester, ExternalCallTester, accounts, config):
+    config["active_network"]["reverting_tx_gas_limit"] = 1000000
+    plan = DeploymentPlan(accounts[0])
+    failed = plan.add(BrownieTester, False)
+    plan.add(ExternalCallTester, depends_on=[failed])
+    with pytest.raises(VirtualMachineError):
+        plan.execute()
+    assert plan["ExternalCallTester"].tx is None
+    assert not len(ExternalCallTester)
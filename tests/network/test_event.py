@@ -39,6 +39,26 @@ def test_equality(event):
     assert event[0] != event[-1]
 
 
+def test_decoded_on_access(tester):
+    tx = tester.emitEvents("foo bar", 42)
+    assert tx._events is None
+    assert tx.events is tx.events
+    assert len(tx.events) == 3
+
+
+def test_grouping():
+    names = ["A", "B", "A", "C", "A"]
+    events = [{"name": i, "data": [{"name": "x", "value": c}]} for c, i in enumerate(names)]
+    event = EventDict(events)
+    assert event.keys() == ["A", "B", "C"]
+    assert event["A"].pos == (0, 2, 4)
+    assert [i["x"] for i in event["A"]] == [0, 2, 4]
+    assert event.count("A") == 3
+    assert event.count("D") == 0
+    assert "C" in event
+    assert "D" not in event
+
+
 def test_pos(event):
     assert event[0].pos == (0,)
     assert event["Debug"].pos == (0, 2)
@@ -0,0 +1,102 @@
+#!/usr/bin/python3
+
+import pytest
+
+from brownie import network
+from brownie.network.gas import GasStrategy, NodeGasStrategy, PercentileGasStrategy
+
+
+def test_default_strategy(devnetwork):
+    strategy = devnetwork.gas_strategy()
+    assert type(strategy) is NodeGasStrategy
+    assert devnetwork.gas_strategy() is strategy
+
+
+def test_strategy_from_config(network, config):
+    config["network"]["settings"]["gas_strategy"] = {"type": "percentile", "window": 5}
+    network.connect("development")
+    strategy = network.gas_strategy()
+    assert type(strategy) is PercentileGasStrategy
+    assert strategy.window == 5
+
+
+def test_strategy_is_abstract():
+    with pytest.raises(TypeError):
+        GasStrategy()
+
+
+def test_unknown_strategy(devnetwork):
+    with pytest.raises(ValueError):
+        devnetwork.gas_strategy("potato")
+
+
+def test_set_strategy(devnetwork):
+    strategy = PercentileGasStrategy()
+    assert devnetwork.gas_strategy(strategy) is strategy
+    assert type(devnetwork.gas_strategy("node")) is NodeGasStrategy
+    assert type(devnetwork.gas_strategy(None)) is NodeGasStrategy
+
+
+def test_node_caches(devnetwork, web3):
+    strategy = devnetwork.gas_strategy(NodeGasStrategy(ttl=1000))
+    for i in range(5):
+        assert strategy.get_gas_price() == web3.eth.gasPrice
+    assert strategy.stats() == {"requests": 5, "rpc_calls": 1, "saved": 4}
+
+
+def test_node_ttl(devnetwork):
+    strategy = devnetwork.gas_strategy(NodeGasStrategy(ttl=0))
+    strategy.get_gas_price()
+    strategy.get_gas_price()
+    assert strategy.rpc_calls == 2
+
+
+def test_transfer_uses_strategy(accounts):
+    strategy = NodeGasStrategy(ttl=1000)
+    network.gas_strategy(strategy)
+    for i in range(3):
+        accounts[0].transfer(accounts[1], 100)
+    assert strategy.stats()["requests"] == 3
+    assert strategy.rpc_calls == 1
+
+
+def test_gas_price_overrides_strategy(accounts, config):
+    strategy = network.gas_strategy()
+    config["active_network"]["gas_price"] = 10 ** 9
+    tx = accounts[0].transfer(accounts[1], 100)
+    assert tx.gas_price == 10 ** 9
+    assert strategy.requests == 0
+
+
+def test_percentile(accounts):
+    for i in range(1, 5):
+        accounts[0].transfer(accounts[1], 100, gas_price=i * 10 ** 9)
+    strategy = PercentileGasStrategy(percentile=50, window=10, ttl=0)
+    assert strategy.get_gas_price() == 3 * 10 ** 9
+    strategy.percentile = 0
+    assert strategy.get_gas_price() == 10 ** 9
+
+
+def test_percentile_incremental(accounts):
+    strategy = PercentileGasStrategy(window=10, ttl=0)
+    strategy.get_gas_price()
+    calls = strategy.rpc_calls
+    accounts[0].transfer(accounts[1], 100, gas_price=10 ** 9)
+    assert strategy.get_gas_price() == 10 ** 9
+    # one call for the block number and one for the new block
+    assert strategy.rpc_calls == calls + 2
+
+
+def test_percentile_window(accounts, rpc):
+    accounts[0].transfer(accounts[1], 100, gas_price=10 ** 9)
+    strategy = PercentileGasStrategy(window=2, ttl=0)
+    rpc.mine(2)
+    accounts[0].transfer(accounts[1], 100, gas_price=5 * 10 ** 9)
+    assert strategy.get_gas_price() == 5 * 10 ** 9
+
+
+def test_percentile_invalid():
+    with pytest.raises(ValueError):
+        PercentileGasStrategy(percentile=101)
+    with pytest.raises(ValueError):
+        PercentileGasStrategy(window=0)
@@ -0,0 +1,86 @@
+#!/usr/bin/python3
+
+import pytest
+
+from brownie.network.contract import historical_cache
+
+
+@pytest.fixture
+def history_db(tmp_path, monkeypatch):
+    monkeypatch.setattr(historical_cache, "_path", tmp_path.joinpath("history.db"))
+    monkeypatch.setattr(historical_cache, "_conn", None)
+    historical_cache.hits = 0
+    historical_cache.misses = 0
+    yield historical_cache
+    if historical_cache._conn is not None:
+        historical_cache._conn.close()
+
+
+@pytest.fixture
+def tuples(tester, accounts, web3):
+    heights = []
+    for name in ("potato", "carrot", "turnip"):
+        tester.setTuple([name, accounts[1], ["yesyesyes", "0x1234"]])
+        heights.append(web3.eth.blockNumber)
+    return heights
+
+
+def test_call_at_block(tester, accounts, tuples):
+    assert tester.getTuple.call(accounts[1], block=tuples[0])[0] == "potato"
+    assert tester.getTuple(accounts[1], block=tuples[1])[0] == "carrot"
+    assert tester.getTuple(accounts[1])[0] == "turnip"
+
+
+def test_call_range(tester, accounts, tuples):
+    result = tester.getTuple.call_range([accounts[1]], tuples[0], tuples[-1] + 1)
+    assert [i[0] for i in result] == ["potato", "carrot", "turnip"]
+
+
+def test_call_range_step(tester, accounts, tuples):
+    result = tester.getTuple.call_range(accounts[1], tuples[0], tuples[-1] + 1, 2)
+    assert [i[0] for i in result] == ["potato", "turnip"]
+
+
+def test_call_range_empty(tester):
+    assert tester.owner.call_range([], 10, 10) == []
+
+
+def test_not_stored_on_local_rpc(history_db, tester, accounts, tuples):
+    tester.getTuple.call(accounts[1], block=tuples[0])
+    tester.getTuple.call(accounts[1], block=tuples[0])
+    assert history_db.stats()["size"] == 0
+    assert history_db.stats()["hits"] == 0
+
+
+def test_final_blocks_stored(history_db, tester, accounts, tuples, rpc, config, monkeypatch):
+    monkeypatch.setattr(rpc, "is_active", lambda: False)
+    config["active_network"]["finality_depth"] = 1
+    result = tester.getTuple.call_range([accounts[1]], tuples[0], tuples[-1] + 1)
+    assert history_db.stats()["size"] == 2
+    assert history_db.stats()["misses"] == 3
+    assert tester.getTuple.call_range([accounts[1]], tuples[0], tuples[-1] + 1) == result
+    assert history_db.stats()["hits"] == 2
+    assert history_db.stats()["misses"] == 4
+    assert tester.getTuple(accounts[1], block=tuples[0]) == result[0]
+    assert history_db.stats()["hits"] == 3
+
+
+def test_clear(history_db, tester, accounts, tuples, rpc, config, monkeypatch):
+    monkeypatch.setattr(rpc, "is_active", lambda: False)
+    config["active_network"]["finality_depth"] = 0
+    tester.getTuple(accounts[1], block=tuples[0])
+    assert history_db.stats()["size"] == 1
+    history_db.clear()
+    assert history_db.stats()["size"] == 0
+
+
+def test_block_tags(history_db, tester, accounts, tuples, rpc, config, monkeypatch):
+    monkeypatch.setattr(rpc, "is_active", lambda: False)
+    config["active_network"]["finality_depth"] = 0
+    assert tester.getTuple(accounts[1], block="latest")[0] == "turnip"
+    assert tester.getTuple(accounts[1], block="pending")[0] == "turnip"
+    assert history_db.stats()["size"] == 0
+    assert tester.getTuple(accounts[1], block=hex(tuples[0]))[0] == "potato"
+    assert history_db.stats()["size"] == 1
+    assert tester.getTuple(accounts[1], block=tuples[0])[0] == "potato"
+    assert history_db.stats()["hits"] == 1
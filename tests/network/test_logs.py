@@ -0,0 +1,146 @@
+#!/usr/bin/python3
+
+import json
+
+import eth_event
+import pytest
+from eth_abi import encode_single
+
+from brownie.network import cache, event
+from brownie.network.logs import ContractEvent, log_cache
+
+
+@pytest.fixture
+def logs_db(tmp_path, monkeypatch):
+    monkeypatch.setattr(log_cache, "_path", tmp_path.joinpath("logs.db"))
+    monkeypatch.setattr(log_cache, "_conn", None)
+    log_cache.hits = 0
+    log_cache.misses = 0
+    yield log_cache
+    if log_cache._conn is not None:
+        log_cache._conn.close()
+
+
+@pytest.fixture
+def emitted(tester, web3):
+    tester.emitEvents("foo", 1)
+    start = web3.eth.blockNumber
+    tester.emitEvents("bar", 2)
+    tester.emitEvents("foo", 3)
+    return start, web3.eth.blockNumber
+
+
+def test_created_on_access(tester):
+    assert "events" not in tester.__dict__
+    assert "events" in dir(tester)
+    assert tester.events is tester.events
+    assert "IndexedEvent" in tester.events
+    assert tester.events.IndexedEvent is tester.events["IndexedEvent"]
+
+
+def test_get(tester, emitted):
+    events = tester.events.IndexedEvent.get(*emitted)
+    assert [i["num"] for i in events] == [1, 2, 3]
+    assert len(tester.events.Debug.get(emitted[0])) == 6
+
+
+def test_get_empty(tester, web3):
+    assert tester.events.IndexedEvent.get(web3.eth.blockNumber) == []
+
+
+def test_filters(tester, emitted):
+    assert tester.events.IndexedEvent.get(emitted[0], filters={"num": 2})["num"] == 2
+    assert len(tester.events.IndexedEvent.get(emitted[0], filters={"num": [1, 3]})) == 2
+    assert len(tester.events.IndexedEvent.get(emitted[0], filters={"str": "foo"})) == 2
+
+
+def test_invalid_filter(tester):
+    with pytest.raises(ValueError):
+        tester.events.IndexedEvent.get(0, filters={"foo": 1})
+    with pytest.raises(ValueError):
+        tester.events.Debug.get(0, filters={"a": 1})
+
+
+def test_not_stored_on_local_rpc(logs_db, tester, emitted):
+    tester.events.IndexedEvent.get(*emitted)
+    assert logs_db.stats()["size"] == 0
+
+
+def test_final_blocks_stored(logs_db, tester, emitted, rpc, config, monkeypatch):
+    monkeypatch.setattr(rpc, "is_active", lambda: False)
+    config["active_network"]["finality_depth"] = 0
+    events = tester.events.IndexedEvent.get(*emitted)
+    assert logs_db.stats()["size"] == 3
+    assert logs_db.stats()["misses"] == emitted[1] - emitted[0] + 1
+    assert tester.events.IndexedEvent.get(*emitted) == events
+    assert logs_db.stats()["hits"] == emitted[1] - emitted[0] + 1
+    logs_db.clear()
+    assert logs_db.stats()["size"] == 0
+
+
+def test_missing_ranges(logs_db, tester, emitted, rpc, config, monkeypatch):
+    monkeypatch.setattr(rpc, "is_active", lambda: False)
+    config["active_network"]["finality_depth"] = 0
+    tester.events.IndexedEvent.get(emitted[1], emitted[1])
+    key = json.dumps(
+        {"address": tester.address, "topics": [tester.topics["IndexedEvent"]]}, sort_keys=True
+    )
+    missing = logs_db._get_missing(key, emitted[0], emitted[1] + 5)
+    assert missing == [(emitted[0], emitted[1] - 1), (emitted[1] + 1, emitted[1] + 5)]
+
+
+def test_chunk_size(config, monkeypatch):
+    requests = []
+
+    def get_logs(params, start, stop):
+        requests.append((start, stop))
+        if stop - start > 5:
+            raise ValueError({"code": -32005, "message": "query returned more than 10000 results"})
+        return [{"blockNumber": start}]
+
+    monkeypatch.setattr(cache, "_get_logs", get_logs)
+    config["active_network"]["log_chunk_size"] = 10
+    config["active_network"]["log_concurrency"] = 1
+    chunks = list(cache._fetch_logs({}, 0, 19))
+    assert requests[0] == (0, 9)
+    assert sorted(i[:2] for i in chunks) == [(0, 4), (5, 9), (10, 14), (15, 19)]
+
+
+def test_chunk_error(config, monkeypatch):
+    def get_logs(params, start, stop):
+        raise ValueError({"code": -32000, "message": "invalid request"})
+
+    monkeypatch.setattr(cache, "_get_logs", get_logs)
+    with pytest.raises(ValueError):
+        list(cache._fetch_logs({}, 0, 19))
+
+
+def test_decoded_with_own_abi(tmp_path, monkeypatch):
+    # ERC721 Transfer shares a topic with ERC20 Transfer, but tokenId is indexed
+    abi = {
+        "name": "Transfer",
+        "type": "event",
+        "anonymous": False,
+        "inputs": [
+            {"name": "from", "type": "address", "indexed": True},
+            {"name": "to", "type": "address", "indexed": True},
+            {"name": "tokenId", "type": "uint256", "indexed": True},
+        ],
+    }
+    topic = eth_event.get_log_topic(abi)
+    log = {
+        "topics": [
+            topic,
+            "0x" + "00" * 32,
+            "0x" + "00" * 12 + "11" * 20,
+            encode_single("uint256", 7),
+        ],
+        "data": "0x",
+        "blockNumber": 1,
+        "logIndex": 0,
+    }
+    monkeypatch.setattr(event, "_topics", event.TopicRegistry(tmp_path.joinpath("topics.db")))
+    monkeypatch.setattr(log_cache, "get_logs", lambda *args: [log])
+    events = ContractEvent("0x" + "22" * 20, abi, topic).get(0, 1)
+    assert events["tokenId"] == 7
+    assert events["to"] == "0x" + "11" * 20
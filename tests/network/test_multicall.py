@@ -0,0 +1,115 @@
+#!/usr/bin/python3
+
+import pytest
+
+from brownie import compile_source, multicall
+from brownie.exceptions import ContractNotFound, VirtualMachineError
+from brownie.network.multicall import deploy_aggregator
+
+
+@pytest.fixture
+def aggregator(accounts):
+    return deploy_aggregator(accounts[0])
+
+
+def test_multicall(tester, accounts, aggregator):
+    value = ["blahblah", accounts[1], ["yesyesyes", "0x1234"]]
+    tester.setTuple(value)
+    with multicall() as mc:
+        mc.add(tester.owner)
+        mc.add(tester.getTuple, accounts[1])
+    assert mc.results == [tester.owner(), tester.getTuple(accounts[1])]
+
+
+def test_call_many(tester, accounts, aggregator):
+    result = tester.getTuple.call_many(accounts[:4])
+    assert result == [tester.getTuple(i) for i in accounts[:4]]
+
+
+def test_call_many_array_input(accounts, aggregator):
+    source = """pragma solidity ^0.5.0;
+contract Summer {
+    function sum(uint[] calldata values) external pure returns (uint total) {
+        for (uint i = 0; i < values.length; i++) total += values[i];
+    }
+}"""
+    summer = compile_source(source).Summer.deploy({"from": accounts[0]})
+    assert summer.sum.call_many([[1, 2, 3], [4], []]) == [6, 4, 0]
+
+
+def test_chunking(tester, accounts, web3, aggregator, monkeypatch):
+    calls = []
+    call = web3.eth.call
+    monkeypatch.setattr(web3.eth, "call", lambda tx: calls.append(tx) or call(tx))
+    tester.getTuple.call_many([[i] for i in accounts], chunk_size=3)
+    assert len(calls) == 4
+
+
+def test_not_deployed_automatically(tester, accounts, history):
+    nonce = accounts[0].nonce
+    length = len(history)
+    with pytest.raises(ContractNotFound):
+        tester.owner.call_many([()])
+    assert accounts[0].nonce == nonce
+    assert len(history) == length
+
+
+def test_call_many_sends_no_tx(tester, accounts, aggregator, history):
+    nonce = accounts[0].nonce
+    length = len(history)
+    tester.owner.call_many([(), ()])
+    assert accounts[0].nonce == nonce
+    assert len(history) == length
+
+
+def test_aggregator_removed_after_revert(tester, accounts, rpc):
+    rpc.snapshot()
+    deploy_aggregator(accounts[0])
+    assert tester.owner.call_many([()]) == [tester.owner()]
+    rpc.revert()
+    with pytest.raises(ContractNotFound):
+        tester.owner.call_many([()])
+
+
+def test_require_success(tester, aggregator):
+    with pytest.raises(VirtualMachineError):
+        tester.revertStrings.call_many([0, 5])
+
+
+def test_allow_failure(tester, aggregator):
+    result = tester.revertStrings.call_many([0, 5], require_success=False)
+    assert result == [None, True]
+
+
+def test_empty(devnetwork, history):
+    assert multicall().execute() == []
+    assert len(history) == 0
+
+
+def test_invalid_chunk_size():
+    with pytest.raises(ValueError):
+        multicall(chunk_size=0)
+
+
+def test_deploy_needs_rpc(accounts, rpc, monkeypatch):
+    monkeypatch.setattr(rpc, "is_active", lambda: False)
+    with pytest.raises(SystemError):
+        deploy_aggregator(accounts[0])
+
+
+def test_configured_address(tester, accounts, config, web3, monkeypatch):
+    address = deploy_aggregator(accounts[0]).address
+    deploy_aggregator(accounts[0])
+    config["active_network"]["multicall_address"] = address
+    calls = []
+    call = web3.eth.call
+    monkeypatch.setattr(web3.eth, "call", lambda tx: calls.append(tx) or call(tx))
+    assert tester.getTuple.call_many([tester]) == [tester.getTuple(tester)]
+    assert calls[0]["to"] == address
+
+
+def test_tx_dict(tester, accounts, aggregator):
+    mc = multicall()
+    with pytest.raises(ValueError):
+        mc.add(tester.getTuple, accounts[1], {"from": accounts[1]})
+    assert not len(mc)
@@ -0,0 +1,25 @@
+#!/usr/bin/python3
+
+
+def test_layout(tester):
+    layout = dict((i["label"], i) for i in tester.storage.layout)
+    assert (layout["owner"]["slot"], layout["owner"]["type"]) == (0, "address payable")
+    assert (layout["num"]["slot"], layout["num"]["type"]) == (1, "uint256")
+    assert layout["testMap"]["encoding"] == "mapping"
+
+
+def test_read_all(tester, accounts):
+    assert tester.storage.read_all() == {"owner": accounts[0], "num": 0}
+
+
+def test_read_private(tester, accounts):
+    tester.setNum(31337, {"from": accounts[0]})
+    assert tester.storage.read_all()["num"] == 31337
+
+
+def test_read_at_block(tester, accounts, web3):
+    tester.setNum(1, {"from": accounts[0]})
+    height = web3.eth.blockNumber
+    tester.setNum(2, {"from": accounts[0]})
+    assert tester.storage.read_all(height)["num"] == 1
+    assert tester.storage.read_all()["num"] == 2
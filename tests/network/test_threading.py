@@ -0,0 +1,27 @@
+#!/usr/bin/python3
+
+from concurrent.futures import ThreadPoolExecutor
+
+
+def test_concurrent_transfers(accounts, history):
+    senders = accounts[:4]
+    with ThreadPoolExecutor(8) as executor:
+        futures = [executor.submit(senders[i % 4].transfer, accounts[9], 1000) for i in range(40)]
+        txs = [i.result() for i in futures]
+    assert len(history) == 40
+    assert len(set(i.txid for i in txs)) == 40
+    for account in senders:
+        nonces = sorted(i.nonce for i in history.from_sender(account))
+        assert nonces == list(range(10))
+        assert account.nonce == 10
+
+
+def test_concurrent_deploys(BrownieTester, accounts, history):
+    with ThreadPoolExecutor(4) as executor:
+        futures = [
+            executor.submit(BrownieTester.deploy, True, {"from": accounts[i % 2]}) for i in range(8)
+        ]
+        contracts = [i.result() for i in futures]
+    assert len(BrownieTester) == 8
+    assert len(set(i.address for i in contracts)) == 8
+    assert len(history) == 8
@@ -0,0 +1,100 @@
+#!/usr/bin/python3
+
+import json
+
+import eth_event
+import pytest
+from eth_abi import encode_abi, encode_single
+
+from brownie.network.event import TopicRegistry
+
+ABI = [
+    {
+        "type": "event",
+        "name": "Foo",
+        "anonymous": False,
+        "inputs": [
+            {"name": "a", "type": "uint256", "indexed": True},
+            {"name": "b", "type": "string", "indexed": True},
+            {"name": "c", "type": "uint8[]", "indexed": False},
+            {
+                "name": "d",
+                "type": "tuple",
+                "indexed": False,
+                "components": [{"name": "x", "type": "bool"}, {"name": "y", "type": "bytes"}],
+            },
+        ],
+    }
+]
+EVENT_ABI = eth_event.get_event_abi(ABI)
+TOPIC = next(iter(EVENT_ABI))
+
+
+@pytest.fixture
+def registry(tmp_path):
+    registry = TopicRegistry(tmp_path.joinpath("topics.db"))
+    yield registry
+    if registry._conn is not None:
+        registry._conn.close()
+
+
+def _log(data=None):
+    if data is None:
+        data = encode_abi(["uint8[]", "(bool,bytes)"], [[1, 2, 3], (True, b"\xab")])
+    return {
+        "topics": [TOPIC, encode_single("uint256", 42), b"\x11" * 32],
+        "data": "0x" + data.hex(),
+    }
+
+
+def test_update(registry):
+    assert TOPIC not in registry
+    registry.update(EVENT_ABI)
+    assert TOPIC in registry
+    assert registry[TOPIC] == EVENT_ABI[TOPIC]
+    with pytest.raises(KeyError):
+        registry["0x1234"]
+
+
+def test_shared_between_instances(registry, tmp_path):
+    registry.update(EVENT_ABI)
+    other = TopicRegistry(tmp_path.joinpath("topics.db"))
+    assert other[TOPIC] == EVENT_ABI[TOPIC]
+    other._conn.close()
+
+
+def test_import_json(tmp_path):
+    with tmp_path.joinpath("topics.json").open("w") as fp:
+        json.dump(EVENT_ABI, fp)
+    registry = TopicRegistry(tmp_path.joinpath("topics.db"))
+    assert registry[TOPIC] == EVENT_ABI[TOPIC]
+    registry._conn.close()
+
+
+def test_import_json_once(tmp_path):
+    TopicRegistry(tmp_path.joinpath("topics.db"))._connect().close()
+    with tmp_path.joinpath("topics.json").open("w") as fp:
+        json.dump(EVENT_ABI, fp)
+    registry = TopicRegistry(tmp_path.joinpath("topics.db"))
+    assert TOPIC not in registry
+    registry._conn.close()
+
+
+def test_decoder(registry):
+    registry.update(EVENT_ABI)
+    log = _log()
+    assert registry.get_decoder(TOPIC)(log) == eth_event.decode_logs([log], EVENT_ABI)[0]
+
+
+def test_decoder_cached(registry):
+    registry.update(EVENT_ABI)
+    decoder = registry.get_decoder(TOPIC)
+    assert registry.get_decoder(TOPIC) is decoder
+    registry.update(EVENT_ABI)
+    assert registry.get_decoder(TOPIC) is decoder
+
+
+def test_insufficient_data(registry):
+    registry.update(EVENT_ABI)
+    with pytest.raises(eth_event.EventError):
+        registry.get_decoder(TOPIC)(_log(b"\x00" * 40))
@@ -120,6 +120,21 @@ def test_format_link_references(solc4json, solc5json):
     assert "__Bar__" in compiler._format_link_references(evm)
 
 
+def test_link_references(solc5json):
+    evm = solc5json["contracts"]["path"]["Foo"]["evm"]
+    references = compiler._get_link_references(evm)
+    assert list(references) == ["Bar"]
+    bytecode = compiler._format_link_references(evm)
+    for offset in references["Bar"]:
+        assert bytecode[offset : offset + 40] == f"__{'Bar':_<36}__"
+    address = "0x" + "ab" * 20
+    linked = compiler.link_bytecode(bytecode, references, {"Bar": address})
+    assert "__Bar__" not in linked
+    assert len(linked) == len(bytecode)
+    for offset in references["Bar"]:
+        assert linked[offset : offset + 40] == address[2:]
+
+
 def test_compiler_errors(solc4source, solc5source):
     with pytest.raises(CompilerError):
         compiler.compile_and_format({"path": solc4source}, solc_version="0.5.7")
@@ -174,3 +189,70 @@ def test_first_revert(BrownieTester, ExternalCallTester):
     assert next((i for i in pc_map.values() if "first_revert" in i), False)
     pc_map = BrownieTester._build["pcMap"]
     assert not next((i for i in pc_map.values() if "first_revert" in i), False)
+
+
+def test_storage_layout():
+    source = """pragma solidity ^0.5.0;
+contract Base { uint8 a; bool b; address owner; uint256 c; }
+contract Foo is Base {
+    enum Choice { Yes, No }
+    struct Pair { uint128 x; uint128 y; uint256 z; }
+    uint16 d; Pair pair; mapping(address => uint) map; uint64[3] arr; bytes4 sel; string str;
+    Choice choice; uint constant e = 1;
+}"""
+    build_json = compiler.compile_and_format({"path": source}, solc_version="0.5.7")
+    layout = dict((i["label"], i) for i in build_json["Foo"]["storageLayout"])
+    expected = [
+        ("a", 0, 0, 1),
+        ("b", 0, 1, 1),
+        ("owner", 0, 2, 20),
+        ("c", 1, 0, 32),
+        ("d", 2, 0, 2),
+        ("pair", 3, 0, 64),
+        ("map", 5, 0, 32),
+        ("arr", 6, 0, 32),
+        ("sel", 7, 0, 4),
+        ("str", 8, 0, 32),
+        ("choice", 9, 0, 1),
+    ]
+    assert list(layout) == [i[0] for i in expected]
+    for label, slot, offset, size in expected:
+        assert (layout[label]["slot"], layout[label]["offset"]) == (slot, offset)
+        assert layout[label]["numberOfBytes"] == size
+    assert layout["a"]["contract"] == "Base"
+    assert layout["pair"]["type"] == "struct Foo.Pair"
+    assert layout["map"]["encoding"] == "mapping"
+    assert layout["str"]["encoding"] == "bytes"
+    assert layout["choice"]["type"] == "enum Foo.Choice"
+
+
+def test_storage_layout_leading_struct():
+    source = """pragma solidity ^0.5.0;
+contract Foo {
+    struct Pair { uint128 x; uint128 y; uint256 z; }
+    Pair first; Pair second; uint256[2] arr; Pair third; uint8 small; uint256 last;
+}"""
+    build_json = compiler.compile_and_format({"path": source}, solc_version="0.5.7")
+    layout = [(i["label"], i["slot"], i["offset"]) for i in build_json["Foo"]["storageLayout"]]
+    assert layout == [
+        ("first", 0, 0),
+        ("second", 2, 0),
+        ("arr", 4, 0),
+        ("third", 6, 0),
+        ("small", 8, 0),
+        ("last", 9, 0),
+    ]
+
+
+def test_storage_positions_leading_array():
+    def elementary(type_str):
+        return {"nodeType": "ElementaryTypeName", "typeDescriptions": {"typeString": type_str}}
+
+    array = {
+        "nodeType": "ArrayTypeName",
+        "typeDescriptions": {"typeString": "uint256[2] storage ref"},
+        "baseType": elementary("uint256"),
+        "length": {},
+    }
+    variables = [{"typeName": array}, {"typeName": elementary("uint256")}]
+    assert compiler._get_storage_positions(variables, {}) == ([(0, 0, 64), (2, 0, 32)], 3)
@@ -0,0 +1,149 @@
+#!/usr/bin/python3
+
+import json
+import os
+import threading
+
+import pytest
+
+from brownie.project.main import _lock_file
+
+
+@pytest.fixture
+def persistent(rpc, monkeypatch):
+    # treat the local RPC as a persistent network
+    monkeypatch.setattr(rpc, "is_active", lambda: False)
+
+
+def _read_manifest(project):
+    path = project._get_deployment_path()
+    with path.open() as fp:
+        return json.load(fp)
+
+
+def test_not_recorded_on_local_rpc(testproject, BrownieTester, accounts):
+    BrownieTester.deploy(True, {"from": accounts[0]})
+    assert testproject._get_deployment_path() is None
+    assert not list(testproject._project_path.glob("build/deployments/*.json"))
+
+
+def test_manifest(testproject, BrownieTester, accounts, web3, persistent):
+    tester = BrownieTester.deploy(True, {"from": accounts[0]})
+    path = testproject._get_deployment_path()
+    assert path.parent == testproject._project_path.joinpath("build/deployments")
+    manifest = _read_manifest(testproject)
+    assert manifest["genesisHash"] == web3.genesis_hash
+    assert manifest["contracts"]["BrownieTester"] == [
+        {
+            "address": tester.address,
+            "blockNumber": tester.tx.block_number,
+            "bytecodeSha1": BrownieTester._build["bytecodeSha1"],
+            "txid": tester.tx.txid,
+        }
+    ]
+
+
+def test_load_deployments(testproject, BrownieTester, accounts, persistent):
+    tester = BrownieTester.deploy(True, {"from": accounts[0]})
+    BrownieTester.remove(tester)
+    testproject._load_deployments()
+    assert BrownieTester[-1] == tester
+
+
+def test_load_skips_getcode(testproject, BrownieTester, accounts, web3, persistent, monkeypatch):
+    tester = BrownieTester.deploy(True, {"from": accounts[0]})
+    BrownieTester.remove(tester)
+    monkeypatch.setattr(web3.eth, "getCode", None)
+    testproject._load_deployments()
+    assert BrownieTester[-1].bytecode == tester.bytecode
+    assert BrownieTester[-1]._height == tester.tx.block_number
+
+
+def test_manifest_replaced(testproject, BrownieTester, accounts, persistent):
+    BrownieTester.deploy(True, {"from": accounts[0]})
+    BrownieTester.deploy(True, {"from": accounts[0]})
+    assert len(_read_manifest(testproject)["contracts"]["BrownieTester"]) == 2
+    assert not list(testproject._project_path.glob("build/deployments/*.tmp"))
+
+
+def test_load_skips_changed_bytecode(testproject, BrownieTester, accounts, persistent):
+    tester = BrownieTester.deploy(True, {"from": accounts[0]})
+    BrownieTester.remove(tester)
+    path = testproject._get_deployment_path()
+    manifest = _read_manifest(testproject)
+    manifest["contracts"]["BrownieTester"][0]["bytecodeSha1"] = "potato"
+    with path.open("w") as fp:
+        json.dump(manifest, fp)
+    testproject._load_deployments()
+    assert not len(BrownieTester)
+
+
+def test_deploy_if_changed(BrownieTester, accounts, history):
+    tester = BrownieTester.deploy_if_changed(True, {"from": accounts[0]})
+    length = len(history)
+    assert BrownieTester.deploy_if_changed(True, {"from": accounts[0]}) == tester
+    assert len(history) == length
+
+
+def test_deploy_if_changed_ignores_at(BrownieTester, accounts, history):
+    tester = BrownieTester.deploy(True, {"from": accounts[0]})
+    BrownieTester.remove(tester)
+    BrownieTester.at(tester.address)
+    assert BrownieTester.deploy_if_changed(True, {"from": accounts[0]}) != tester
+
+
+def test_deploy_if_changed_checks_manifest_code(
+    testproject, BrownieTester, accounts, web3, persistent, monkeypatch
+):
+    tester = BrownieTester.deploy(True, {"from": accounts[0]})
+    BrownieTester.remove(tester)
+    testproject._load_deployments()
+    # the contract has self-destructed since the manifest was written
+    get_code = web3.eth.getCode
+    monkeypatch.setattr(web3.eth, "getCode", lambda k: b"" if k == tester.address else get_code(k))
+    new = BrownieTester.deploy_if_changed(True, {"from": accounts[0]})
+    assert new.address != tester.address
+    assert tester.address not in BrownieTester
+    monkeypatch.setattr(web3.eth, "getCode", None)
+    assert BrownieTester.deploy_if_changed(True, {"from": accounts[0]}) == new
+
+
+def test_switch_networks(
+    network, testproject, BrownieTester, accounts, web3, persistent, monkeypatch
+):
+    BrownieTester.deploy(True, {"from": accounts[0]})
+    monkeypatch.setattr(web3, "disconnect", lambda: None)
+    network.disconnect()
+    assert not len(BrownieTester)
+    assert not BrownieTester._deployed
+    # a second persistent network, with a different genesis block
+    monkeypatch.setattr(web3, "_genesis_hash", "ab" * 32)
+    testproject._load_deployments()
+    assert not len(BrownieTester)
+
+
+def test_lock_file(tmp_path):
+    path = tmp_path.joinpath("manifest.json")
+    acquired = []
+
+    def acquire():
+        with _lock_file(path):
+            acquired.append(True)
+
+    with _lock_file(path):
+        thread = threading.Thread(target=acquire)
+        thread.start()
+        thread.join(0.3)
+        assert not acquired
+    thread.join()
+    assert acquired
+
+
+def test_lock_file_stale(tmp_path):
+    path = tmp_path.joinpath("manifest.json")
+    lock_path = tmp_path.joinpath("manifest.json.lock")
+    lock_path.touch()
+    os.utime(str(lock_path), (0, 0))
+    with _lock_file(path):
+        assert lock_path.exists()
+    assert not lock_path.exists()